@@ -0,0 +1,115 @@
+# 전체 벤치마크: 파이프라인 단계별 시간 + /predict 처리량 / 지연 분위수 (동시성별)
+# 서버를 띄우지 않고 ASGI 앱을 프로세스 안에서 직접 호출 (네트워크 비용 제외)
+#
+# 실행: python -m app.benchmark [--concurrency 1,4,8] [--requests 64] [--skip-pipeline]
+# 결과: models/benchmark.json (회귀 확인: --compare models/benchmark_이전.json, 악화 시 종료 코드 1)
+
+import asyncio
+import os
+import time
+import httpx
+from fastapi import FastAPI
+from training.benchmark import (
+    REGRESSION_TOLERANCE, benchmark_pipeline, environment_info, parse_ints, parse_resolutions,
+    summarize, synthetic_jpeg, write_report
+)
+from .model_loader import loader
+from .routers import predict
+
+# /predict만 포함한 벤치마크용 앱 (DB 초기화 없이 실행)
+def create_app():
+    app = FastAPI()
+    app.include_router(predict.router)
+    return app
+
+# 동시성 수준별로 /predict 호출 (요청마다 다른 세션 -> 결과 캐시/추적 재사용 없음)
+async def benchmark_api(app, payloads, concurrency_levels, total_requests, mode=None):
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=120) as client:
+
+        async def call(idx, latencies, errors):
+            data = {"session_id": f"benchmark-{idx}"}
+            if mode:
+                data["mode"] = mode
+            payload = payloads[idx % len(payloads)]
+            started = time.perf_counter()
+            response = await client.post("/predict", files={"file": ("frame.jpg", payload, "image/jpeg")}, data=data)
+            elapsed = time.perf_counter() - started
+            if response.status_code == 200:
+                latencies.append(elapsed)
+            else:
+                errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+        for concurrency in concurrency_levels:
+            # 워밍업
+            await asyncio.gather(*(call(idx, [], {}) for idx in range(concurrency)))
+
+            latencies, errors = [], {}
+            queue = asyncio.Queue()
+            for idx in range(total_requests):
+                queue.put_nowait(idx)
+
+            async def worker():
+                while not queue.empty():
+                    await call(queue.get_nowait(), latencies, errors)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+            row = {
+                "name": f"{mode or 'upload'}/concurrency={concurrency}",
+                "mode": mode or "upload",
+                "concurrency": concurrency,
+                "requests": total_requests,
+                "requests_per_sec": round(len(latencies) / elapsed, 2),
+                "errors": errors,
+                "latency": summarize(latencies)
+            }
+            results.append(row)
+            print(f"/predict {row['name']}: {row['requests_per_sec']} req/s, p50 {row['latency'].get('p50_ms')}ms, p95 {row['latency'].get('p95_ms')}ms, 오류 {errors}")
+    return results
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from training.engine import models_dir
+
+    parser = argparse.ArgumentParser(description="파이프라인 + /predict API 벤치마크")
+    parser.add_argument("--resolutions", default="640x480,1280x720,1920x1080")
+    parser.add_argument("--objects", default="1,5,15", help="이미지당 합성 객체 수")
+    parser.add_argument("--repeat", type=int, default=20, help="파이프라인 단계별 반복 횟수")
+    parser.add_argument("--concurrency", default="1,4,8,16", help="/predict 동시 요청 수")
+    parser.add_argument("--requests", type=int, default=64, help="동시성 수준별 요청 수")
+    parser.add_argument("--api-resolution", default="1280x720", help="/predict 업로드 이미지 해상도")
+    parser.add_argument("--skip-pipeline", action="store_true")
+    parser.add_argument("--skip-api", action="store_true")
+    parser.add_argument("--output", default=os.path.join(models_dir, "benchmark.json"))
+    parser.add_argument("--compare", help="비교할 이전 리포트 (회귀 시 종료 코드 1)")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    args = parser.parse_args()
+
+    # 모델 로드 + 워밍업 (서버 시작과 같은 경로)
+    loader.load()
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment_info(),
+        "startup": loader.timings
+    }
+
+    if not args.skip_pipeline:
+        report["pipeline"] = benchmark_pipeline(
+            loader.pipeline, parse_resolutions(args.resolutions), parse_ints(args.objects), args.repeat
+        )
+
+    if not args.skip_api:
+        (width, height), = parse_resolutions(args.api_resolution)
+        object_counts = parse_ints(args.objects)
+        payloads = [synthetic_jpeg(width, height, object_counts[idx % len(object_counts)], seed=idx) for idx in range(8)]
+        app = create_app()
+        report["api"] = []
+        for mode in (None, "realtime"):
+            report["api"] += asyncio.run(benchmark_api(app, payloads, parse_ints(args.concurrency), args.requests, mode))
+
+    sys.exit(0 if write_report(report, args.output, args.compare, args.tolerance) else 1)
@@ -1,161 +1,339 @@
 # Turso 데이터베이스 연결 및 초기화 (HTTP API 사용)
 
 import os
+import time
+import asyncio
+import logging
+import threading
+import httpx
 import requests
-from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from contextlib import asynccontextmanager, contextmanager
 from dotenv import load_dotenv
+from .metrics import TURSO_ERRORS, TURSO_SECONDS, sql_operation
+from .records import ingest_key_prune_statement
+from .rollups import backfill_if_empty as backfill_rollups_if_empty
 
 # 환경 변수 로드
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Turso 데이터베이스 설정
 TURSO_DATABASE_URL = os.getenv("TURSO_DATABASE_URL")
 TURSO_AUTH_TOKEN = os.getenv("TURSO_AUTH_TOKEN")
 
+# HTTP 연결 풀 설정 (프로세스 전체에서 keep-alive 연결 재사용)
+TURSO_POOL_SIZE = int(os.getenv("TURSO_POOL_SIZE", "10"))  # 유지할 최대 연결 수
+TURSO_CONNECT_TIMEOUT = float(os.getenv("TURSO_CONNECT_TIMEOUT", "3"))  # 연결 타임아웃 (초)
+TURSO_READ_TIMEOUT = float(os.getenv("TURSO_READ_TIMEOUT", "10"))  # 응답 타임아웃 (초)
+TURSO_CONNECT_RETRIES = int(os.getenv("TURSO_CONNECT_RETRIES", "1"))  # 연결 실패 시 재시도 (요청 전송 전 실패만)
+TURSO_KEEPALIVE = os.getenv("TURSO_KEEPALIVE", "1") == "1"  # 0이면 요청마다 연결 종료
+TURSO_KEEPALIVE_EXPIRY = float(os.getenv("TURSO_KEEPALIVE_EXPIRY", "30"))  # 유휴 연결 유지 시간 (초, 비동기 클라이언트)
+TURSO_HTTP2 = os.getenv("TURSO_HTTP2", "1") == "1"  # 비동기 클라이언트 HTTP/2 사용 (h2 패키지 필요)
+
+# 프로세스 전역 HTTP 세션 (최초 사용 시 생성)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+# keep-alive 연결 풀을 가진 requests.Session (모든 TursoClient가 공유)
+def get_http_session():
+    """Session은 연결 풀이 스레드 안전하므로 프로세스에서 하나만 사용"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                # 연결 단계 실패만 재시도 (이미 전송된 INSERT는 다시 보내지 않음)
+                retry = Retry(total=TURSO_CONNECT_RETRIES, connect=TURSO_CONNECT_RETRIES, read=0, status=0, redirect=0)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=TURSO_POOL_SIZE, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                if not TURSO_KEEPALIVE:
+                    session.headers["Connection"] = "close"
+                _http_session = session
+    return _http_session
+
+# 연결 풀 종료 (서버 종료 시)
+def close_http_session():
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+# 프로세스 전역 비동기 HTTP 클라이언트 (이벤트 루프별로 하나)
+_async_http_client = None
+_async_http_loop = None
+
+# h2 패키지가 있으면 HTTP/2 (연결 하나로 여러 요청 동시 전송)
+def http2_available():
+    if not TURSO_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+# keep-alive 연결 풀을 가진 httpx.AsyncClient (모든 AsyncTursoClient가 공유)
+def get_async_http_client():
+    """현재 이벤트 루프에서 처음 사용할 때 생성 (다른 루프에서 호출되면 새로 생성)"""
+    global _async_http_client, _async_http_loop
+    loop = asyncio.get_running_loop()
+    if _async_http_client is None or _async_http_loop is not loop or _async_http_client.is_closed:
+        http2 = http2_available()
+        limits = httpx.Limits(
+            max_connections=TURSO_POOL_SIZE,
+            max_keepalive_connections=TURSO_POOL_SIZE if TURSO_KEEPALIVE else 0,
+            keepalive_expiry=TURSO_KEEPALIVE_EXPIRY
+        )
+        # transport 재시도는 연결 단계 실패만 (이미 전송된 INSERT는 다시 보내지 않음)
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=TURSO_CONNECT_RETRIES)
+        _async_http_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(TURSO_READ_TIMEOUT, connect=TURSO_CONNECT_TIMEOUT)
+        )
+        _async_http_loop = loop
+        logger.info("Turso 비동기 연결 풀 생성 (HTTP/2: %s, 최대 연결: %d)", http2, TURSO_POOL_SIZE)
+    return _async_http_client
+
+# 비동기 연결 풀 종료 (서버 종료 시)
+async def close_async_http_client():
+    global _async_http_client, _async_http_loop
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+        _async_http_loop = None
+
+# Turso에 연결할 수 없거나 일시적인 서버 오류 (재시도하면 성공할 수 있는 오류)
+class TursoConnectionError(Exception):
+    pass
+
 # libsql:// URL을 HTTPS URL로 변환
 def get_https_url(libsql_url):
     """libsql://host -> https://host"""
     return libsql_url.replace("libsql://", "https://")
 
+# 파라미터 -> Turso args 형식: [{"type": "...", "value": "..."}]
+def to_turso_args(params):
+    """정수는 문자열, 실수는 숫자로 전달 (타입만 지정)"""
+    turso_args = []
+    for param in params:
+        if param is None:
+            turso_args.append({"type": "null"})
+        elif isinstance(param, bool):
+            # bool은 int의 서브클래스이므로 먼저 체크
+            turso_args.append({"type": "integer", "value": str(int(param))})
+        elif isinstance(param, int):
+            turso_args.append({"type": "integer", "value": str(param)})
+        elif isinstance(param, float):
+            # float는 숫자 타입으로 전달
+            turso_args.append({"type": "float", "value": param})
+        else:
+            turso_args.append({"type": "text", "value": str(param)})
+    return turso_args
+
+# SQL + 파라미터 -> Turso stmt 형식
+def to_turso_stmt(sql, params=None):
+    stmt = {"sql": sql}
+    if params:
+        stmt["args"] = to_turso_args(params)
+    return stmt
+
+# Turso 행 -> 튜플
+def to_row(row):
+    # Turso는 행을 dict 배열로 반환: [{"type": "text", "value": "foo"}]
+    if isinstance(row, list) and len(row) > 0 and isinstance(row[0], dict):
+        return tuple(col.get("value") for col in row)
+    elif isinstance(row, list):
+        return tuple(row)
+    else:
+        return tuple(row.values())
+
+# Turso batch 단계 생성 (transaction=True: BEGIN ~ COMMIT, 하나라도 실패하면 ROLLBACK)
+def build_batch_steps(statements, transaction=True):
+    """statements: [(sql, params), ...] -> (steps, 첫 문장의 단계 번호)"""
+    # batch 단계: 각 문장은 이전 단계가 성공했을 때만 실행
+    steps = [{"stmt": to_turso_stmt("BEGIN")}] if transaction else []
+    offset = len(steps)
+    for sql, params in statements:
+        step = {"stmt": to_turso_stmt(sql, params)}
+        if steps:
+            step["condition"] = {"type": "ok", "step": len(steps) - 1}
+        steps.append(step)
+    if transaction:
+        commit_step = len(steps)
+        steps.append({"stmt": to_turso_stmt("COMMIT"), "condition": {"type": "ok", "step": commit_step - 1}})
+        steps.append({"stmt": to_turso_stmt("ROLLBACK"), "condition": {"type": "not", "cond": {"type": "ok", "step": commit_step}}})
+    return steps, offset
+
+# Turso 응답 JSON 확인 (요청 단위 오류는 HTTP 200 안에 담겨 옴) -> 요청별 response 리스트
+def pipeline_responses(result, operation):
+    for item in result.get("results", []):
+        if item.get("type") == "error":
+            TURSO_ERRORS.labels(operation).inc()
+            raise Exception(f"Turso SQL 오류: {item.get('error', {}).get('message')}")
+    return [item.get("response", {}) for item in result.get("results", [])]
+
+# batch 응답 -> 문장별 TursoResult 리스트 (실패한 단계가 있으면 오류)
+def batch_results(response, offset, count, transaction=True):
+    batch_result = response.get("result", {})
+    step_results = batch_result.get("step_results", [])
+    step_errors = batch_result.get("step_errors", [])
+
+    # 실패한 단계가 있으면 (ROLLBACK 이후) 오류
+    for idx, error in enumerate(step_errors[:offset + count + (1 if transaction else 0)]):
+        if error:
+            TURSO_ERRORS.labels("BATCH").inc()
+            raise Exception(f"Turso batch 오류 (단계 {idx}): {error.get('message')}")
+
+    return [TursoResult(step_results[offset + idx]) for idx in range(count)]
+
+# 여러 조회 문장 -> pipeline 요청 리스트 (문장마다 execute 요청, 트랜잭션 없음)
+def read_requests(statements):
+    return [{"type": "execute", "stmt": to_turso_stmt(sql, params)} for sql, params in statements]
+
+# 조회 문장 목록 -> 지표 라벨 (모두 같은 종류면 그 종류, 아니면 PIPELINE)
+def statements_operation(statements):
+    operations = {sql_operation(sql) for sql, _ in statements}
+    return operations.pop() if len(operations) == 1 else "PIPELINE"
+
+# 문장 하나의 실행 결과 (행 / 마지막 삽입 ID)
+class TursoResult:
+    """Turso 응답의 result 객체: {"cols": [...], "rows": [...], "last_insert_rowid": ...}"""
+
+    def __init__(self, result=None):
+        self.result = result or {}
+
+    def fetchone(self):
+        """첫 번째 행 가져오기"""
+        rows = self.result.get("rows", [])
+        return to_row(rows[0]) if rows else None
+
+    def fetchall(self):
+        """모든 행 가져오기"""
+        return [to_row(row) for row in self.result.get("rows", [])]
+
+    @property
+    def lastrowid(self):
+        """마지막 삽입된 행의 ID"""
+        return self.result.get("last_insert_rowid")
+
+    @property
+    def rowcount(self):
+        """변경된 행 수"""
+        return self.result.get("affected_row_count")
+
 # Turso HTTP API 클라이언트
 class TursoClient:
     """Turso HTTP API 클라이언트 (SQLite 호환)"""
 
-    def __init__(self, url, auth_token):
+    def __init__(self, url, auth_token, session=None):
         self.base_url = get_https_url(url)
         self.auth_token = auth_token
         self.headers = {
             "Authorization": f"Bearer {auth_token}",
             "Content-Type": "application/json"
         }
+        # 연결 풀 (기본: 프로세스 전역 세션, 클라이언트마다 새 TCP/TLS 연결을 열지 않음)
+        self.session = session or get_http_session()
         self.last_result = None
 
-    def execute(self, sql, params=None):
-        """SQL 실행"""
-        # Turso HTTP API 올바른 형식
-        payload = {
-            "requests": [
-                {
-                    "type": "execute",
-                    "stmt": {
-                        "sql": sql
-                    }
-                }
-            ]
-        }
-
-        # 파라미터가 있으면 Turso 형식으로 변환하여 추가
-        if params:
-            # Turso args 형식: [{"type": "...", "value": "..."}]
-            # 모든 value는 문자열로 전달 (타입만 지정)
-            turso_args = []
-            for param in params:
-                if param is None:
-                    turso_args.append({"type": "null"})
-                elif isinstance(param, bool):
-                    # bool은 int의 서브클래스이므로 먼저 체크
-                    turso_args.append({"type": "integer", "value": str(int(param))})
-                elif isinstance(param, int):
-                    turso_args.append({"type": "integer", "value": str(param)})
-                elif isinstance(param, float):
-                    # float는 숫자 타입으로 전달
-                    turso_args.append({"type": "float", "value": param})
-                else:
-                    turso_args.append({"type": "text", "value": str(param)})
-            payload["requests"][0]["stmt"]["args"] = turso_args
-
+    # /v2/pipeline 요청 1회 (requests: Turso 요청 리스트) -> 요청별 response 리스트
+    def _pipeline(self, requests_list, operation):
+        # 호출별 소요 시간 기록 (SELECT / INSERT / BATCH 등)
+        started = time.perf_counter()
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/v2/pipeline",
                 headers=self.headers,
-                json=payload,
-                timeout=10
+                json={"requests": requests_list},
+                timeout=(TURSO_CONNECT_TIMEOUT, TURSO_READ_TIMEOUT)
             )
 
             if response.status_code != 200:
-                raise Exception(f"Turso API error {response.status_code}: {response.text}")
+                TURSO_ERRORS.labels(operation).inc()
+                # 5xx / 429는 일시적 오류로 구분 (write-behind 재시도 대상)
+                error = TursoConnectionError if response.status_code >= 500 or response.status_code == 429 else Exception
+                raise error(f"Turso API error {response.status_code}: {response.text}")
 
             result = response.json()
             self.last_result = result
-            return self
+            return pipeline_responses(result, operation)
 
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Turso 연결 오류: {str(e)}")
+            TURSO_ERRORS.labels(operation).inc()
+            raise TursoConnectionError(f"Turso 연결 오류: {str(e)}")
+        finally:
+            TURSO_SECONDS.labels(operation).observe(time.perf_counter() - started)
 
-    def fetchone(self):
-        """첫 번째 행 가져오기"""
-        if not self.last_result:
-            return None
+    def execute(self, sql, params=None):
+        """SQL 실행"""
+        # Turso HTTP API 올바른 형식
+        self._pipeline([{"type": "execute", "stmt": to_turso_stmt(sql, params)}], sql_operation(sql))
+        return self
+
+    # 여러 문장을 HTTP 요청 1회로 실행 (transaction=True: BEGIN ~ COMMIT, 하나라도 실패하면 ROLLBACK)
+    def execute_batch(self, statements, transaction=True):
+        """statements: [(sql, params), ...] -> 문장별 TursoResult 리스트 (문장 안에서 last_insert_rowid() 사용 가능)"""
+        statements = list(statements)
+        if not statements:
+            return []
+        steps, offset = build_batch_steps(statements, transaction)
+        response = self._pipeline([{"type": "batch", "batch": {"steps": steps}}], "BATCH")[0]
+        return batch_results(response, offset, len(statements), transaction)
+
+    # 같은 SQL을 파라미터 목록만큼 실행 (HTTP 요청 1회, 트랜잭션)
+    def executemany(self, sql, seq_of_params, transaction=True):
+        return self.execute_batch([(sql, params) for params in seq_of_params], transaction=transaction)
+
+    # 여러 조회 문장을 HTTP 요청 1회로 실행 (결과 집합마다 TursoResult)
+    def execute_reads(self, statements):
+        """statements: [(sql, params), ...] -> 입력 순서대로 TursoResult 리스트"""
+        statements = list(statements)
+        if not statements:
+            return []
+        self._pipeline(read_requests(statements), statements_operation(statements))
+        return self.results
 
-        # Turso 응답 형식: {"results": [{"response": {"result": {"rows": [...]}}}]}
-        results = self.last_result.get("results", [])
+    # 마지막 요청의 결과 집합별 TursoResult (execute는 1개, execute_reads는 문장 수만큼)
+    @property
+    def results(self):
+        return [
+            TursoResult(item.get("response", {}).get("result", {}))
+            for item in (self.last_result or {}).get("results", [])
+        ]
+
+    # 마지막 execute 결과
+    def _last(self):
+        results = (self.last_result or {}).get("results", [])
         if not results:
-            return None
-
-        response = results[0].get("response", {})
-        result = response.get("result", {})
-        rows = result.get("rows", [])
-
-        if not rows:
-            return None
-
-        # 첫 번째 행 처리
-        row = rows[0]
+            return TursoResult()
+        # Turso 응답 형식: {"results": [{"response": {"result": {"rows": [...]}}}]}
+        return TursoResult(results[0].get("response", {}).get("result", {}))
 
-        # Turso는 행을 dict 배열로 반환: [{"type": "text", "value": "foo"}]
-        if isinstance(row, list) and len(row) > 0 and isinstance(row[0], dict):
-            return tuple(col.get("value") for col in row)
-        elif isinstance(row, list):
-            return tuple(row)
-        else:
-            return tuple(row.values())
+    def fetchone(self):
+        """첫 번째 행 가져오기"""
+        return self._last().fetchone()
 
     def fetchall(self):
         """모든 행 가져오기"""
-        if not self.last_result:
-            return []
-
-        results = self.last_result.get("results", [])
-        if not results:
-            return []
-
-        response = results[0].get("response", {})
-        result = response.get("result", {})
-        rows = result.get("rows", [])
-
-        # 각 행을 튜플로 변환
-        processed_rows = []
-        for row in rows:
-            # Turso는 행을 dict 배열로 반환: [{"type": "text", "value": "foo"}]
-            if isinstance(row, list) and len(row) > 0 and isinstance(row[0], dict):
-                processed_rows.append(tuple(col.get("value") for col in row))
-            elif isinstance(row, list):
-                processed_rows.append(tuple(row))
-            else:
-                processed_rows.append(tuple(row.values()))
-        return processed_rows
+        return self._last().fetchall()
 
     @property
     def lastrowid(self):
         """마지막 삽입된 행의 ID"""
-        if not self.last_result:
-            return None
+        return self._last().lastrowid
 
-        results = self.last_result.get("results", [])
-        if not results:
-            return None
-
-        response = results[0].get("response", {})
-        result = response.get("result", {})
-        return result.get("last_insert_rowid")
-
-# Turso 클라이언트 생성
+# Turso 클라이언트 생성 (가벼운 객체, HTTP 연결은 전역 풀에서 재사용)
 def create_turso_client():
     """Turso 클라이언트 생성"""
     if not TURSO_DATABASE_URL or not TURSO_AUTH_TOKEN:
         raise ValueError("TURSO_DATABASE_URL and TURSO_AUTH_TOKEN must be set in .env file")
 
-    print(f"🔗 Turso 연결 (HTTP API): {TURSO_DATABASE_URL}")
+    logger.debug("🔗 Turso 연결 (HTTP API): %s", TURSO_DATABASE_URL)
 
     return TursoClient(TURSO_DATABASE_URL, TURSO_AUTH_TOKEN)
 
@@ -196,7 +374,62 @@ def init_db():
         )
     """)
 
-    print(f"✅ Turso 데이터베이스 초기화 완료: {TURSO_DATABASE_URL}")
+    # 적재 멱등성 키 (write-behind 재전송 시 같은 기록이 두 번 들어가지 않도록)
+    # 키는 "종류:키" 형식, INGEST_KEY_TTL_DAYS가 지나면 삭제
+    client.execute("""
+        CREATE TABLE IF NOT EXISTS ingest_keys (
+            key TEXT PRIMARY KEY,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    client.execute("CREATE INDEX IF NOT EXISTS ingest_keys_created_at ON ingest_keys (created_at)")
+    client.execute(*ingest_key_prune_statement())
+
+    # 통계 집계 테이블 (조회 API가 전체 기록 대신 읽음, 저장과 같은 트랜잭션에서 갱신)
+    client.execute_batch([
+        ("""
+            CREATE TABLE IF NOT EXISTS rollup_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_analyses INTEGER NOT NULL DEFAULT 0,
+                total_items INTEGER NOT NULL DEFAULT 0,
+                confidence_sum REAL NOT NULL DEFAULT 0,
+                total_feedback INTEGER NOT NULL DEFAULT 0
+            )
+        """, None),
+        ("""
+            CREATE TABLE IF NOT EXISTS rollup_categories (
+                category TEXT PRIMARY KEY,
+                item_count INTEGER NOT NULL DEFAULT 0,
+                confidence_sum REAL NOT NULL DEFAULT 0
+            )
+        """, None),
+        ("""
+            CREATE TABLE IF NOT EXISTS rollup_daily (
+                date TEXT PRIMARY KEY,
+                analyses INTEGER NOT NULL DEFAULT 0
+            )
+        """, None),
+        ("""
+            CREATE TABLE IF NOT EXISTS rollup_daily_categories (
+                date TEXT NOT NULL,
+                category TEXT NOT NULL,
+                item_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (date, category)
+            )
+        """, None),
+        ("""
+            CREATE TABLE IF NOT EXISTS rollup_feedback (
+                predicted_class TEXT PRIMARY KEY,
+                feedback_count INTEGER NOT NULL DEFAULT 0
+            )
+        """, None)
+    ])
+
+    # 집계 테이블이 비어 있으면 (처음 배포) 기존 기록으로 한 번 채움
+    if backfill_rollups_if_empty(client):
+        logger.info("[집계] 기존 기록으로 집계 테이블 생성 완료")
+
+    logger.info("✅ Turso 데이터베이스 초기화 완료: %s", TURSO_DATABASE_URL)
 
 @contextmanager
 def get_db():
@@ -205,5 +438,84 @@ def get_db():
     try:
         yield client
     finally:
-        # libsql-client는 자동으로 연결을 관리하므로 명시적 close 불필요
+        # HTTP 연결은 전역 풀로 반환되므로 명시적 close 불필요
         pass
+
+# Turso HTTP API 비동기 클라이언트 (async 라우터용, 이벤트 루프를 막지 않음)
+class AsyncTursoClient:
+    """execute / execute_batch / gather는 문장별 TursoResult를 반환 (동시 실행해도 결과가 섞이지 않음)"""
+
+    def __init__(self, url, auth_token, http_client=None):
+        self.base_url = get_https_url(url)
+        self.headers = {
+            "Authorization": f"Bearer {auth_token}",
+            "Content-Type": "application/json"
+        }
+        # 연결 풀 (기본: 프로세스 전역 httpx.AsyncClient)
+        self.http_client = http_client or get_async_http_client()
+
+    # /v2/pipeline 요청 1회 -> 요청별 response 리스트
+    async def _pipeline(self, requests_list, operation):
+        started = time.perf_counter()
+        try:
+            response = await self.http_client.post(
+                f"{self.base_url}/v2/pipeline",
+                headers=self.headers,
+                json={"requests": requests_list}
+            )
+
+            if response.status_code != 200:
+                TURSO_ERRORS.labels(operation).inc()
+                # 5xx / 429는 일시적 오류로 구분 (write-behind 재시도 대상)
+                error = TursoConnectionError if response.status_code >= 500 or response.status_code == 429 else Exception
+                raise error(f"Turso API error {response.status_code}: {response.text}")
+
+            return pipeline_responses(response.json(), operation)
+
+        except httpx.HTTPError as e:
+            TURSO_ERRORS.labels(operation).inc()
+            raise TursoConnectionError(f"Turso 연결 오류: {str(e)}")
+        finally:
+            TURSO_SECONDS.labels(operation).observe(time.perf_counter() - started)
+
+    async def execute(self, sql, params=None):
+        """SQL 실행 -> TursoResult"""
+        response = (await self._pipeline([{"type": "execute", "stmt": to_turso_stmt(sql, params)}], sql_operation(sql)))[0]
+        return TursoResult(response.get("result", {}))
+
+    # 여러 문장을 HTTP 요청 1회로 실행 (동기 클라이언트 execute_batch와 동일)
+    async def execute_batch(self, statements, transaction=True):
+        statements = list(statements)
+        if not statements:
+            return []
+        steps, offset = build_batch_steps(statements, transaction)
+        response = (await self._pipeline([{"type": "batch", "batch": {"steps": steps}}], "BATCH"))[0]
+        return batch_results(response, offset, len(statements), transaction)
+
+    async def executemany(self, sql, seq_of_params, transaction=True):
+        return await self.execute_batch([(sql, params) for params in seq_of_params], transaction=transaction)
+
+    # 여러 조회 문장을 HTTP 요청 1회로 실행 (결과 집합마다 TursoResult)
+    async def execute_reads(self, statements):
+        """statements: [(sql, params), ...] -> 입력 순서대로 TursoResult 리스트"""
+        statements = list(statements)
+        if not statements:
+            return []
+        responses = await self._pipeline(read_requests(statements), statements_operation(statements))
+        return [TursoResult(response.get("result", {})) for response in responses]
+
+    # 서로 독립적인 조회를 동시에 실행 (문장마다 HTTP 요청, 연결 풀 / HTTP/2로 병렬 전송)
+    async def gather(self, statements):
+        """statements: [(sql, params), ...] -> 입력 순서대로 TursoResult 리스트"""
+        return list(await asyncio.gather(*(self.execute(sql, params) for sql, params in statements)))
+
+# 비동기 Turso 클라이언트 생성
+def create_async_turso_client():
+    if not TURSO_DATABASE_URL or not TURSO_AUTH_TOKEN:
+        raise ValueError("TURSO_DATABASE_URL and TURSO_AUTH_TOKEN must be set in .env file")
+    return AsyncTursoClient(TURSO_DATABASE_URL, TURSO_AUTH_TOKEN)
+
+@asynccontextmanager
+async def get_async_db():
+    """비동기 데이터베이스 컨텍스트 매니저 (async 라우터용, 스크립트는 get_db 사용)"""
+    yield create_async_turso_client()
@@ -0,0 +1,106 @@
+# 추론 전용 실행기 (스레드 풀 / fork 기반 프로세스 풀)
+# 추론이 포화되어도 /health, /api/stats 같은 가벼운 요청이 막히지 않도록
+# 추론은 이 실행기의 고정된 워커에서만 실행
+
+import os
+import logging
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+import torch
+from .metrics import observe_boxes, observe_stages
+
+logger = logging.getLogger(__name__)
+
+# 실행기 설정 (환경 변수로 조정)
+INFERENCE_EXECUTOR = os.getenv("INFERENCE_EXECUTOR", "thread")  # "thread" 또는 "process"
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "1"))  # 동시에 실행할 추론 배치 수
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "32"))  # 대기 + 실행 중 요청 최대 수
+# uvicorn 프로세스 수 (각 프로세스가 자기 실행기를 가짐)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+# 워커당 PyTorch intra-op 스레드 수 (기본: CPU 코어를 전체 추론 워커 수로 나눈 값)
+TORCH_THREADS_PER_WORKER = int(os.getenv("TORCH_THREADS_PER_WORKER", "0")) or max(1, (os.cpu_count() or 1) // max(1, INFERENCE_WORKERS * WEB_CONCURRENCY))
+TORCH_INTEROP_THREADS = int(os.getenv("TORCH_INTEROP_THREADS", "1"))
+
+# 프로세스 풀 워커가 fork 시 물려받는 파이프라인 (모델 가중치는 copy-on-write로 공유)
+_worker_pipeline = None
+
+# 워커 초기화: PyTorch 스레드 수 설정 (코어 과다 사용 방지)
+def _init_worker(torch_threads, interop_threads):
+    torch.set_num_threads(torch_threads)
+    try:
+        # inter-op 스레드는 프로세스당 한 번만 설정 가능
+        torch.set_num_interop_threads(interop_threads)
+    except RuntimeError:
+        pass
+
+# 프로세스 워커 미리 생성용 (아무 작업 안 함)
+def _noop():
+    return os.getpid()
+
+# 배치 추론 + 단계별 소요 시간 측정 (워커에서 실행, 지표는 메인 프로세스에서 기록)
+def _run_batch(pipeline, images, fast_mode, track_keys):
+    timings = {}
+    results = pipeline.process_objects_batch(images, fast_mode=fast_mode, track_keys=track_keys, timings=timings)
+    return results, timings
+
+# 프로세스 워커에서 실행되는 배치 추론
+def _process_batch(images, fast_mode, track_keys):
+    return _run_batch(_worker_pipeline, images, fast_mode, track_keys)
+
+class InferenceExecutor:
+    """워커 수와 워커당 torch 스레드 수가 제한된 추론 실행기"""
+
+    def __init__(self, pipeline, kind=INFERENCE_EXECUTOR, workers=INFERENCE_WORKERS,
+                 torch_threads=TORCH_THREADS_PER_WORKER, interop_threads=TORCH_INTEROP_THREADS,
+                 max_pending=INFERENCE_QUEUE_SIZE):
+        global _worker_pipeline
+        self.pipeline = pipeline
+        self.kind = kind
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, int(max_pending))
+
+        if kind == "process":
+            # 모델 로드가 끝난 뒤 fork하여 가중치를 자식 프로세스와 공유
+            _worker_pipeline = pipeline
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(torch_threads, interop_threads)
+            )
+            # 추론 스레드가 생기기 전에 워커를 미리 fork
+            for future in [self.pool.submit(_noop) for _ in range(self.workers)]:
+                future.result()
+        elif kind == "thread":
+            # 같은 프로세스 안에서는 torch 스레드 설정이 전역이므로 한 번만 적용
+            _init_worker(torch_threads, interop_threads)
+            self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inference")
+        else:
+            raise ValueError(f"지원하지 않는 INFERENCE_EXECUTOR: {kind}")
+
+        logger.info("[추론 실행기] %s 워커 %d개, 워커당 torch 스레드 %d개, 최대 대기 %d건", kind, self.workers, torch_threads, self.max_pending)
+
+    # 배치 추론 제출 (concurrent.futures.Future 반환)
+    # 프로세스 풀에서는 추적기 상태가 워커별로 따로 유지됨 (같은 세션이 다른 워커로 가면 새로 분류)
+    def submit_batch(self, images, fast_mode=False, track_keys=None):
+        if self.kind == "process":
+            worker_future = self.pool.submit(_process_batch, images, fast_mode, track_keys)
+        else:
+            worker_future = self.pool.submit(_run_batch, self.pipeline, images, fast_mode, track_keys)
+
+        # 단계별 시간 / 박스 수를 지표에 기록하고 결과만 전달
+        future = Future()
+        def unpack(done):
+            try:
+                results, timings = done.result()
+            except Exception as e:
+                future.set_exception(e)
+                return
+            observe_stages(timings)
+            observe_boxes(results)
+            future.set_result(results)
+        worker_future.add_done_callback(unpack)
+        return future
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -1,21 +1,36 @@
 # backend/app/main.py
+import time
+_startup_started = time.perf_counter()
+
+import logging
+import os
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from .routers import health, predict, stats, feedback, geocoding
-from .database import init_db
+# 로그 레벨 (기본 WARNING: 요청별 로그는 끄고 경고/오류만, 개발 시 LOG_LEVEL=INFO 또는 DEBUG)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
+logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+from .routers import health, predict, catalog, metrics, stats, feedback, geocoding
+from .database import init_db, close_http_session, close_async_http_client
+from .model_loader import loader
+from .write_behind import WRITE_BEHIND_ENABLED, write_behind
 
 app = FastAPI(title="Recycle Lens API", version="0.1.0")
 
+# 시작 단계별 소요 시간 기록
+loader.timings["app_import_sec"] = round(time.perf_counter() - _startup_started, 3)
+
 # 데이터베이스 초기화
+_step = time.perf_counter()
 init_db()
+loader.timings["init_db_sec"] = round(time.perf_counter() - _step, 3)
 
 # CORS 설정
-import os
-
 # 환경별 CORS 설정
 if os.getenv("ENV") == "production":
     # 프로덕션: 모든 origin 허용
@@ -41,7 +56,29 @@ app.add_middleware(
 
 # 라우터
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(predict.router)
+app.include_router(catalog.router)
 app.include_router(stats.router)
 app.include_router(feedback.router)
-app.include_router(geocoding.router)
\ No newline at end of file
+app.include_router(geocoding.router)
+
+# 모델 로드 시작 (eager: 즉시, background: 별도 스레드, lazy: 첫 요청 시)
+@app.on_event("startup")
+def load_models():
+    loader.start()
+    logger.info("[서버 시작] 모델 로드 모드: %s, 시작 소요 시간: %.3f초", loader.mode, time.perf_counter() - _startup_started)
+
+# 통계 / 피드백 write-behind 적재 시작 (이전 실행에서 남은 스풀 기록도 이어서 적재)
+@app.on_event("startup")
+async def start_write_behind():
+    if WRITE_BEHIND_ENABLED:
+        write_behind.start()
+
+# write-behind 남은 기록 적재 + Turso 연결 풀 정리
+@app.on_event("shutdown")
+async def close_db_pool():
+    if WRITE_BEHIND_ENABLED:
+        await write_behind.stop()
+    close_http_session()
+    await close_async_http_client()
@@ -0,0 +1,72 @@
+# Prometheus 지표 (GET /metrics)
+# 요청 단계별 소요 시간 히스토그램, 이미지당 박스 수, 추론 대기열 길이, Turso 호출 시간
+# uvicorn 프로세스(WEB_CONCURRENCY)마다 따로 집계됨
+
+import time
+from contextlib import contextmanager
+from prometheus_client import Counter, Gauge, Histogram
+
+# 지연 시간 구간 (초, 1ms ~ 10s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+# 요청 처리 단계별 소요 시간
+# upload_read, decode, inference(대기 포함), yolo, crop_filter, preprocess, resnet, format, total
+STAGE_SECONDS = Histogram(
+    "recyclelens_stage_seconds",
+    "요청 처리 단계별 소요 시간 (초)",
+    ["stage"],
+    buckets=LATENCY_BUCKETS
+)
+
+# 이미지당 분류 대상 박스 수 (crop 필터 이후)
+BOXES_PER_IMAGE = Histogram(
+    "recyclelens_boxes_per_image",
+    "이미지당 검출 박스 수",
+    buckets=(0, 1, 2, 3, 5, 8, 13, 20, 30, 50)
+)
+DETECTED_BOXES = Counter("recyclelens_detected_boxes", "검출 박스 누적 수")
+INFERENCE_IMAGES = Counter("recyclelens_inference_images", "추론한 이미지 누적 수")
+
+# 추론 스케줄러 대기열 길이 (/metrics 조회 시점 값)
+INFERENCE_QUEUE_DEPTH = Gauge("recyclelens_inference_queue_depth", "추론 대기열에 쌓인 요청 수")
+
+# Turso HTTP API 호출 시간 (operation: SQL 첫 키워드)
+TURSO_SECONDS = Histogram(
+    "recyclelens_turso_seconds",
+    "Turso HTTP API 호출 소요 시간 (초)",
+    ["operation"],
+    buckets=LATENCY_BUCKETS
+)
+TURSO_ERRORS = Counter("recyclelens_turso_errors", "Turso HTTP API 호출 실패 수", ["operation"])
+
+# write-behind 스풀 (통계 / 피드백 비동기 적재)
+WRITE_BEHIND_DEPTH = Gauge("recyclelens_write_behind_depth", "Turso 적재 대기 중인 기록 수")
+WRITE_BEHIND_FLUSH_LAG = Gauge("recyclelens_write_behind_flush_lag_seconds", "가장 오래된 적재 대기 기록의 나이 (초)")
+WRITE_BEHIND_FLUSHED = Counter("recyclelens_write_behind_flushed", "Turso에 적재된 기록 수")
+WRITE_BEHIND_FLUSH_ERRORS = Counter("recyclelens_write_behind_flush_errors", "적재 실패 수", ["reason"])
+
+# with 블록 소요 시간을 단계 히스토그램에 기록
+@contextmanager
+def timed(stage):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.labels(stage).observe(time.perf_counter() - started)
+
+# 추론 워커가 측정한 단계별 시간 기록 ({stage: seconds})
+def observe_stages(timings):
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.labels(stage).observe(seconds)
+
+# 이미지별 yolo_results 리스트 -> 박스 수 기록
+def observe_boxes(batch_results):
+    for yolo_results in batch_results:
+        BOXES_PER_IMAGE.observe(len(yolo_results))
+        DETECTED_BOXES.inc(len(yolo_results))
+    INFERENCE_IMAGES.inc(len(batch_results))
+
+# SQL 문 -> 지표 라벨 (SELECT, INSERT, CREATE 등)
+def sql_operation(sql):
+    words = sql.split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
@@ -0,0 +1,118 @@
+# 추론 모델 로딩 (즉시 / 백그라운드 / 첫 요청 시) 및 준비 상태 관리
+# 서버가 포트를 먼저 열고 모델은 뒤에서 로드하여 재배포 시 콜드 스타트 단축
+
+import os
+import logging
+import threading
+import time
+import numpy as np
+
+# 로딩 설정 (환경 변수로 조정)
+MODEL_LOAD_MODE = os.getenv("MODEL_LOAD_MODE", "background")  # "eager", "background", "lazy"
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "1") == "1"  # 로드 직후 더미 이미지로 추론 1회
+
+logger = logging.getLogger(__name__)
+
+# 모델 로딩이 끝나지 않았을 때 발생하는 예외
+class ModelNotReady(Exception):
+    pass
+
+# 추론 대기열이 가득 찼을 때 발생하는 예외 (라우터가 torch를 import하지 않도록 여기에 정의)
+class InferenceQueueFull(Exception):
+    pass
+
+class ModelLoader:
+    """파이프라인 / 실행기 / 스케줄러를 한 번만 생성하고 준비 상태와 소요 시간 기록"""
+
+    def __init__(self, mode=MODEL_LOAD_MODE, warmup=MODEL_WARMUP):
+        self.mode = mode
+        self.warmup = warmup
+        self.pipeline = None
+        self.executor = None
+        self.scheduler = None
+        self.error = None
+        self.timings = {}
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def ready(self):
+        return self._ready.is_set()
+
+    # 모델 로드 (여러 번 호출해도 한 번만 실행)
+    def load(self):
+        with self._lock:
+            if self.ready:
+                return
+            try:
+                started = time.perf_counter()
+                # 무거운 모듈(torch, ultralytics)은 여기서 처음 import
+                from training.pipeline import YOLOResNetPipeline
+                from .executor import InferenceExecutor
+                from .scheduler import InferenceScheduler
+                self.timings["import_sec"] = round(time.perf_counter() - started, 3)
+
+                step = time.perf_counter()
+                pipeline = YOLOResNetPipeline()
+                self.timings["model_load_sec"] = round(time.perf_counter() - step, 3)
+
+                # 실행기는 모델 로드 후 생성해야 프로세스 풀이 가중치를 공유
+                executor = InferenceExecutor(pipeline)
+                scheduler = InferenceScheduler(executor)
+
+                if self.warmup:
+                    # 실시간 / 일반 업로드 해상도 각각 한 번씩 추론 (첫 요청 지연 제거)
+                    step = time.perf_counter()
+                    dummy = np.zeros((480, 640, 3), dtype=np.uint8)
+                    for fast_mode in (True, False):
+                        scheduler.submit(dummy, fast_mode=fast_mode).result()
+                    self.timings["warmup_sec"] = round(time.perf_counter() - step, 3)
+
+                self.pipeline, self.executor, self.scheduler = pipeline, executor, scheduler
+                self.timings["total_sec"] = round(time.perf_counter() - started, 3)
+                self.error = None
+                self._ready.set()
+                logger.info("[모델 준비 완료] %s", self.timings)
+            except Exception as e:
+                self.error = str(e)
+                logger.exception("[모델 로드 실패] %s", e)
+                raise
+
+    # 로드 모드에 맞게 시작 (서버 시작 시 호출)
+    def start(self):
+        if self.mode == "eager":
+            self.load()
+        elif self.mode == "background":
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._load_quietly, name="model-loader", daemon=True)
+                self._thread.start()
+        elif self.mode != "lazy":
+            raise ValueError(f"지원하지 않는 MODEL_LOAD_MODE: {self.mode}")
+
+    def _load_quietly(self):
+        try:
+            self.load()
+        except Exception:
+            pass
+
+    # 요청 처리 전 준비 확인 (lazy 모드는 여기서 로드, 블로킹이므로 스레드 풀에서 호출)
+    def require_ready(self):
+        if self.ready:
+            return self
+        if self.mode == "lazy":
+            self.load()
+            return self
+        raise ModelNotReady(self.error or "모델을 로딩 중입니다. 잠시 후 다시 시도해주세요.")
+
+    # 준비 상태 (/ready 응답용)
+    def status(self):
+        return {
+            "ready": self.ready,
+            "mode": self.mode,
+            "error": self.error,
+            "timings": self.timings
+        }
+
+# 서버 전역 로더
+loader = ModelLoader()
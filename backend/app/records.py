@@ -0,0 +1,88 @@
+# 분석 결과 / 피드백 기록 -> Turso 저장 문장 (직접 저장 / write-behind 공용)
+# 멱등성 키를 ingest_keys에 먼저 넣고, 새 키일 때만(changes() = 1) 실제 행 삽입 + 집계 갱신
+# -> 같은 기록을 여러 번 보내도 한 번만 저장/집계됨
+
+import os
+from datetime import datetime, timezone
+from .rollups import analysis_rollup_statements, feedback_rollup_statements
+
+# 멱등성 키 보관 기간 (일) - 이 기간이 지난 뒤 같은 키로 다시 보내면 새 기록으로 저장됨
+INGEST_KEY_TTL_DAYS = int(os.getenv("INGEST_KEY_TTL_DAYS", "7"))
+
+# 접수 시각 (created_at 컬럼 형식, UTC) - 나중에 적재되어도 일별 통계 날짜가 바뀌지 않도록
+def created_at_now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+# POST /api/stats 요청 -> 저장할 기록 (JSON 직렬화 가능한 dict)
+def analysis_record(data):
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "created_at": created_at_now(),
+        "total_items": data.classified_items,
+        "items": [
+            [item["recycling_info"]["category"], item["recycling_info"]["confidence"]]
+            for item in data.recycling_items
+        ]
+    }
+
+# POST /api/feedback 요청 -> 저장할 기록
+def feedback_record(data):
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "created_at": created_at_now(),
+        "predicted_class": data.predicted_class,
+        "actual_class": data.actual_class,
+        "confidence": data.confidence
+    }
+
+# 멱등성 키 (기록 종류별로 구분: 분석 / 피드백 키가 서로 겹쳐도 충돌하지 않음)
+def ingest_key(kind, key):
+    return f"{kind}:{key}"
+
+# 만료된 멱등성 키 삭제 문장
+def ingest_key_prune_statement(ttl_days=INGEST_KEY_TTL_DAYS):
+    return "DELETE FROM ingest_keys WHERE created_at < DATETIME('now', '-' || ? || ' days')", [ttl_days]
+
+# 분석 기록 + 탐지된 항목들 + 집계 갱신 -> [(sql, params), ...] (1번째 문장이 분석 기록 삽입)
+def analysis_statements(record, key):
+    statements = [
+        ("INSERT OR IGNORE INTO ingest_keys (key) VALUES (?)", [ingest_key("analysis", key)]),
+        ("""
+            INSERT INTO analysis_records (timestamp, total_items, created_at)
+            SELECT ?, ?, ? WHERE changes() = 1
+        """, [record["timestamp"], record["total_items"], record["created_at"]])
+    ]
+
+    # 첫 항목은 방금 삽입한 분석 기록 ID, 이후 항목은 직전 항목의 analysis_id를 그대로 사용
+    # (last_insert_rowid()가 항목 삽입마다 바뀌므로)
+    for idx, (category, confidence) in enumerate(record["items"]):
+        analysis_id_sql = "last_insert_rowid()" if idx == 0 else \
+            "(SELECT analysis_id FROM detected_items WHERE id = last_insert_rowid())"
+        statements.append((f"""
+            INSERT INTO detected_items (analysis_id, category, confidence)
+            SELECT {analysis_id_sql}, ?, ? WHERE changes() = 1
+        """, [category, confidence]))
+
+    # 집계 갱신은 last_insert_rowid()를 바꾸므로 항목 삽입이 모두 끝난 뒤에
+    return statements + analysis_rollup_statements(record)
+
+# 피드백 + 집계 갱신 -> [(sql, params), ...] (1번째 문장이 피드백 삽입)
+def feedback_statements(record, key):
+    statements = [
+        ("INSERT OR IGNORE INTO ingest_keys (key) VALUES (?)", [ingest_key("feedback", key)]),
+        ("""
+            INSERT INTO feedback (predicted_class, actual_class, confidence, timestamp, created_at)
+            SELECT ?, ?, ?, ?, ? WHERE changes() = 1
+        """, [record["predicted_class"], record["actual_class"], record["confidence"], record["timestamp"], record["created_at"]])
+    ]
+    return statements + feedback_rollup_statements(record)
+
+# 기록 종류 -> 문장 생성 함수
+STATEMENT_BUILDERS = {
+    "analysis": analysis_statements,
+    "feedback": feedback_statements
+}
+
+# (종류, 기록, 멱등성 키) -> [(sql, params), ...]
+def record_statements(kind, record, key):
+    return STATEMENT_BUILDERS[kind](record, key)
@@ -0,0 +1,90 @@
+# 실시간 프레임 결과 캐시 (perceptual hash 기반)
+# 카메라가 정지된 물체를 비추면 연속 프레임이 거의 같으므로
+# dHash 해밍 거리가 임계값 이하인 최근 프레임의 결과를 재사용
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+import cv2 as cv
+import numpy as np
+
+# 캐시 설정 (환경 변수로 조정)
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "1") == "1"
+RESULT_CACHE_THRESHOLD = int(os.getenv("RESULT_CACHE_THRESHOLD", "4"))  # 허용 해밍 거리 (64비트 중)
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "2.0"))  # 결과 유효 시간 (초)
+RESULT_CACHE_MAX_SESSIONS = int(os.getenv("RESULT_CACHE_MAX_SESSIONS", "256"))  # 세션 수 LRU 한도
+RESULT_CACHE_PER_SESSION = int(os.getenv("RESULT_CACHE_PER_SESSION", "4"))  # 세션당 보관 프레임 수
+
+# 64비트 dHash (9x8 흑백 축소 후 가로 인접 픽셀 밝기 비교)
+def dhash(image):
+    gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    small = cv.resize(gray, (9, 8), interpolation=cv.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+# 두 해시의 해밍 거리
+def hamming_distance(a, b):
+    return (a ^ b).bit_count()
+
+class ResultCache:
+    """세션별 LRU + TTL 결과 캐시"""
+
+    def __init__(self, threshold=RESULT_CACHE_THRESHOLD, ttl=RESULT_CACHE_TTL,
+                 max_sessions=RESULT_CACHE_MAX_SESSIONS, per_session=RESULT_CACHE_PER_SESSION):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_sessions = max(1, max_sessions)
+        self.per_session = max(1, per_session)
+        # session_key -> OrderedDict[frame_hash -> (저장 시각, 결과)]
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # 비슷한 프레임의 결과 조회 (없으면 None)
+    def get(self, session_key, frame_hash):
+        now = time.monotonic()
+        with self._lock:
+            entries = self._sessions.get(session_key)
+            if entries is not None:
+                self._sessions.move_to_end(session_key)
+                # 만료된 항목 제거
+                for key in [key for key, (saved_at, _) in entries.items() if now - saved_at > self.ttl]:
+                    del entries[key]
+                # 해밍 거리가 가장 가까운 항목
+                best = min(entries, key=lambda key: hamming_distance(key, frame_hash), default=None)
+                if best is not None and hamming_distance(best, frame_hash) <= self.threshold:
+                    self.hits += 1
+                    return copy.deepcopy(entries[best][1])
+            self.misses += 1
+            return None
+
+    # 결과 저장
+    def put(self, session_key, frame_hash, result):
+        with self._lock:
+            entries = self._sessions.setdefault(session_key, OrderedDict())
+            self._sessions.move_to_end(session_key)
+            entries[frame_hash] = (time.monotonic(), copy.deepcopy(result))
+            entries.move_to_end(frame_hash)
+            # 세션당 / 전체 세션 수 한도
+            while len(entries) > self.per_session:
+                entries.popitem(last=False)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    # 캐시 통계 (임계값 조정용)
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": RESULT_CACHE_ENABLED,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "sessions": len(self._sessions),
+                "entries": sum(len(entries) for entries in self._sessions.values()),
+                "threshold": self.threshold,
+                "ttl": self.ttl
+            }
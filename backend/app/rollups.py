@@ -0,0 +1,176 @@
+# 통계 집계(rollup) 테이블
+# 저장할 때마다 같은 트랜잭션에서 합계를 갱신하고, 조회 API는 전체 기록 대신 집계 행만 읽음
+# (조회 비용이 누적 기록 수가 아니라 카테고리 수 x 일수에 비례)
+#
+# 기존 데이터 재집계: python -m app.rollups rebuild
+# 집계 / 원본 일치 확인: python -m app.rollups verify (불일치 시 종료 코드 1)
+
+# 집계 테이블 (database.init_db에서 생성)
+# rollup_totals: 전체 합계 (id = 1 한 행)
+# rollup_categories: 카테고리별 탐지 수 / 신뢰도 합
+# rollup_daily: 일별 분석 횟수
+# rollup_daily_categories: 일별 카테고리별 탐지 수
+# rollup_feedback: 예측 클래스별 피드백(오분류 보고) 수
+ROLLUP_TABLES = ["rollup_totals", "rollup_categories", "rollup_daily", "rollup_daily_categories", "rollup_feedback"]
+
+# 새 분석 기록 1건 -> 집계 갱신 문장 [(sql, params), ...]
+def analysis_rollup_statements(record):
+    """
+    records.analysis_statements 뒤에 붙여서 실행
+    각 문장은 직전 문장이 1행을 바꿨을 때만(changes() = 1) 실행 -> 중복 키로 건너뛴 기록은 집계에도 반영되지 않음
+    """
+    date = record["created_at"][:10]
+
+    # 카테고리별 탐지 수 / 신뢰도 합
+    categories = {}
+    for category, confidence in record["items"]:
+        count, confidence_sum = categories.get(category, (0, 0.0))
+        categories[category] = (count + 1, confidence_sum + confidence)
+
+    statements = [
+        ("""
+            INSERT INTO rollup_totals (id, total_analyses, total_items, confidence_sum)
+            SELECT 1, 1, ?, ? WHERE changes() = 1
+            ON CONFLICT (id) DO UPDATE SET
+                total_analyses = total_analyses + 1,
+                total_items = total_items + excluded.total_items,
+                confidence_sum = confidence_sum + excluded.confidence_sum
+        """, [len(record["items"]), sum(confidence for _, confidence in record["items"])]),
+        ("""
+            INSERT INTO rollup_daily (date, analyses)
+            SELECT ?, 1 WHERE changes() = 1
+            ON CONFLICT (date) DO UPDATE SET analyses = analyses + 1
+        """, [date])
+    ]
+    for category, (count, confidence_sum) in categories.items():
+        statements.append(("""
+            INSERT INTO rollup_categories (category, item_count, confidence_sum)
+            SELECT ?, ?, ? WHERE changes() = 1
+            ON CONFLICT (category) DO UPDATE SET
+                item_count = item_count + excluded.item_count,
+                confidence_sum = confidence_sum + excluded.confidence_sum
+        """, [category, count, confidence_sum]))
+        statements.append(("""
+            INSERT INTO rollup_daily_categories (date, category, item_count)
+            SELECT ?, ?, ? WHERE changes() = 1
+            ON CONFLICT (date, category) DO UPDATE SET item_count = item_count + excluded.item_count
+        """, [date, category, count]))
+    return statements
+
+# 새 피드백 1건 -> 집계 갱신 문장 (records.feedback_statements 뒤에 붙여서 실행)
+def feedback_rollup_statements(record):
+    return [
+        ("""
+            INSERT INTO rollup_totals (id, total_feedback)
+            SELECT 1, 1 WHERE changes() = 1
+            ON CONFLICT (id) DO UPDATE SET total_feedback = total_feedback + 1
+        """, None),
+        ("""
+            INSERT INTO rollup_feedback (predicted_class, feedback_count)
+            SELECT ?, 1 WHERE changes() = 1
+            ON CONFLICT (predicted_class) DO UPDATE SET feedback_count = feedback_count + 1
+        """, [record["predicted_class"]])
+    ]
+
+# 원본 테이블 전체 스캔으로 집계 테이블 다시 만들기 (트랜잭션 1회로 실행)
+def rebuild_statements():
+    statements = [(f"DELETE FROM {table}", None) for table in ROLLUP_TABLES]
+    statements += [
+        ("""
+            INSERT INTO rollup_totals (id, total_analyses, total_items, confidence_sum, total_feedback)
+            SELECT 1,
+                (SELECT COUNT(*) FROM analysis_records),
+                (SELECT COUNT(*) FROM detected_items),
+                (SELECT COALESCE(SUM(confidence), 0) FROM detected_items),
+                (SELECT COUNT(*) FROM feedback)
+        """, None),
+        ("""
+            INSERT INTO rollup_categories (category, item_count, confidence_sum)
+            SELECT category, COUNT(*), SUM(confidence) FROM detected_items GROUP BY category
+        """, None),
+        ("""
+            INSERT INTO rollup_daily (date, analyses)
+            SELECT DATE(created_at), COUNT(*) FROM analysis_records GROUP BY DATE(created_at)
+        """, None),
+        ("""
+            INSERT INTO rollup_daily_categories (date, category, item_count)
+            SELECT DATE(ar.created_at), di.category, COUNT(*)
+            FROM analysis_records ar
+            JOIN detected_items di ON ar.id = di.analysis_id
+            GROUP BY DATE(ar.created_at), di.category
+        """, None),
+        ("""
+            INSERT INTO rollup_feedback (predicted_class, feedback_count)
+            SELECT predicted_class, COUNT(*) FROM feedback GROUP BY predicted_class
+        """, None)
+    ]
+    return statements
+
+# 집계 테이블 재집계 (동기 TursoClient)
+def rebuild(client):
+    client.execute_batch(rebuild_statements())
+
+# 집계 테이블이 비어 있으면 (처음 배포) 기존 기록으로 채움 -> 재집계했는지
+def backfill_if_empty(client):
+    # Turso는 정수를 문자열("0")로 반환하므로 int로 변환 후 비교
+    if int(client.execute("SELECT COUNT(*) FROM rollup_totals").fetchone()[0]) != 0:
+        return False
+    rebuild(client)
+    return True
+
+# 집계 테이블과 원본 전체 스캔 결과 비교 -> 불일치 항목 리스트
+def verify(client):
+    # (이름, 집계 조회, 원본 조회) - 두 조회 모두 (키, 값) 행을 반환
+    checks = [
+        ("totals",
+         "SELECT 'analyses', total_analyses FROM rollup_totals UNION ALL SELECT 'items', total_items FROM rollup_totals "
+         "UNION ALL SELECT 'feedback', total_feedback FROM rollup_totals",
+         "SELECT 'analyses', COUNT(*) FROM analysis_records UNION ALL SELECT 'items', COUNT(*) FROM detected_items "
+         "UNION ALL SELECT 'feedback', COUNT(*) FROM feedback"),
+        ("confidence_sum",
+         "SELECT 'confidence_sum', ROUND(confidence_sum, 4) FROM rollup_totals",
+         "SELECT 'confidence_sum', ROUND(COALESCE(SUM(confidence), 0), 4) FROM detected_items"),
+        ("categories",
+         "SELECT category, item_count FROM rollup_categories",
+         "SELECT category, COUNT(*) FROM detected_items GROUP BY category"),
+        ("daily",
+         "SELECT date, analyses FROM rollup_daily",
+         "SELECT DATE(created_at), COUNT(*) FROM analysis_records GROUP BY DATE(created_at)"),
+        ("daily_categories",
+         "SELECT date || '/' || category, item_count FROM rollup_daily_categories",
+         "SELECT DATE(ar.created_at) || '/' || di.category, COUNT(*) FROM analysis_records ar "
+         "JOIN detected_items di ON ar.id = di.analysis_id GROUP BY DATE(ar.created_at), di.category"),
+        ("feedback",
+         "SELECT predicted_class, feedback_count FROM rollup_feedback",
+         "SELECT predicted_class, COUNT(*) FROM feedback GROUP BY predicted_class")
+    ]
+    results = client.execute_reads([(sql, None) for _, rollup_sql, source_sql in checks for sql in (rollup_sql, source_sql)])
+
+    mismatches = []
+    for idx, (name, _, _) in enumerate(checks):
+        rollup = {row[0]: float(row[1] or 0) for row in results[idx * 2].fetchall()}
+        source = {row[0]: float(row[1] or 0) for row in results[idx * 2 + 1].fetchall()}
+        for key in sorted(set(rollup) | set(source)):
+            if abs(rollup.get(key, 0.0) - source.get(key, 0.0)) > 1e-3:
+                mismatches.append({"check": name, "key": key, "rollup": rollup.get(key, 0.0), "source": source.get(key, 0.0)})
+    return mismatches
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from .database import get_db
+
+    parser = argparse.ArgumentParser(description="통계 집계 테이블 재집계 / 확인")
+    parser.add_argument("command", choices=["rebuild", "verify"])
+    args = parser.parse_args()
+
+    with get_db() as client:
+        if args.command == "rebuild":
+            rebuild(client)
+            print("집계 테이블 재집계 완료")
+        else:
+            mismatches = verify(client)
+            for item in mismatches:
+                print(f"[불일치] {item['check']} {item['key']}: 집계 {item['rollup']} / 원본 {item['source']}")
+            print("집계 테이블이 원본과 일치합니다" if not mismatches else f"불일치 {len(mismatches)}건 (python -m app.rollups rebuild 로 재집계)")
+            sys.exit(1 if mismatches else 0)
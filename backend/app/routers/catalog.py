@@ -0,0 +1,26 @@
+# 재활용 카테고리 / 배출 방법 카탈로그 (정적, 브라우저 캐시용 ETag + Cache-Control)
+
+from fastapi import APIRouter, Request, Response
+import os
+from training.recycling import catalog_payload
+
+router = APIRouter(tags=["catalog"])
+
+# 브라우저 캐시 유지 시간 (초, 만료 후에는 ETag로 재검증)
+CATALOG_MAX_AGE = int(os.getenv("CATALOG_MAX_AGE", "86400"))
+
+# 내용이 바뀌지 않으므로 서버 시작 시 한 번만 직렬화
+CATALOG_BODY, CATALOG_ETAG = catalog_payload()
+
+# 클래스 ID -> 카테고리 / 배출 방법 (/predict 간결한 응답의 class_id 해석용)
+@router.get("/catalog")
+def catalog(request: Request):
+    headers = {
+        "ETag": CATALOG_ETAG,
+        "Cache-Control": f"public, max-age={CATALOG_MAX_AGE}"
+    }
+    # 클라이언트 캐시가 최신이면 본문 없이 304
+    if_none_match = request.headers.get("if-none-match", "")
+    if CATALOG_ETAG in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    return Response(content=CATALOG_BODY, media_type="application/json", headers=headers)
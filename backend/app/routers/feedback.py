@@ -1,13 +1,15 @@
 # 피드백 API 라우터
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from datetime import datetime
-import sys
-import os
+from typing import Optional
+import uuid
 
-# 데이터베이스 모듈 import
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from database import get_db
+# 데이터베이스 모듈 import (app.database 하나만 로드되어야 연결 풀을 공유)
+# async 라우터는 비동기 클라이언트 사용 (DB 왕복 동안 이벤트 루프를 막지 않음)
+from ..database import get_async_db
+from ..records import feedback_record, feedback_statements
+from ..write_behind import WRITE_BEHIND_ENABLED, SpoolFull, WriteBehindNotRunning, write_behind
 
 router = APIRouter(tags=["feedback"])
 
@@ -19,9 +21,11 @@ class FeedbackRequest(BaseModel):
 
 # 피드백 저장
 @router.post("/api/feedback")
-async def save_feedback(data: FeedbackRequest):
+async def save_feedback(data: FeedbackRequest, idempotency_key: Optional[str] = Header(None)):
     """
     사용자 피드백을 데이터베이스에 저장
+    (write-behind 사용 시 로컬 스풀에 접수 후 202 응답, Turso 적재는 백그라운드에서)
+    같은 Idempotency-Key 헤더로 다시 보내면 한 번만 저장
 
     요청 예시:
     {
@@ -30,20 +34,27 @@ async def save_feedback(data: FeedbackRequest):
         "confidence": 0.86
     }
     """
+    record = feedback_record(data)
+
+    # 로컬 스풀에 접수하고 바로 응답
+    if WRITE_BEHIND_ENABLED:
+        try:
+            key = await write_behind.submit("feedback", record, idempotency_key)
+        except (SpoolFull, WriteBehindNotRunning) as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+        return JSONResponse(status_code=202, content={
+            "status": "success",
+            "message": "피드백이 접수되었습니다.",
+            "idempotency_key": key
+        })
+
     try:
-        with get_db() as client:
-            # 피드백 저장
-            client.execute("""
-                INSERT INTO feedback (predicted_class, actual_class, confidence, timestamp)
-                VALUES (?, ?, ?, ?)
-            """, [
-                data.predicted_class,
-                data.actual_class,
-                data.confidence,
-                datetime.now().isoformat()
-            ])
+        async with get_async_db() as client:
+            # 피드백 저장 (멱등성 키 + 피드백 행, 트랜잭션 1회)
+            key = idempotency_key or uuid.uuid4().hex
+            results = await client.execute_batch(feedback_statements(record, key))
 
-            feedback_id = client.lastrowid
+            feedback_id = results[1].lastrowid
 
             return {
                 "status": "success",
@@ -70,17 +81,17 @@ async def get_feedback_stats():
     }
     """
     try:
-        with get_db() as client:
-            # 전체 피드백 수
-            client.execute("SELECT COUNT(*) FROM feedback")
-            total_feedback = int(client.fetchone()[0])
+        async with get_async_db() as client:
+            # 전체 피드백 수 / 클래스별 오분류 수 / 클래스별 전체 예측 수 (집계 테이블, HTTP 요청 1회)
+            feedback_count, errors, predictions = await client.execute_reads([
+                ("SELECT total_feedback FROM rollup_totals WHERE id = 1", None),
+                ("SELECT predicted_class, feedback_count FROM rollup_feedback", None),
+                ("SELECT category, item_count FROM rollup_categories", None)
+            ])
 
-            # 클래스별 오분류 통계
-            client.execute("""
-                SELECT predicted_class, COUNT(*) as count
-                FROM feedback
-                GROUP BY predicted_class
-            """)
+            # 전체 피드백 수
+            row = feedback_count.fetchone()
+            total_feedback = int(row[0]) if row else 0
 
             misclassification_data = {}
             categories = ["캔", "유리", "종이", "플라스틱", "스티로폼", "비닐"]
@@ -93,20 +104,14 @@ async def get_feedback_stats():
                 }
 
             # 오분류 카운트
-            for row in client.fetchall():
+            for row in errors.fetchall():
                 predicted = row[0]
                 error_count = int(row[1])
                 if predicted in misclassification_data:
                     misclassification_data[predicted]["errors"] = error_count
 
-            # 각 클래스의 전체 예측 수 (detected_items에서)
-            client.execute("""
-                SELECT category, COUNT(*) as count
-                FROM detected_items
-                GROUP BY category
-            """)
-
-            for row in client.fetchall():
+            # 각 클래스의 전체 예측 수 (카테고리별 집계에서)
+            for row in predictions.fetchall():
                 category = row[0]
                 total_count = int(row[1])
                 if category in misclassification_data:
@@ -2,12 +2,15 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 import os
+import logging
 import requests
 from dotenv import load_dotenv
 
 # 환경 변수 로드
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["geocoding"])
 
 # 환경 변수에서 네이버 API 키 가져오기
@@ -47,13 +50,12 @@ async def reverse_geocode(data: ReverseGeocodeRequest):
             "x-ncp-apigw-api-key": NAVER_CLIENT_SECRET
         }
 
-        print(f"[DEBUG] 네이버 API 호출: {url}")
-        print(f"[DEBUG] 헤더: {headers}")
+        # API 키가 담긴 헤더는 로그에 남기지 않음
+        logger.debug("네이버 API 호출: %s", url)
 
         response = requests.get(url, headers=headers, timeout=10)
 
-        print(f"[DEBUG] 응답 상태: {response.status_code}")
-        print(f"[DEBUG] 응답 내용: {response.text}")
+        logger.debug("응답 상태: %s, 응답 내용: %s", response.status_code, response.text)
 
         if response.status_code != 200:
             raise HTTPException(status_code=response.status_code, detail=f"네이버 API 오류: {response.text}")
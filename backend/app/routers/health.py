@@ -1,6 +1,13 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from ..model_loader import loader
 router = APIRouter(tags=["system"])
 
 @router.get("/health")
 def health():
     return {"status": "ok"}
+
+# 모델 준비 상태 (로드 완료 전에는 503, 로드/워밍업 소요 시간 포함)
+@router.get("/ready")
+def ready():
+    return JSONResponse(status_code=200 if loader.ready else 503, content=loader.status())
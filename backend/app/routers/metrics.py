@@ -0,0 +1,13 @@
+# Prometheus 지표 조회 API
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from ..metrics import INFERENCE_QUEUE_DEPTH
+from ..model_loader import loader
+
+router = APIRouter(tags=["system"])
+
+# 단계별 지연 히스토그램 / 박스 수 / 대기열 길이 / Turso 호출 시간
+@router.get("/metrics")
+def metrics():
+    INFERENCE_QUEUE_DEPTH.set(loader.scheduler.queue_depth if loader.ready else 0)
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
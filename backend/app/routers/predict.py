@@ -1,45 +1,288 @@
-from fastapi import APIRouter, UploadFile, File, Form
-import os, tempfile
-from training.pipeline import YOLOResNetPipeline
-from typing import Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, WebSocket, WebSocketDisconnect
+from starlette.concurrency import run_in_threadpool
+from starlette.websockets import WebSocketState
+import asyncio
+import logging
+import os
+import time
+from PIL import Image
+from training.image_io import decode_image, image_size
+from typing import List, Optional
+from ..model_loader import loader, InferenceQueueFull, ModelNotReady
+from ..result_cache import RESULT_CACHE_ENABLED, ResultCache, dhash
+from ..metrics import STAGE_SECONDS, timed
 
 router = APIRouter(tags=["predict"])
+logger = logging.getLogger(__name__)
 
-# 파이프라인 전역 변수 (서버 시작 시 한 번만 로드)
-pipeline = YOLOResNetPipeline()
+# 다중 이미지 배치 요청 제한
+PREDICT_BATCH_MAX_FILES = int(os.getenv("PREDICT_BATCH_MAX_FILES", "10"))  # 요청당 최대 파일 수
+PREDICT_BATCH_MAX_PIXELS = int(os.getenv("PREDICT_BATCH_MAX_PIXELS", "50000000"))  # 요청당 전체 픽셀 수 한도
+
+# 파이프라인 / 실행기 / 스케줄러는 loader가 한 번만 생성 (MODEL_LOAD_MODE 참고)
+# 실시간 프레임 결과 캐시 (거의 같은 연속 프레임은 추론 생략)
+result_cache = ResultCache()
+
+# 이미지 디코딩 + (실시간 캐시용) perceptual hash 계산
+def decode_and_hash(image_bytes, with_hash):
+    with timed("decode"):
+        image = decode_image(image_bytes)
+    if image is None or not with_hash:
+        return image, None
+    return image, dhash(image)
+
+# 업로드를 차례로 디코딩하며 전체 픽셀 수 제한 -> (이미지 리스트, 누적 픽셀 수)
+def decode_within_limit(payloads, max_pixels):
+    """
+    헤더에서 읽은 크기로 먼저 합산해 한도를 넘으면 아무것도 디코딩하지 않음
+    헤더를 읽을 수 없는 이미지는 디코딩 직후 합산, 한도를 넘는 즉시 중단 (이미지 리스트 None)
+    """
+    total_pixels = 0
+    try:
+        sizes = [image_size(payload) for payload in payloads]
+    except Image.DecompressionBombError:
+        # 한 장이 Pillow 한도의 2배를 넘음 -> 디코딩하지 않고 거절
+        return None, total_pixels
+    for size in sizes:
+        if size is not None:
+            total_pixels += size[0] * size[1]
+            if total_pixels > max_pixels:
+                return None, total_pixels
+
+    images = []
+    for payload, size in zip(payloads, sizes):
+        image = decode_and_hash(payload, False)[0]
+        if image is not None and size is None:
+            total_pixels += image.shape[0] * image.shape[1]
+            if total_pixels > max_pixels:
+                return None, total_pixels
+        images.append(image)
+    return images, total_pixels
+
+# 업로드 바이트 -> YOLO + ResNet 결과 (HTTP / WebSocket 공용)
+async def run_inference(image_bytes, is_realtime, session_key):
+    """모델 준비 전이면 ModelNotReady, 대기열이 가득 차면 InferenceQueueFull 발생"""
+    # 모델 준비 확인 (lazy 모드는 첫 요청에서 로드)
+    models = loader if loader.ready else await run_in_threadpool(loader.require_ready)
+    use_cache = is_realtime and RESULT_CACHE_ENABLED
+
+    # 업로드 바이트를 메모리에서 한 번만 디코딩 (임시 파일 없음)
+    # (추론 워커와 이벤트 루프를 막지 않도록 디코딩은 짧게 스레드 풀에서 처리)
+    image, frame_hash = await run_in_threadpool(decode_and_hash, image_bytes, use_cache)
+
+    # 파이프라인 실행: YOLO 객체 탐지 + ResNet 분류
+    cached = result_cache.get(session_key, frame_hash) if frame_hash is not None else None
+    if image is None:
+        # 디코딩 실패 시 기존과 동일하게 빈 결과 반환
+        logger.warning("[디코딩 실패] 이미지를 로드할 수 없습니다!")
+        return []
+    if cached is not None:
+        # 직전 프레임과 거의 같으면 캐시된 결과 재사용
+        logger.debug("[캐시 적중] 이전 프레임 결과 재사용")
+        return cached
+
+    logger.debug("[객체 탐지] AI 모델 실행 시작... (이미지 크기: %s)", "640" if is_realtime else "1280")
+    # 다른 요청과 함께 배치로 묶여 처리될 때까지 대기 (이벤트 루프는 막지 않음)
+    # 실시간 모드는 세션별로 객체를 추적하여 새 객체만 분류
+    # (inference: 대기열 대기 + 배치 추론, 세부 단계는 실행기에서 yolo/preprocess/resnet으로 기록)
+    started = time.perf_counter()
+    future = models.scheduler.submit(image, fast_mode=is_realtime, track_key=session_key if is_realtime else None)
+    detected_objects = await asyncio.wrap_future(future)
+    STAGE_SECONDS.labels("inference").observe(time.perf_counter() - started)
+    if frame_hash is not None:
+        result_cache.put(session_key, frame_hash, detected_objects)
+    return detected_objects
 
 # 재활용품 이미지 분류 API
 @router.post("/predict")
-def predict(
+async def predict(
+    request: Request,
     file: UploadFile = File(...),  # FormData 키 이름 : file
-    mode: Optional[str] = Form(None)  # mode: "realtime" 또는 None(일반 업로드)
+    mode: Optional[str] = Form(None),  # mode: "realtime" 또는 None(일반 업로드)
+    session_id: Optional[str] = Form(None),  # 실시간 캐시 범위 (없으면 클라이언트 IP)
+    response_format: Optional[str] = Form(None)  # "full" 또는 "compact" (기본: 실시간은 compact)
 ):
     is_realtime = mode == "realtime"
-    print(f"\n{'='*50}")
-    print(f"[새 요청] 파일명: {file.filename}, 모드: {'실시간' if is_realtime else '일반 업로드'}")
+    # 간결한 응답: 클래스 ID / bbox / 신뢰도만 (카테고리·배출 방법은 GET /catalog)
+    compact = (response_format or ("compact" if is_realtime else "full")) == "compact"
+    started = time.perf_counter()
+    logger.info("[새 요청] 파일명: %s, 모드: %s", file.filename, "실시간" if is_realtime else "일반 업로드")
+
+    session_key = session_id or (request.client.host if request.client else "")
+    with timed("upload_read"):
+        image_bytes = await file.read()
+    try:
+        detected_objects = await run_inference(image_bytes, is_realtime, session_key)
+    except (InferenceQueueFull, ModelNotReady) as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    logger.debug("[탐지 결과] %d개 객체 탐지됨", len(detected_objects))
+
+    # API 응답 포맷 생성
+    with timed("format"):
+        if compact:
+            api_response = loader.pipeline.format_compact_response(detected_objects)
+        else:
+            api_response = loader.pipeline.format_recycling_response(detected_objects)
+    logger.info("[분류 완료] 분류 성공: %d개, 실패: %d개", api_response["classified_items"], api_response["unclassified_items"])
 
-    # 임시 파일로 저장 (처리 후 자동 삭제)
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-        tmp.write(file.file.read())
-        tmp_path = tmp.name
-        print(f"[임시 저장] {tmp_path}")
+    STAGE_SECONDS.labels("total").observe(time.perf_counter() - started)
+    return api_response
+
+# 여러 이미지 일괄 분류 API (YOLO 배치 1회 + 전체 crop ResNet 배치 1회)
+@router.post("/predict/batch")
+async def predict_batch(
+    files: List[UploadFile] = File(...)  # FormData 키 이름 : files (여러 개)
+):
+    logger.info("[배치 요청] 파일 %d개", len(files))
+    if len(files) > PREDICT_BATCH_MAX_FILES:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {PREDICT_BATCH_MAX_FILES}개 파일까지 업로드할 수 있습니다.")
 
     try:
-        # 파이프라인 실행: YOLO 객체 탐지 + ResNet 분류
-        print(f"[객체 탐지] AI 모델 실행 시작... (이미지 크기: {'640' if is_realtime else '1280'})")
-        detected_objects = pipeline.process_object(tmp_path, fast_mode=is_realtime)
-        print(f"[탐지 결과] {len(detected_objects)}개 객체 탐지됨")
+        models = loader if loader.ready else await run_in_threadpool(loader.require_ready)
+    except ModelNotReady as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    # 전체 픽셀 수를 확인하며 업로드 디코딩 (스레드 풀에서 한 번에, 한도 초과 이미지는 디코딩 전에 거절)
+    with timed("upload_read"):
+        payloads = [await file.read() for file in files]
+    images, total_pixels = await run_in_threadpool(decode_within_limit, payloads, PREDICT_BATCH_MAX_PIXELS)
+    if images is None:
+        raise HTTPException(status_code=413, detail=f"전체 이미지 크기가 너무 큽니다 ({total_pixels} > {PREDICT_BATCH_MAX_PIXELS} 픽셀)")
 
-        # API 응답 포맷 생성
-        api_response = pipeline.format_recycling_response(detected_objects)
-        print(f"[분류 완료] 분류 성공: {api_response['classified_items']}개, 실패: {api_response['unclassified_items']}개")
-        print(f"[요약] {api_response['summary']}")
-        print(f"{'='*50}\n")
+    # 디코딩에 성공한 이미지만 한 배치로 추론 (실패한 이미지는 빈 결과)
+    valid_images = [image for image in images if image is not None]
+    batch_results = []
+    if valid_images:
+        try:
+            future = models.scheduler.submit_many(valid_images, fast_mode=False)
+        except InferenceQueueFull as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        batch_results = await asyncio.wrap_future(future)
 
-        return api_response
+    # 원래 순서대로 이미지별 응답 생성
+    batch_iter = iter(batch_results)
+    results = []
+    with timed("format"):
+        for file, image in zip(files, images):
+            detected_objects = next(batch_iter) if image is not None else []
+            api_response = models.pipeline.format_recycling_response(detected_objects)
+            api_response["filename"] = file.filename
+            results.append(api_response)
+            logger.debug("[분류 완료] %s: %s", file.filename, api_response["summary"])
 
+    return {
+        "status": "success",
+        "total_images": len(results),
+        "results": results
+    }
+
+# 바이너리가 아닌 프레임을 받았을 때 닫는 코드 (1003: unsupported data)
+WS_UNSUPPORTED_DATA = 1003
+
+# WebSocket 결과 전송 (이미 닫힌 연결이면 보내지 않고 False)
+async def send_ws_json(websocket, payload):
+    if websocket.client_state != WebSocketState.CONNECTED or websocket.application_state != WebSocketState.CONNECTED:
+        return False
+    try:
+        await websocket.send_json(payload)
+        return True
+    except (WebSocketDisconnect, RuntimeError):
+        # 전송 중 클라이언트가 끊은 경우
+        return False
+
+# 실시간 웹캠 스트리밍 (바이너리 JPEG 프레임 수신 -> 간결한 결과 전송)
+# 추론보다 프레임이 빨리 오면 대기 중인 프레임은 최신 1장만 남기고 버림
+# 텍스트 프레임은 오류 메시지 전송 후 1003으로 연결 종료
+@router.websocket("/predict/ws")
+async def predict_stream(websocket: WebSocket):
+    await websocket.accept()
+    session_key = websocket.query_params.get("session_id") or (websocket.client.host if websocket.client else "")
+    logger.info("[WebSocket 연결] 세션: %s", session_key)
+
+    # 연결별 대기 프레임 (최신 1장) 과 상태
+    state = {"frame": None, "seq": 0, "dropped": 0}
+    frame_ready = asyncio.Event()
+
+    # 프레임 수신 (처리 중에도 계속 받아서 최신 프레임으로 교체)
+    async def receive_frames():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            frame = message.get("bytes")
+            if frame is None:
+                # 텍스트 프레임: 바이너리 JPEG만 지원
+                logger.warning("[WebSocket] 바이너리가 아닌 프레임 수신, 연결 종료 (세션: %s)", session_key)
+                await send_ws_json(websocket, {"status": "error", "detail": "바이너리 JPEG 프레임만 지원합니다."})
+                await websocket.close(code=WS_UNSUPPORTED_DATA)
+                return
+            if state["frame"] is not None:
+                state["dropped"] += 1
+            state["frame"] = frame
+            state["seq"] += 1
+            frame_ready.set()
+
+    receiver = asyncio.create_task(receive_frames())
+    try:
+        while True:
+            # 새 프레임 또는 연결 종료까지 대기
+            waiter = asyncio.create_task(frame_ready.wait())
+            done, _ = await asyncio.wait({receiver, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                waiter.cancel()
+                receiver.result()  # 연결 종료 예외 전달 (텍스트 프레임이면 이미 닫힘)
+                break
+
+            frame, seq = state["frame"], state["seq"]
+            state["frame"] = None
+            frame_ready.clear()
+
+            try:
+                detected_objects = await run_inference(frame, True, session_key)
+            except InferenceQueueFull:
+                # 서버가 바쁘면 이 프레임은 건너뛰고 다음 최신 프레임 처리
+                if not await send_ws_json(websocket, {"status": "busy", "frame": seq}):
+                    break
+                continue
+            except ModelNotReady:
+                # 모델 로딩 중
+                if not await send_ws_json(websocket, {"status": "loading", "frame": seq}):
+                    break
+                continue
+
+            with timed("format"):
+                response = loader.pipeline.format_compact_response(detected_objects)
+            response["frame"] = seq
+            response["dropped"] = state["dropped"]
+            # 추론 중에 연결이 끊겼으면 종료
+            if not await send_ws_json(websocket, response):
+                break
+    except WebSocketDisconnect:
+        pass
     finally:
-        # 임시 파일 삭제
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-            print(f"[임시 파일 삭제] {tmp_path}")
\ No newline at end of file
+        receiver.cancel()
+        logger.info("[WebSocket 종료] 세션: %s, 버린 프레임: %d개", session_key, state["dropped"])
+
+# 실시간 결과 캐시 적중률 조회 (임계값 조정용)
+@router.get("/predict/cache/stats")
+def cache_stats():
+    return result_cache.stats()
+
+# crop 필터 제거 사유별 누적 카운터 (thread 실행기 기준, process 실행기는 워커별로 집계됨)
+@router.get("/predict/filter/stats")
+def filter_stats():
+    if not loader.ready or loader.pipeline.crop_filter is None:
+        return {"enabled": loader.ready and loader.pipeline.crop_filter is not None}
+    return {"enabled": True, **loader.pipeline.crop_filter.stats()}
+
+# cascade 분류 조기 종료 비율 (thread 실행기 기준, process 실행기는 워커별로 집계됨)
+@router.get("/predict/cascade/stats")
+def cascade_stats():
+    if not loader.ready or not loader.pipeline.cascade_enabled:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "size": loader.pipeline.cascade_size,
+        "threshold": loader.pipeline.cascade_threshold,
+        **loader.pipeline.cascade_stats()
+    }
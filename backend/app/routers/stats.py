@@ -1,15 +1,16 @@
 # 통계 API 라우터
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import List
-from datetime import datetime
-import sys
-import os
+from typing import List, Optional
+import uuid
 
-# 데이터베이스 모듈 import
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from database import get_db
+# 데이터베이스 모듈 import (app.database 하나만 로드되어야 연결 풀을 공유)
+# async 라우터는 비동기 클라이언트 사용 (DB 왕복 동안 이벤트 루프를 막지 않음)
+from ..database import get_async_db
+from ..records import analysis_record, analysis_statements
+from ..write_behind import WRITE_BEHIND_ENABLED, SpoolFull, WriteBehindNotRunning, write_behind
 
 router = APIRouter(tags=["stats"])
 
@@ -24,9 +25,11 @@ class AnalysisRequest(BaseModel):
 
 # 분석 결과 저장
 @router.post("/api/stats")
-async def save_analysis(data: AnalysisRequest):
+async def save_analysis(data: AnalysisRequest, idempotency_key: Optional[str] = Header(None)):
     """
     분석 결과를 데이터베이스에 저장
+    (write-behind 사용 시 로컬 스풀에 접수 후 202 응답, Turso 적재는 백그라운드에서)
+    같은 Idempotency-Key 헤더로 다시 보내면 한 번만 저장
 
     요청 예시:
     {
@@ -41,25 +44,26 @@ async def save_analysis(data: AnalysisRequest):
         ]
     }
     """
-    try:
-        with get_db() as client:
-            # 분석 기록 저장
-            client.execute("""
-                INSERT INTO analysis_records (timestamp, total_items)
-                VALUES (?, ?)
-            """, [datetime.now().isoformat(), data.classified_items])
-
-            analysis_id = client.lastrowid
-
-            # 탐지된 항목들 저장
-            for item in data.recycling_items:
-                category = item["recycling_info"]["category"]
-                confidence = item["recycling_info"]["confidence"]
+    record = analysis_record(data)
+
+    # 로컬 스풀에 접수하고 바로 응답 (Turso가 느리거나 끊겨도 요청은 실패하지 않음)
+    if WRITE_BEHIND_ENABLED:
+        try:
+            key = await write_behind.submit("analysis", record, idempotency_key)
+        except (SpoolFull, WriteBehindNotRunning) as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+        return JSONResponse(status_code=202, content={
+            "status": "success",
+            "message": "분석 결과가 접수되었습니다.",
+            "idempotency_key": key
+        })
 
-                client.execute("""
-                    INSERT INTO detected_items (analysis_id, category, confidence)
-                    VALUES (?, ?, ?)
-                """, [analysis_id, category, confidence])
+    try:
+        async with get_async_db() as client:
+            # 분석 기록 + 탐지된 항목들을 트랜잭션 하나로 저장 (HTTP 요청 1회)
+            key = idempotency_key or uuid.uuid4().hex
+            results = await client.execute_batch(analysis_statements(record, key))
+            analysis_id = results[1].lastrowid
 
             return {
                 "status": "success",
@@ -88,26 +92,17 @@ async def get_stats():
     }
     """
     try:
-        with get_db() as client:
-            # 총 분석 횟수
-            client.execute("SELECT COUNT(*) FROM analysis_records")
-            total_analyses = int(client.fetchone()[0])
-
-            # 총 탐지 항목 수
-            client.execute("SELECT COUNT(*) FROM detected_items")
-            total_items = int(client.fetchone()[0])
-
-            # 평균 신뢰도 (정확도)
-            client.execute("SELECT AVG(confidence) FROM detected_items")
-            avg_confidence = client.fetchone()[0]
-            avg_accuracy = round(float(avg_confidence) * 100, 1) if avg_confidence else 0
-
-            # 카테고리별 개수
-            client.execute("""
-                SELECT category, COUNT(*) as count
-                FROM detected_items
-                GROUP BY category
-            """)
+        async with get_async_db() as client:
+            # 전체 합계 / 카테고리별 개수 (집계 테이블, 카테고리 수만큼의 행만 읽음, HTTP 요청 1회)
+            totals, categories = await client.execute_reads([
+                ("SELECT total_analyses, total_items, confidence_sum FROM rollup_totals WHERE id = 1", None),
+                ("SELECT category, item_count FROM rollup_categories", None)
+            ])
+
+            # 총 분석 횟수 / 총 탐지 항목 수 / 평균 신뢰도 (정확도)
+            row = totals.fetchone()
+            total_analyses, total_items, confidence_sum = (int(row[0]), int(row[1]), float(row[2])) if row else (0, 0, 0.0)
+            avg_accuracy = round(confidence_sum / total_items * 100, 1) if total_items else 0
 
             category_counts = {
                 "캔": 0,
@@ -118,7 +113,7 @@ async def get_stats():
                 "비닐": 0
             }
 
-            for row in client.fetchall():
+            for row in categories.fetchall():
                 category_counts[row[0]] = int(row[1])
 
             return {
@@ -145,45 +140,37 @@ async def get_daily_stats(days: int = 7):
     - days=30: 전체 분석 횟수만
     """
     try:
-        with get_db() as client:
-            # days=1이면 오늘만, days>1이면 (days-1)일 전부터
+        async with get_async_db() as client:
+            # days=1이면 오늘만, days>1이면 (days-1)일 전부터 (일별 집계 테이블, 일수 x 카테고리 수만큼의 행)
             adjusted_days = 0 if days == 1 else days - 1
 
             if days == 30:
                 # 한달: 전체 분석 횟수만
-                client.execute("""
-                    SELECT
-                        DATE(created_at) as date,
-                        COUNT(*) as analyses
-                    FROM analysis_records
-                    WHERE created_at >= DATE('now', '-' || ? || ' days')
-                    GROUP BY DATE(created_at)
+                result = await client.execute("""
+                    SELECT date, analyses
+                    FROM rollup_daily
+                    WHERE date >= DATE('now', '-' || ? || ' days')
                     ORDER BY date DESC
                 """, [adjusted_days])
 
                 daily_data = []
-                for row in client.fetchall():
+                for row in result.fetchall():
                     daily_data.append({
                         "date": row[0],
                         "total_analyses": int(row[1])
                     })
             else:
                 # 하루/일주일: 클래스별 통계
-                client.execute("""
-                    SELECT
-                        DATE(ar.created_at) as date,
-                        di.category,
-                        COUNT(di.id) as count
-                    FROM analysis_records ar
-                    JOIN detected_items di ON ar.id = di.analysis_id
-                    WHERE ar.created_at >= DATE('now', '-' || ? || ' days')
-                    GROUP BY DATE(ar.created_at), di.category
+                result = await client.execute("""
+                    SELECT date, category, item_count
+                    FROM rollup_daily_categories
+                    WHERE date >= DATE('now', '-' || ? || ' days')
                     ORDER BY date DESC
                 """, [adjusted_days])
 
                 # 날짜별로 데이터 구조화
                 daily_data_dict = {}
-                for row in client.fetchall():
+                for row in result.fetchall():
                     date = row[0]
                     category = row[1]
                     count = int(row[2])
@@ -208,3 +195,8 @@ async def get_daily_stats(days: int = 7):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"일별 통계 조회 오류: {str(e)}")
+
+# write-behind 적재 상태 조회 (대기 기록 수, 적재 지연, 보류 기록 수)
+@router.get("/api/ingest/stats")
+async def get_ingest_stats():
+    return await write_behind.status()
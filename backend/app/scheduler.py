@@ -0,0 +1,151 @@
+# 추론 요청 마이크로 배치 스케줄러
+# 동시에 들어온 /predict 요청을 모아 YOLO 배치 1회 + ResNet 배치 1회로 처리
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from .model_loader import InferenceQueueFull
+
+# 배치 설정 (환경 변수로 조정)
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "8"))  # 한 번에 묶을 최대 이미지 수
+BATCH_MAX_WAIT_MS = float(os.getenv("BATCH_MAX_WAIT_MS", "10"))  # 첫 요청 이후 최대 대기 시간
+
+# 요청 Future에 결과 / 예외 전달 (호출자가 취소해 이미 끝난 Future는 건너뜀)
+def _resolve(future, result=None, exception=None):
+    if future.done():
+        return
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        # 확인 직후 취소된 경우
+        pass
+
+class InferenceScheduler:
+    """요청을 큐에 모았다가 max_batch_size 또는 max_wait_ms 도달 시 한 번에 추론"""
+
+    def __init__(self, executor, max_batch_size=BATCH_MAX_SIZE, max_wait_ms=BATCH_MAX_WAIT_MS):
+        self.executor = executor
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000
+        self.queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        # 대기 + 실행 중 요청 수 제한 (가득 차면 즉시 거절)
+        self._pending_slots = threading.BoundedSemaphore(executor.max_pending)
+        # 비어 있는 추론 워커 수 (워커가 바쁜 동안 요청이 큐에 쌓여 더 큰 배치가 됨)
+        self._free_workers = threading.Semaphore(executor.workers)
+
+    # 배치 처리 스레드 시작 (최초 요청 시 한 번만)
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="inference-scheduler", daemon=True)
+                self._thread.start()
+
+    # 이미지 1장 추론 요청 (결과: process_object와 같은 yolo_results, track_key: 실시간 추적 세션)
+    def submit(self, image, fast_mode=False, track_key=None):
+        return self._enqueue([image], fast_mode, [track_key], single=True)
+
+    # 여러 이미지를 나누지 않고 한 배치로 추론 요청 (결과: 이미지별 yolo_results 리스트)
+    def submit_many(self, images, fast_mode=False):
+        return self._enqueue(list(images), fast_mode, [None] * len(images), single=False)
+
+    def _enqueue(self, images, fast_mode, track_keys, single):
+        self.start()
+        # 이미지 수만큼 대기 슬롯 확보 (모자라면 확보한 슬롯 반환 후 거절)
+        acquired = 0
+        while acquired < len(images) and self._pending_slots.acquire(blocking=False):
+            acquired += 1
+        if acquired < len(images):
+            for _ in range(acquired):
+                self._pending_slots.release()
+            raise InferenceQueueFull(f"추론 대기열이 가득 찼습니다 (최대 {self.executor.max_pending}건)")
+
+        future = Future()
+        def release_slots(_):
+            for _ in range(len(images)):
+                self._pending_slots.release()
+        future.add_done_callback(release_slots)
+        self.queue.put((images, fast_mode, track_keys, future, single))
+        return future
+
+    # 현재 대기 중인 요청 수
+    @property
+    def queue_depth(self):
+        return self.queue.qsize()
+
+    # 배치 수집 루프
+    def _run(self):
+        while True:
+            # 추론 워커가 빌 때까지 대기
+            self._free_workers.acquire()
+            # 첫 요청이 올 때까지 대기
+            batch = [self.queue.get()]
+            batch_size = len(batch[0][0])
+            deadline = time.monotonic() + self.max_wait
+
+            # 최대 크기(이미지 수) 또는 최대 대기 시간까지 추가 요청 수집
+            while batch_size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+                batch_size += len(batch[-1][0])
+
+            self._process(batch)
+
+    # 모드별로 묶어서 실행기에 배치 추론 제출 (모드마다 imgsz/conf가 다름)
+    def _process(self, batch):
+        groups = {}
+        for item in batch:
+            groups.setdefault(item[1], []).append(item)
+
+        # 모든 그룹이 끝나면 워커 반환
+        remaining = [len(groups)]
+        remaining_lock = threading.Lock()
+
+        def release_worker():
+            with remaining_lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    self._free_workers.release()
+
+        for fast_mode, items in groups.items():
+            futures = [future for _, _, _, future, _ in items]
+
+            # 배치 결과를 요청별 Future로 분배 (요청마다 자기 이미지 수만큼 잘라서)
+            def distribute(batch_future, items=items, futures=futures):
+                try:
+                    results = batch_future.result()
+                except Exception as e:
+                    for future in futures:
+                        _resolve(future, exception=e)
+                else:
+                    offset = 0
+                    for images, _, _, future, single in items:
+                        item_results = results[offset:offset + len(images)]
+                        offset += len(images)
+                        _resolve(future, item_results[0] if single else item_results)
+                finally:
+                    release_worker()
+
+            try:
+                batch_future = self.executor.submit_batch(
+                    [image for images, _, _, _, _ in items for image in images],
+                    fast_mode=fast_mode,
+                    track_keys=[track_key for _, _, track_keys, _, _ in items for track_key in track_keys]
+                )
+            except Exception as e:
+                for future in futures:
+                    _resolve(future, exception=e)
+                release_worker()
+                continue
+            batch_future.add_done_callback(distribute)
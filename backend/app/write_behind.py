@@ -0,0 +1,282 @@
+# 통계 / 피드백 write-behind 적재
+# 요청은 로컬 SQLite(WAL) 스풀에 기록 후 바로 응답하고,
+# 백그라운드 작업이 모아서 Turso에 트랜잭션 1회로 적재 (실패 시 지수 백오프 재시도)
+# 여러 uvicorn 워커가 같은 스풀을 공유해도 멱등성 키로 중복 적재 방지
+#
+# 스풀 파일은 재배포 후에도 남는 디스크(볼륨)에 있어야 함 (컨테이너 임시 파일시스템이면 대기 기록 유실)
+# -> 기본은 꺼짐(직접 Turso 적재), WRITE_BEHIND_ENABLED=1로 켤 때
+#    WRITE_BEHIND_SPOOL_PATH 또는 Railway 볼륨(RAILWAY_VOLUME_MOUNT_PATH)이 없으면 서버 시작 거부
+
+import asyncio
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from starlette.concurrency import run_in_threadpool
+from .database import TursoConnectionError, get_async_db
+from .metrics import WRITE_BEHIND_DEPTH, WRITE_BEHIND_FLUSHED, WRITE_BEHIND_FLUSH_ERRORS, WRITE_BEHIND_FLUSH_LAG
+from .records import ingest_key_prune_statement, record_statements
+
+# write-behind 설정 (환경 변수로 조정)
+# 볼륨이 없는 기존 배포가 시작 거부로 멈추지 않도록 기본은 꺼짐
+WRITE_BEHIND_ENABLED = os.getenv("WRITE_BEHIND_ENABLED", "0") == "1"
+# 스풀 파일 경로 (미설정 시 Railway 볼륨 아래, 둘 다 없으면 None -> 시작 거부)
+WRITE_BEHIND_SPOOL_PATH = os.getenv("WRITE_BEHIND_SPOOL_PATH") or (
+    os.path.join(os.getenv("RAILWAY_VOLUME_MOUNT_PATH"), "write_behind.sqlite3")
+    if os.getenv("RAILWAY_VOLUME_MOUNT_PATH") else None
+)
+WRITE_BEHIND_MAX_PENDING = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "10000"))  # 스풀 최대 대기 기록 수 (넘으면 503)
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "100"))  # 적재 1회당 최대 기록 수
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "1.0"))  # 적재 주기 (초)
+WRITE_BEHIND_RETRY_BASE = float(os.getenv("WRITE_BEHIND_RETRY_BASE", "1.0"))  # 재시도 대기 시작값 (초)
+WRITE_BEHIND_RETRY_MAX = float(os.getenv("WRITE_BEHIND_RETRY_MAX", "300"))  # 재시도 대기 최대값 (초)
+WRITE_BEHIND_MAX_ATTEMPTS = int(os.getenv("WRITE_BEHIND_MAX_ATTEMPTS", "20"))  # SQL 오류 기록은 이 횟수 후 보류(dead)
+INGEST_KEY_PRUNE_INTERVAL = float(os.getenv("INGEST_KEY_PRUNE_INTERVAL", "3600"))  # 만료된 멱등성 키 정리 주기 (초)
+
+logger = logging.getLogger(__name__)
+
+# 스풀이 가득 찼을 때 발생하는 예외
+class SpoolFull(Exception):
+    pass
+
+# start() 전에 접수하려 할 때 발생하는 예외
+class WriteBehindNotRunning(Exception):
+    pass
+
+class Spool:
+    """로컬 SQLite WAL 스풀 (프로세스가 죽어도 접수된 기록 유지)"""
+
+    def __init__(self, path=WRITE_BEHIND_SPOOL_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        # WAL + synchronous=NORMAL: 커밋마다 fsync 없이도 프로세스 종료에 안전
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS spool (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                dead INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (kind, key)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS spool_due ON spool (dead, next_attempt_at, id)")
+
+    # 기록 추가 (같은 종류 + 키가 이미 있으면 무시) -> 새로 추가되었는지
+    def append(self, key, kind, record):
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO spool (key, kind, payload, created_at) VALUES (?, ?, ?, ?)",
+                (key, kind, json.dumps(record, ensure_ascii=False), time.time())
+            )
+            return cursor.rowcount == 1
+
+    # 적재할 차례가 된 기록 (오래된 순), 가져간 기록은 lease초 동안 다른 워커가 가져가지 않음
+    def due(self, limit, lease=60.0):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT id, key, kind, payload, attempts FROM spool WHERE dead = 0 AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                    (now, limit)
+                ).fetchall()
+                self._conn.executemany("UPDATE spool SET next_attempt_at = ? WHERE id = ?", [(now + lease, row[0]) for row in rows])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [
+            {"id": row[0], "key": row[1], "kind": row[2], "record": json.loads(row[3]), "attempts": row[4]}
+            for row in rows
+        ]
+
+    # 적재 완료된 기록 삭제
+    def remove(self, ids):
+        with self._lock:
+            self._conn.executemany("DELETE FROM spool WHERE id = ?", [(record_id,) for record_id in ids])
+
+    # 적재 실패 기록: 지수 백오프 후 재시도 (dead=True면 재시도 중단, 스풀에 보관)
+    def retry_later(self, entries, error, dead=False):
+        now = time.time()
+        with self._lock:
+            for entry in entries:
+                attempts = entry["attempts"] + 1
+                delay = min(WRITE_BEHIND_RETRY_MAX, WRITE_BEHIND_RETRY_BASE * (2 ** (attempts - 1)))
+                delay *= random.uniform(0.5, 1.0)  # 여러 워커가 동시에 재시도하지 않도록
+                self._conn.execute(
+                    "UPDATE spool SET attempts = ?, next_attempt_at = ?, last_error = ?, dead = ? WHERE id = ?",
+                    (attempts, now + delay, str(error)[:500], int(dead), entry["id"])
+                )
+
+    # 대기 기록 수 / 가장 오래된 대기 기록의 나이(초) / 보류 기록 수
+    def stats(self):
+        with self._lock:
+            depth, oldest = self._conn.execute("SELECT COUNT(*), MIN(created_at) FROM spool WHERE dead = 0").fetchone()
+            dead = self._conn.execute("SELECT COUNT(*) FROM spool WHERE dead = 1").fetchone()[0]
+        return {
+            "depth": depth,
+            "lag_sec": round(time.time() - oldest, 3) if oldest else 0.0,
+            "dead": dead
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class WriteBehind:
+    """접수(append) -> 스풀 -> 백그라운드 적재(flush) 관리"""
+
+    def __init__(self, spool_path=WRITE_BEHIND_SPOOL_PATH, max_pending=WRITE_BEHIND_MAX_PENDING,
+                 batch_size=WRITE_BEHIND_BATCH_SIZE, flush_interval=WRITE_BEHIND_FLUSH_INTERVAL):
+        self.spool_path = spool_path
+        self.max_pending = max_pending
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.spool = None
+        self.depth = 0
+        self._task = None
+        self._wakeup = None
+        self._last_prune = 0.0
+
+    # 스풀 열기 + 백그라운드 적재 시작 (서버 시작 시 호출)
+    def start(self):
+        if not self.spool_path:
+            raise RuntimeError(
+                "WRITE_BEHIND_SPOOL_PATH가 없습니다. 재배포 후에도 남는 볼륨 경로를 지정하거나 "
+                "(Railway: 볼륨 연결 시 RAILWAY_VOLUME_MOUNT_PATH 자동 사용) WRITE_BEHIND_ENABLED=0으로 끄세요."
+            )
+        if self.spool is None:
+            self.spool = Spool(self.spool_path)
+        self.depth = self.spool.stats()["depth"]
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("[write-behind] 시작: 스풀 %s, 대기 %d건", self.spool_path, self.depth)
+
+    # 백그라운드 적재 중지 후 남은 기록 한 번 더 적재 시도 (서버 종료 시 호출)
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.spool is not None:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("[write-behind] 종료 전 적재 실패 (스풀에 보관, 다음 시작 시 적재): %s", e)
+            self.spool.close()
+            self.spool = None
+
+    # 기록 접수 (스풀에만 쓰고 바로 반환) -> 멱등성 키
+    async def submit(self, kind, record, key=None):
+        """스풀이 가득 차면 SpoolFull, start() 전이면 WriteBehindNotRunning"""
+        if self.spool is None:
+            raise WriteBehindNotRunning("저장 대기열이 아직 시작되지 않았습니다. 잠시 후 다시 시도해주세요.")
+        if self.depth >= self.max_pending:
+            raise SpoolFull(f"저장 대기열이 가득 찼습니다 (최대 {self.max_pending}건). 잠시 후 다시 시도해주세요.")
+        key = key or uuid.uuid4().hex
+        if await run_in_threadpool(self.spool.append, key, kind, record):
+            self.depth += 1
+            WRITE_BEHIND_DEPTH.set(self.depth)
+        # 모아서 보내도록 배치 크기가 찼을 때만 바로 깨움 (나머지는 주기마다)
+        if self.depth >= self.batch_size:
+            self._wakeup.set()
+        return key
+
+    # 백그라운드 적재 루프
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                # 한 번 깨어나면 적재할 기록이 없을 때까지 연속 적재
+                while await self.flush():
+                    pass
+            except Exception as e:
+                logger.exception("[write-behind] 적재 루프 오류: %s", e)
+            await self._prune_keys()
+
+    # 만료된 멱등성 키 정리 (INGEST_KEY_PRUNE_INTERVAL마다, 실패해도 다음 주기에 재시도)
+    async def _prune_keys(self):
+        if time.time() - self._last_prune < INGEST_KEY_PRUNE_INTERVAL:
+            return
+        self._last_prune = time.time()
+        try:
+            async with get_async_db() as client:
+                await client.execute(*ingest_key_prune_statement())
+        except Exception as e:
+            logger.warning("[write-behind] 멱등성 키 정리 실패: %s", e)
+
+    # 차례가 된 기록을 최대 batch_size개 적재 -> 적재한 기록 수
+    async def flush(self):
+        entries = await run_in_threadpool(self.spool.due, self.batch_size)
+        flushed = await self._flush_entries(entries) if entries else 0
+        await self._update_stats()
+        return flushed
+
+    # 기록들을 트랜잭션 1회로 적재, SQL 오류면 나눠서 문제 기록만 분리
+    async def _flush_entries(self, entries):
+        statements = [
+            statement
+            for entry in entries
+            for statement in record_statements(entry["kind"], entry["record"], entry["key"])
+        ]
+        try:
+            async with get_async_db() as client:
+                await client.execute_batch(statements)
+        except TursoConnectionError as e:
+            # 연결 / 일시적 서버 오류: 전체를 백오프 후 재시도
+            WRITE_BEHIND_FLUSH_ERRORS.labels("connection").inc()
+            logger.warning("[write-behind] Turso 연결 실패, %d건 재시도 예정: %s", len(entries), e)
+            await run_in_threadpool(self.spool.retry_later, entries, e)
+            return 0
+        except Exception as e:
+            WRITE_BEHIND_FLUSH_ERRORS.labels("statement").inc()
+            if len(entries) > 1:
+                # 어떤 기록이 문제인지 반씩 나눠서 다시 적재
+                middle = len(entries) // 2
+                return await self._flush_entries(entries[:middle]) + await self._flush_entries(entries[middle:])
+            entry = entries[0]
+            dead = entry["attempts"] + 1 >= WRITE_BEHIND_MAX_ATTEMPTS
+            logger.error("[write-behind] 기록 적재 실패 (키 %s, %d회%s): %s", entry["key"], entry["attempts"] + 1, ", 보류" if dead else "", e)
+            await run_in_threadpool(self.spool.retry_later, entries, e, dead)
+            return 0
+
+        await run_in_threadpool(self.spool.remove, [entry["id"] for entry in entries])
+        WRITE_BEHIND_FLUSHED.inc(len(entries))
+        return len(entries)
+
+    # 스풀 대기 수 / 적재 지연 지표 갱신
+    async def _update_stats(self):
+        stats = await run_in_threadpool(self.spool.stats)
+        self.depth = stats["depth"]
+        WRITE_BEHIND_DEPTH.set(stats["depth"])
+        WRITE_BEHIND_FLUSH_LAG.set(stats["lag_sec"])
+        return stats
+
+    # 상태 조회 (/api/ingest/stats)
+    async def status(self):
+        if self.spool is None:
+            return {"enabled": WRITE_BEHIND_ENABLED, "running": False}
+        return {"enabled": True, "running": self._task is not None, **(await self._update_stats())}
+
+# 서버 전역 write-behind
+write_behind = WriteBehind()
@@ -0,0 +1,31 @@
+# 테스트 공용 fixture
+
+import os
+import pytest
+
+backend_dir = os.path.dirname(os.path.dirname(__file__))
+models_dir = os.path.join(backend_dir, "models")
+
+# 모델 가중치가 없으면 테스트 건너뜀
+def require_weights(*names):
+    missing = [name for name in names if not os.path.exists(os.path.join(models_dir, name))]
+    if missing:
+        pytest.skip(f"모델 가중치 없음: {', '.join(missing)}")
+
+# 샘플 사진 (ultralytics 패키지에 포함된 bus.jpg)
+@pytest.fixture(scope="session")
+def sample_image():
+    cv = pytest.importorskip("cv2")
+    from ultralytics.utils import ASSETS
+    image = cv.imread(str(ASSETS / "bus.jpg"))
+    assert image is not None
+    return image
+
+# 테스트 전용 파이프라인 (서버와 상태를 공유하지 않음)
+@pytest.fixture(scope="session")
+def pipeline():
+    pytest.importorskip("torch")
+    pytest.importorskip("ultralytics")
+    require_weights("model_v4.pth", "yolo11s.pt")
+    from training.pipeline import YOLOResNetPipeline
+    return YOLOResNetPipeline(engine="torch")
@@ -0,0 +1,35 @@
+# ResNet 배치 분류 결과가 crop별 개별 분류 결과와 같은지 확인
+
+import pytest
+
+ATOL = 1e-5
+
+# crop을 하나씩 분류 (배치 크기 1과 동일)
+def classify_one_by_one(pipeline, crops):
+    return [pipeline.classify_tensors(pipeline.preprocess_crops([crop]))[0] for crop in crops]
+
+def assert_same_predictions(batched, per_crop):
+    assert len(batched) == len(per_crop)
+    for (batched_class, batched_conf), (single_class, single_conf) in zip(batched, per_crop):
+        assert batched_class == single_class
+        assert batched_conf == pytest.approx(single_conf, abs=ATOL)
+
+# YOLO가 실제로 검출한 박스의 crop
+def test_detected_crops_batched_matches_per_crop(pipeline, sample_image):
+    boxes = pipeline.process_object(sample_image, fast_mode=False)
+    assert boxes, "샘플 이미지에서 검출된 객체가 없습니다"
+    crops = [sample_image[y1:y2, x1:x2] for x1, y1, x2, y2 in (box["bbox"] for box in boxes)]
+
+    batched = [(box["resnet_class"], box["resnet_confidence"]) for box in boxes]
+    assert_same_predictions(batched, classify_one_by_one(pipeline, crops))
+
+# 크기가 제각각인 crop + 배치 크기보다 많은 crop (청크 경계 포함)
+def test_chunked_batches_match_per_crop(pipeline, sample_image):
+    height, width = sample_image.shape[:2]
+    crops = [
+        sample_image[(idx * 37) % (height // 2):(idx * 37) % (height // 2) + 40 + idx * 13,
+                     (idx * 53) % (width // 2):(idx * 53) % (width // 2) + 30 + idx * 17]
+        for idx in range(pipeline.resnet_batch_size + 5)
+    ]
+    batched = pipeline.classify_tensors(pipeline.preprocess_crops(crops))
+    assert_same_predictions(batched, classify_one_by_one(pipeline, crops))
@@ -0,0 +1,55 @@
+# torch / onnxruntime 추론 엔진 결과 동등성 (실제 사진 기준)
+
+import pytest
+from conftest import require_weights
+
+pytest.importorskip("torch")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("ultralytics")
+
+from training.engine import compare_detections
+
+# 비교 함수 자체 확인 (가중치 없이)
+def test_compare_detections_flags_confidence_and_box_drift():
+    box = {"bbox": [10, 10, 50, 50], "confidence": 0.80, "class_id": 5}
+    assert compare_detections([box], [dict(box, bbox=[11, 10, 50, 49])]) == []
+    assert compare_detections([box], [dict(box, confidence=0.70)])
+    assert compare_detections([box], [dict(box, bbox=[20, 10, 50, 50])])
+    assert compare_detections([box], [dict(box, class_id=6)])
+    assert compare_detections([box], [])
+
+@pytest.fixture(scope="module")
+def detectors():
+    require_weights("yolo11s.pt", "yolo11s.onnx")
+    from training.engine import yolo_onnx_path, yolo_pt_path
+    from training.yolo_detector import YOLODetector
+    return YOLODetector(model_path=yolo_pt_path), YOLODetector(model_path=yolo_onnx_path)
+
+@pytest.mark.parametrize("imgsz,conf", [(640, 0.3), (1280, 0.15)])
+def test_yolo_onnx_matches_torch(detectors, imgsz, conf):
+    from training.engine import parity_images
+    torch_yolo, onnx_yolo = detectors
+    for image in parity_images():
+        expected = torch_yolo.detect_objects(image, filter_recyclables=False, imgsz=imgsz, conf=conf)
+        actual = onnx_yolo.detect_objects(image, filter_recyclables=False, imgsz=imgsz, conf=conf)
+        # 검출이 없으면 비교가 의미 없음
+        assert expected, "샘플 사진에서 검출된 객체가 없습니다"
+        assert compare_detections(expected, actual) == []
+
+def test_resnet_onnx_matches_torch():
+    require_weights("model_v4.pth", "model_v4.onnx")
+    import cv2 as cv
+    import torch
+    from PIL import Image
+    from training.engine import OnnxClassifier, parity_images, resnet_onnx_path
+    from training.pipeline import load_trained_model
+    from training.transforms import test_transform
+
+    images = parity_images()
+    crops = images + [image[:image.shape[0] // 2, :image.shape[1] // 2] for image in images]
+    inputs = torch.stack([test_transform(Image.fromarray(cv.cvtColor(crop, cv.COLOR_BGR2RGB))) for crop in crops])
+    with torch.no_grad():
+        torch_logits = load_trained_model().to("cpu").eval()(inputs)
+    onnx_logits = OnnxClassifier(resnet_onnx_path)(inputs)
+    assert torch.equal(torch_logits.argmax(dim=1), onnx_logits.argmax(dim=1))
+    assert (torch_logits - onnx_logits).abs().max().item() <= 1e-3
@@ -0,0 +1,25 @@
+# 서버 import 경로에서 무거운 모듈(torch, ultralytics)을 불러오지 않는지 확인
+# (모델은 model_loader.load()에서 처음 import -> 포트를 먼저 열고 뒤에서 로드)
+
+import os
+import subprocess
+import sys
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("cv2")
+pytest.importorskip("prometheus_client")
+
+# app.main은 import 시 DB를 초기화하므로 라우터 / 로더만 import
+CHECK = """
+import sys
+import app.model_loader, app.result_cache
+from app.routers import health, predict, catalog, metrics
+heavy = sorted(name for name in ("torch", "torchvision", "ultralytics") if name in sys.modules)
+print(",".join(heavy))
+"""
+
+def test_routers_do_not_import_torch():
+    result = subprocess.run([sys.executable, "-c", CHECK], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert result.stdout.strip() == ""
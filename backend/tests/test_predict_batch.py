@@ -0,0 +1,54 @@
+# /predict/batch: 전체 픽셀 수 한도를 넘는 업로드는 디코딩 전에 거절
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+cv = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routers import predict
+
+def encode_png(width, height):
+    ok, buffer = cv.imencode(".png", np.zeros((height, width, 3), dtype=np.uint8))
+    assert ok
+    return buffer.tobytes()
+
+class FakeLoader:
+    """모델 없이 준비 완료 상태 (추론까지 가면 실패)"""
+    ready = True
+
+@pytest.fixture
+def client(monkeypatch):
+    decoded = []
+    original = predict.decode_image
+    monkeypatch.setattr(predict, "decode_image", lambda image_bytes: decoded.append(1) or original(image_bytes))
+    monkeypatch.setattr(predict, "loader", FakeLoader())
+    monkeypatch.setattr(predict, "PREDICT_BATCH_MAX_PIXELS", 100 * 100)
+    app = FastAPI()
+    app.include_router(predict.router)
+    return TestClient(app), decoded
+
+# 헤더 크기 합이 한도를 넘으면 413, 이미지는 한 장도 디코딩하지 않음
+def test_oversized_batch_rejected_before_decode(client):
+    client, decoded = client
+    files = [("files", ("small.png", encode_png(50, 50), "image/png")),
+             ("files", ("large.png", encode_png(200, 200), "image/png"))]
+    response = client.post("/predict/batch", files=files)
+    assert response.status_code == 413
+    assert decoded == []
+
+# 한도 안이면 전부 디코딩
+def test_batch_within_limit_decodes_all():
+    payloads = [encode_png(50, 50), encode_png(40, 40)]
+    images, total_pixels = predict.decode_within_limit(payloads, 100 * 100)
+    assert [image.shape[:2] for image in images] == [(50, 50), (40, 40)]
+    assert total_pixels == 50 * 50 + 40 * 40
+
+# 헤더를 못 읽는 업로드는 디코딩 실패(None)로 남고 한도 계산에서 빠짐
+def test_unreadable_upload_is_skipped():
+    images, total_pixels = predict.decode_within_limit([b"not an image", encode_png(10, 10)], 100 * 100)
+    assert images[0] is None and images[1].shape[:2] == (10, 10)
+    assert total_pixels == 100
@@ -0,0 +1,26 @@
+# /predict/ws: 바이너리가 아닌 프레임 처리
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from app.routers import predict
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(predict.router)
+    return TestClient(app)
+
+# 텍스트 프레임은 오류 메시지 후 1003으로 종료 (모델 로드 없이)
+def test_text_frame_closes_with_unsupported_data(client):
+    with client.websocket_connect("/predict/ws?session_id=test") as websocket:
+        websocket.send_text("hello")
+        assert websocket.receive_json()["status"] == "error"
+        with pytest.raises(WebSocketDisconnect) as closed:
+            websocket.receive_json()
+        assert closed.value.code == predict.WS_UNSUPPORTED_DATA
@@ -0,0 +1,58 @@
+# vectorized 전처리가 torchvision transforms.Compose(test_transform) 결과와 같은지 확인
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv = pytest.importorskip("cv2")
+torch = pytest.importorskip("torch")
+pytest.importorskip("torchvision")
+
+from PIL import Image
+from training.preprocess import BatchPreprocessor
+from training import transforms
+
+# 정규화 후 허용 오차 (약 0.6 gray level)
+ATOL = 1e-2
+
+# 축소 / 확대 / 가로세로 비율이 다른 crop
+def sample_crops(seed=0):
+    rng = np.random.default_rng(seed)
+    sizes = [(480, 640), (224, 224), (300, 90), (57, 31), (12, 400), (1, 1)]
+    crops = []
+    for height, width in sizes:
+        crop = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+        # 노이즈만 있으면 보간 차이가 평균에 묻히므로 경계가 뚜렷한 영역 추가
+        crop[: height // 2, : width // 3] = (0, 128, 255)
+        crops.append(crop)
+    return crops
+
+def reference(crops, transform):
+    return torch.stack([transform(Image.fromarray(cv.cvtColor(crop, cv.COLOR_BGR2RGB))) for crop in crops])
+
+def test_vectorized_matches_test_transform():
+    crops = sample_crops()
+    actual = BatchPreprocessor()(crops)
+    expected = reference(crops, transforms.test_transform)
+    assert actual.shape == expected.shape == (len(crops), 3, 224, 224)
+    assert (actual - expected).abs().max().item() <= ATOL
+
+@pytest.mark.parametrize("size", [112, 160])
+def test_vectorized_matches_resized_transform(size):
+    crops = sample_crops(seed=size)
+    actual = BatchPreprocessor(size=size)(crops)
+    expected = reference(crops, transforms.resized_test_transform(size))
+    assert (actual - expected).abs().max().item() <= ATOL
+
+# 재사용 버퍼: 큰 배치 뒤 작은 배치를 처리해도 결과가 섞이지 않음
+def test_buffer_reuse_across_batch_sizes():
+    preprocessor = BatchPreprocessor()
+    crops = sample_crops()
+    preprocessor(crops)
+    actual = preprocessor(crops[:2])
+    assert (actual - reference(crops[:2], transforms.test_transform)).abs().max().item() <= ATOL
+
+def test_channels_last_layout_gives_same_values():
+    crops = sample_crops()
+    actual = BatchPreprocessor(channels_last=True)(crops)
+    assert actual.is_contiguous(memory_format=torch.channels_last)
+    assert (actual - reference(crops, transforms.test_transform)).abs().max().item() <= ATOL
@@ -0,0 +1,58 @@
+# 집계 테이블: 처음 배포 시 재집계 (Turso 응답 형식 기준)
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("prometheus_client")
+
+from app.database import TursoClient
+from app.rollups import backfill_if_empty, rebuild_statements
+
+# Turso /v2/pipeline 응답을 흉내 내는 세션 (정수는 Hrana 형식대로 문자열)
+class FakeTursoSession:
+    def __init__(self, rollup_rows):
+        self.rollup_rows = rollup_rows
+        self.requests = []
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        request = json["requests"][0]
+        self.requests.append(request)
+        if request["type"] == "execute":
+            response = {"type": "execute", "result": {
+                "cols": [{"name": "COUNT(*)"}],
+                "rows": [[{"type": "integer", "value": str(self.rollup_rows)}]]
+            }}
+        else:
+            steps = request["batch"]["steps"]
+            response = {"type": "batch", "result": {
+                "step_results": [{"rows": []} for _ in steps],
+                "step_errors": [None for _ in steps]
+            }}
+        return FakeResponse({"results": [{"type": "ok", "response": response}]})
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+def batch_requests(session):
+    return [request for request in session.requests if request["type"] == "batch"]
+
+# 정수가 "0"(문자열)로 와도 빈 집계 테이블로 판단하고 재집계
+def test_backfill_runs_when_turso_reports_zero_as_string():
+    session = FakeTursoSession(rollup_rows=0)
+    assert backfill_if_empty(TursoClient("libsql://test.turso.io", "token", session=session))
+
+    (batch,) = batch_requests(session)
+    sent = [step["stmt"]["sql"] for step in batch["batch"]["steps"]]
+    for sql, _ in rebuild_statements():
+        assert sql in sent
+
+def test_backfill_skipped_when_rollups_exist():
+    session = FakeTursoSession(rollup_rows=1)
+    assert not backfill_if_empty(TursoClient("libsql://test.turso.io", "token", session=session))
+    assert batch_requests(session) == []
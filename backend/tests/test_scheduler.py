@@ -0,0 +1,57 @@
+# 마이크로 배치 스케줄러: 같은 배치의 요청 하나가 취소돼도 나머지 요청은 결과를 받는지
+import asyncio
+import threading
+from concurrent.futures import Future
+
+from app.scheduler import InferenceScheduler
+
+class FakeExecutor:
+    """submit_batch 호출을 기록하고 release() 전까지 결과를 보류"""
+    workers = 1
+    max_pending = 4
+
+    def __init__(self):
+        self.calls = []
+        self.submitted = threading.Event()
+
+    def submit_batch(self, images, fast_mode=False, track_keys=None):
+        future = Future()
+        self.calls.append((images, future))
+        self.submitted.set()
+        return future
+
+    def release(self):
+        calls, self.calls = self.calls, []
+        for images, future in calls:
+            future.set_result([f"result-{image}" for image in images])
+
+def test_cancelled_caller_does_not_block_batch():
+    executor = FakeExecutor()
+    scheduler = InferenceScheduler(executor, max_batch_size=2, max_wait_ms=200)
+
+    async def scenario():
+        cancelled = asyncio.ensure_future(asyncio.wrap_future(scheduler.submit("a")))
+        survivor = asyncio.ensure_future(asyncio.wrap_future(scheduler.submit("b")))
+        # 두 요청이 한 배치로 제출될 때까지 대기
+        assert await asyncio.to_thread(executor.submitted.wait, 5)
+        assert [images for images, _ in executor.calls] == [["a", "b"]]
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        executor.release()
+        assert await asyncio.wait_for(survivor, 5) == "result-b"
+
+    asyncio.run(scenario())
+
+    # 취소된 요청과 완료된 요청 모두 대기 슬롯을 반환
+    for _ in range(executor.max_pending):
+        assert scheduler._pending_slots.acquire(blocking=False)
+    for _ in range(executor.max_pending):
+        scheduler._pending_slots.release()
+
+    # 스케줄러 스레드가 살아 있어 다음 배치도 처리
+    executor.submitted.clear()
+    follow_up = scheduler.submit("c")
+    assert executor.submitted.wait(5)
+    executor.release()
+    assert follow_up.result(timeout=5) == "result-c"
@@ -0,0 +1,45 @@
+# write-behind 스풀 / 멱등성 키
+
+import asyncio
+import sqlite3
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("prometheus_client")
+
+from app.records import ingest_key, ingest_key_prune_statement
+from app.write_behind import Spool, WriteBehind, WriteBehindNotRunning
+
+# 볼륨 경로 없이 시작하면 거부 (컨테이너 임시 파일시스템에 스풀을 두지 않도록)
+def test_start_refuses_without_spool_path():
+    async def run():
+        WriteBehind(spool_path=None).start()
+    with pytest.raises(RuntimeError, match="WRITE_BEHIND_SPOOL_PATH"):
+        asyncio.run(run())
+
+# start() 전 접수는 명확한 예외 (AttributeError 아님)
+def test_submit_before_start_raises_not_running(tmp_path):
+    write_behind = WriteBehind(spool_path=str(tmp_path / "spool.sqlite3"))
+    with pytest.raises(WriteBehindNotRunning):
+        asyncio.run(write_behind.submit("analysis", {}, "key-1"))
+
+# 같은 키라도 종류가 다르면 별개 기록
+def test_spool_dedupes_per_kind(tmp_path):
+    spool = Spool(str(tmp_path / "spool.sqlite3"))
+    try:
+        assert spool.append("key-1", "analysis", {"items": []})
+        assert not spool.append("key-1", "analysis", {"items": []})
+        assert spool.append("key-1", "feedback", {"predicted_class": "캔"})
+        assert spool.stats()["depth"] == 2
+    finally:
+        spool.close()
+
+def test_ingest_keys_are_scoped_and_pruned_by_ttl():
+    assert ingest_key("analysis", "k") != ingest_key("feedback", "k")
+
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE ingest_keys (key TEXT PRIMARY KEY, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+    db.execute("INSERT INTO ingest_keys (key, created_at) VALUES ('analysis:old', DATETIME('now', '-8 days'))")
+    db.execute("INSERT INTO ingest_keys (key) VALUES ('analysis:new')")
+    db.execute(*ingest_key_prune_statement(ttl_days=7))
+    assert [row[0] for row in db.execute("SELECT key FROM ingest_keys")] == ["analysis:new"]
@@ -0,0 +1,195 @@
+# 파이프라인 벤치마크 (합성 이미지, 단계별 소요 시간)
+#
+# 실행: python -m training.benchmark [--resolutions 640x480,1920x1080] [--objects 1,5,15] [--repeat 20]
+# 결과: models/benchmark_pipeline.json (다른 실행 결과와 비교: --compare 이전.json)
+# API 처리량 / 지연 분위수까지 포함한 전체 벤치마크: python -m app.benchmark
+
+import json
+import os
+import platform
+import time
+import cv2 as cv
+import numpy as np
+
+# 회귀로 판단할 기본 허용 범위 (p95 지연 / 처리량 10% 이상 악화)
+REGRESSION_TOLERANCE = 0.10
+
+# 합성 이미지 생성 (배경 노이즈 + 무작위 색상의 사각형/원 객체)
+def synthetic_image(width, height, num_objects, seed=0):
+    """BGR 이미지와 객체 위치 yolo_results(dict 리스트)를 반환"""
+    rng = np.random.default_rng(seed)
+    image = rng.integers(40, 90, size=(height, width, 3), dtype=np.uint8)
+    image = cv.GaussianBlur(image, (7, 7), 0)
+
+    boxes = []
+    min_side = max(24, min(width, height) // 12)
+    max_side = max(min_side + 1, min(width, height) // 3)
+    for idx in range(num_objects):
+        box_width, box_height = rng.integers(min_side, max_side, size=2)
+        x1 = int(rng.integers(0, max(1, width - box_width)))
+        y1 = int(rng.integers(0, max(1, height - box_height)))
+        x2, y2 = x1 + int(box_width), y1 + int(box_height)
+        color = tuple(int(c) for c in rng.integers(0, 256, size=3))
+        if idx % 2 == 0:
+            cv.rectangle(image, (x1, y1), (x2, y2), color, thickness=-1)
+        else:
+            cv.ellipse(image, ((x1 + x2) // 2, (y1 + y2) // 2), ((x2 - x1) // 2, (y2 - y1) // 2), 0, 0, 360, color, thickness=-1)
+        # 질감 (단색 면보다 실제 사진에 가깝게)
+        cv.putText(image, str(idx), (x1 + 4, y1 + (y2 - y1) // 2), cv.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        boxes.append({"bbox": [x1, y1, x2, y2], "confidence": 0.9, "class_id": 39})
+    return image, boxes
+
+# 합성 이미지 -> JPEG 바이트 (API 업로드용)
+def synthetic_jpeg(width, height, num_objects, seed=0, quality=85):
+    image, _ = synthetic_image(width, height, num_objects, seed)
+    ok, encoded = cv.imencode(".jpg", image, [cv.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise RuntimeError("JPEG 인코딩 실패")
+    return encoded.tobytes()
+
+# 측정값 리스트 -> 요약 통계 (ms)
+def summarize(samples):
+    if not samples:
+        return {"count": 0}
+    values = np.asarray(samples, dtype=np.float64) * 1000
+    return {
+        "count": int(values.size),
+        "mean_ms": round(float(values.mean()), 3),
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p90_ms": round(float(np.percentile(values, 90)), 3),
+        "p95_ms": round(float(np.percentile(values, 95)), 3),
+        "p99_ms": round(float(np.percentile(values, 99)), 3),
+        "max_ms": round(float(values.max()), 3)
+    }
+
+# 실행 환경 정보 (다른 실행과 비교할 때 같은 조건인지 확인용)
+def environment_info():
+    import torch
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "torch": torch.__version__,
+        "torch_threads": torch.get_num_threads(),
+        "env": {key: os.getenv(key) for key in (
+            "INFERENCE_ENGINE", "RESNET_OPTIMIZE", "RESNET_QUANTIZATION", "PREPROCESS_MODE",
+            "CASCADE_ENABLED", "CROP_FILTER_ENABLED", "RESNET_BATCH_SIZE"
+        ) if os.getenv(key) is not None}
+    }
+
+# process_object 단계별 소요 시간 (해상도 x 객체 수 x fast_mode)
+def benchmark_pipeline(pipeline, resolutions, object_counts, repeat=20, warmup=3):
+    """
+    end_to_end: process_objects_batch 실행 (YOLO가 실제로 검출한 박스 기준 yolo/crop_filter/preprocess/resnet)
+    classify: 합성 객체 위치를 그대로 박스로 사용 (객체 수를 정확히 고정한 preprocess/resnet)
+    """
+    results = []
+    for width, height in resolutions:
+        for num_objects in object_counts:
+            image, boxes = synthetic_image(width, height, num_objects, seed=num_objects)
+            for fast_mode in (True, False):
+                for _ in range(warmup):
+                    pipeline.process_objects_batch([image], fast_mode=fast_mode)
+
+                stages = {}
+                detected = []
+                for _ in range(repeat):
+                    timings = {}
+                    started = time.perf_counter()
+                    batch_results = pipeline.process_objects_batch([image], fast_mode=fast_mode, timings=timings)
+                    timings["total"] = time.perf_counter() - started
+                    detected.append(len(batch_results[0]))
+                    for stage, seconds in timings.items():
+                        stages.setdefault(stage, []).append(seconds)
+
+                classify_stages = {}
+                for _ in range(repeat):
+                    timings = {}
+                    pipeline.classify_images([(image, [dict(box) for box in boxes])], timings=timings)
+                    for stage, seconds in timings.items():
+                        classify_stages.setdefault(stage, []).append(seconds)
+
+                row = {
+                    "name": f"{width}x{height}/objects={num_objects}/fast_mode={fast_mode}",
+                    "resolution": [width, height],
+                    "objects": num_objects,
+                    "fast_mode": fast_mode,
+                    "detected_boxes_mean": round(float(np.mean(detected)), 2),
+                    "end_to_end": {stage: summarize(samples) for stage, samples in stages.items()},
+                    "classify": {stage: summarize(samples) for stage, samples in classify_stages.items()}
+                }
+                results.append(row)
+                print(f"{row['name']}: 전체 p50 {row['end_to_end']['total']['p50_ms']}ms, p95 {row['end_to_end']['total']['p95_ms']}ms (검출 {row['detected_boxes_mean']}개)")
+    return results
+
+# 이전 리포트와 비교하여 악화된 항목 반환
+def compare_reports(baseline, current, tolerance=REGRESSION_TOLERANCE):
+    """p95 지연이 tolerance 이상 늘었거나 처리량이 tolerance 이상 줄어든 항목 리스트"""
+    regressions = []
+
+    def walk(base, cur, path):
+        if isinstance(base, dict) and isinstance(cur, dict):
+            for key in base:
+                if key in cur:
+                    walk(base[key], cur[key], path + [key])
+        elif isinstance(base, list) and isinstance(cur, list):
+            # 이름이 있는 항목은 이름으로 맞춰서 비교
+            current_by_name = {item.get("name"): item for item in cur if isinstance(item, dict)}
+            for item in base:
+                if isinstance(item, dict) and item.get("name") in current_by_name:
+                    walk(item, current_by_name[item["name"]], path + [item["name"]])
+        elif isinstance(base, (int, float)) and isinstance(cur, (int, float)) and base > 0:
+            metric = path[-1]
+            change = (cur - base) / base
+            if (metric == "p95_ms" and change > tolerance) or (metric.endswith("_per_sec") and -change > tolerance):
+                regressions.append({"metric": "/".join(path), "baseline": base, "current": cur, "change": round(change, 4)})
+
+    walk(baseline, current, [])
+    return regressions
+
+# 리포트 저장 + (기준 리포트가 있으면) 회귀 항목 출력
+def write_report(report, output, compare=None, tolerance=REGRESSION_TOLERANCE):
+    """회귀가 있으면 False"""
+    if compare:
+        with open(compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["regressions"] = compare_reports(baseline, report, tolerance)
+        report["compared_to"] = compare
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"리포트 저장: {output}")
+
+    for item in report.get("regressions", []):
+        print(f"[회귀] {item['metric']}: {item['baseline']} -> {item['current']} ({item['change'] * 100:+.1f}%)")
+    return not report.get("regressions")
+
+# "640x480,1280x720" -> [(640, 480), (1280, 720)]
+def parse_resolutions(value):
+    return [tuple(int(v) for v in item.lower().split("x")) for item in value.split(",") if item]
+
+def parse_ints(value):
+    return [int(v) for v in value.split(",") if v]
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from training.engine import models_dir
+    from training.pipeline import YOLOResNetPipeline
+
+    parser = argparse.ArgumentParser(description="YOLO + ResNet 파이프라인 단계별 벤치마크 (합성 이미지)")
+    parser.add_argument("--resolutions", default="640x480,1280x720,1920x1080")
+    parser.add_argument("--objects", default="1,5,15", help="이미지당 합성 객체 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default=os.path.join(models_dir, "benchmark_pipeline.json"))
+    parser.add_argument("--compare", help="비교할 이전 리포트 (회귀 시 종료 코드 1)")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    args = parser.parse_args()
+
+    pipeline = YOLOResNetPipeline()
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment_info(),
+        "pipeline": benchmark_pipeline(pipeline, parse_resolutions(args.resolutions), parse_ints(args.objects), args.repeat)
+    }
+    sys.exit(0 if write_report(report, args.output, args.compare, args.tolerance) else 1)
@@ -0,0 +1,12 @@
+# 박스 좌표 유틸리티 (추적기 / crop 필터 공용)
+
+# 두 박스 [x1, y1, x2, y2] 의 IoU
+def box_iou(a, b):
+    inter_w = min(a[2], b[2]) - max(a[0], b[0])
+    inter_h = min(a[3], b[3]) - max(a[1], b[1])
+    if inter_w <= 0 or inter_h <= 0:
+        return 0.0
+    inter = inter_w * inter_h
+    area_a = (a[2] - a[0]) * (a[3] - a[1])
+    area_b = (b[2] - b[0]) * (b[3] - b[1])
+    return inter / max(1e-6, area_a + area_b - inter)
@@ -0,0 +1,94 @@
+# 조기 종료 cascade 분류 설정 및 임계값 보정
+# 1단계: 저해상도(기본 112px)로 분류, softmax 신뢰도가 임계값 이상이면 확정
+# 2단계: 불확실한 crop만 224px 전체 해상도로 다시 분류
+#
+# 임계값 보정: python -m training.cascade --data D:/ml_data/resnet/valid --budget 0.005
+# 결과: models/cascade_report.json (권장 CASCADE_THRESHOLD, 조기 종료 비율)
+
+import os
+
+# cascade 설정 (환경 변수로 조정)
+CASCADE_ENABLED = os.getenv("CASCADE_ENABLED", "0") == "1"
+CASCADE_SIZE = int(os.getenv("CASCADE_SIZE", "112"))  # 1단계 입력 해상도
+CASCADE_THRESHOLD = float(os.getenv("CASCADE_THRESHOLD", "0.9"))  # 1단계 결과를 확정할 최소 신뢰도
+
+# 저해상도/전체 해상도 예측으로 임계값별 정확도와 조기 종료 비율 계산
+def sweep_thresholds(low_predictions, full_predictions, labels, thresholds):
+    """low_predictions / full_predictions: [(class, confidence), ...]"""
+    total = len(labels)
+    full_accuracy = sum(int(p[0] == y) for p, y in zip(full_predictions, labels)) / max(1, total)
+    rows = []
+    for threshold in thresholds:
+        correct = early = 0
+        for low, full, label in zip(low_predictions, full_predictions, labels):
+            if low[1] >= threshold:
+                early += 1
+                correct += int(low[0] == label)
+            else:
+                correct += int(full[0] == label)
+        accuracy = correct / max(1, total)
+        rows.append({
+            "threshold": round(threshold, 4),
+            "accuracy": round(accuracy, 4),
+            "accuracy_loss": round(full_accuracy - accuracy, 4),
+            "early_exit_fraction": round(early / max(1, total), 4)
+        })
+    return full_accuracy, rows
+
+# 정확도 손실 예산 안에서 조기 종료가 가장 많은 (가장 낮은) 임계값 선택
+def pick_threshold(rows, budget):
+    allowed = [row for row in rows if row["accuracy_loss"] <= budget]
+    if not allowed:
+        return None
+    return max(allowed, key=lambda row: (row["early_exit_fraction"], -row["threshold"]))
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import cv2 as cv
+    import numpy as np
+    from torchvision import datasets
+    from training.engine import models_dir
+    from training.pipeline import YOLOResNetPipeline
+
+    parser = argparse.ArgumentParser(description="cascade 분류 임계값 보정")
+    parser.add_argument("--data", default="D:/ml_data/resnet/valid", help="클래스별 폴더가 있는 검증 데이터 경로")
+    parser.add_argument("--budget", type=float, default=0.005, help="허용 정확도 손실 (0.005 = 0.5%p)")
+    parser.add_argument("--size", type=int, default=CASCADE_SIZE, help="1단계 입력 해상도")
+    args = parser.parse_args()
+
+    # 서버와 같은 전처리/모델로 평가
+    pipeline = YOLOResNetPipeline()
+    dataset = datasets.ImageFolder(args.data)
+    crops, labels = [], []
+    for path, label in dataset.samples:
+        image = cv.imread(path)
+        if image is not None:
+            crops.append(image)
+            labels.append(label)
+    print(f"검증 이미지 {len(crops)}장")
+
+    low_predictions = pipeline.classify_tensors(pipeline.preprocess_crops(crops, size=args.size))
+    full_predictions = pipeline.classify_tensors(pipeline.preprocess_crops(crops))
+
+    thresholds = list(np.round(np.arange(0.5, 1.0, 0.01), 2)) + [0.995, 0.999]
+    full_accuracy, rows = sweep_thresholds(low_predictions, full_predictions, labels, thresholds)
+    best = pick_threshold(rows, args.budget)
+
+    report = {
+        "size": args.size,
+        "budget": args.budget,
+        "full_accuracy": round(full_accuracy, 4),
+        "recommended": best,
+        "thresholds": rows
+    }
+    report_path = os.path.join(models_dir, "cascade_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"전체 해상도 정확도: {full_accuracy:.4f}")
+    if best:
+        print(f"권장 CASCADE_THRESHOLD={best['threshold']} (정확도 손실 {best['accuracy_loss']:.4f}, 조기 종료 {best['early_exit_fraction']*100:.1f}%)")
+    else:
+        print("예산 안에서 가능한 임계값이 없습니다 (cascade 사용 비권장)")
+    print(f"리포트 저장: {report_path}")
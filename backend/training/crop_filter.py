@@ -0,0 +1,78 @@
+# YOLO 결과 -> ResNet 분류 전 crop 필터링 (이미지당 분류 횟수 상한)
+# 이미지 경계로 좌표 보정 -> 너무 작거나 가늘고 긴 박스 제거
+# -> 클래스 무관 중복 박스 제거 -> 검출 신뢰도 상위 K개만 유지
+
+import os
+import threading
+from training.boxes import box_iou
+
+# 필터 설정 (환경 변수로 조정)
+# 걸러진 박스는 /predict 응답에서도 빠지므로 기본은 끔 (응답 결과가 바뀌는 것을 감수할 때만 사용)
+CROP_FILTER_ENABLED = os.getenv("CROP_FILTER_ENABLED", "0") == "1"
+CROP_MIN_AREA = int(os.getenv("CROP_MIN_AREA", "256"))  # 최소 박스 넓이 (픽셀, 16x16)
+CROP_MAX_ASPECT = float(os.getenv("CROP_MAX_ASPECT", "8.0"))  # 최대 가로세로 비율 (긴 변 / 짧은 변)
+CROP_OVERLAP_IOU = float(os.getenv("CROP_OVERLAP_IOU", "0.7"))  # 이 IoU 이상 겹치면 신뢰도 낮은 박스 제거
+CROP_TOP_K = int(os.getenv("CROP_TOP_K", "20"))  # 이미지당 최대 분류 객체 수 (0: 제한 없음)
+
+class CropFilter:
+    """이미지 하나의 yolo_results를 걸러서 반환하고 제거 사유별 카운터 누적"""
+
+    COUNTERS = ("input", "clamped", "dropped_small", "dropped_aspect", "dropped_overlap", "dropped_top_k", "kept")
+
+    def __init__(self, min_area=CROP_MIN_AREA, max_aspect=CROP_MAX_ASPECT,
+                 overlap_iou=CROP_OVERLAP_IOU, top_k=CROP_TOP_K):
+        self.min_area = min_area
+        self.max_aspect = max_aspect
+        self.overlap_iou = overlap_iou
+        self.top_k = top_k
+        self.totals = dict.fromkeys(self.COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    def __call__(self, yolo_results, image_shape):
+        height, width = image_shape[:2]
+        counts = dict.fromkeys(self.COUNTERS, 0)
+        counts["input"] = len(yolo_results)
+
+        # 이미지 경계로 좌표 보정 + 크기/비율 필터
+        candidates = []
+        for idx, box in enumerate(yolo_results):
+            x1, y1, x2, y2 = box["bbox"]
+            clamped = [min(max(x1, 0), width), min(max(y1, 0), height), min(max(x2, 0), width), min(max(y2, 0), height)]
+            if clamped != box["bbox"]:
+                box["bbox"] = clamped
+                counts["clamped"] += 1
+
+            box_width, box_height = clamped[2] - clamped[0], clamped[3] - clamped[1]
+            if box_width <= 0 or box_height <= 0 or box_width * box_height < self.min_area:
+                counts["dropped_small"] += 1
+                continue
+            if max(box_width, box_height) / min(box_width, box_height) > self.max_aspect:
+                counts["dropped_aspect"] += 1
+                continue
+            candidates.append(idx)
+
+        # 신뢰도 순으로 클래스 무관 중복 제거 + 상위 K개
+        candidates.sort(key=lambda idx: yolo_results[idx]["confidence"], reverse=True)
+        kept = []
+        for idx in candidates:
+            if any(box_iou(yolo_results[idx]["bbox"], yolo_results[other]["bbox"]) >= self.overlap_iou for other in kept):
+                counts["dropped_overlap"] += 1
+                continue
+            if self.top_k and len(kept) >= self.top_k:
+                counts["dropped_top_k"] += 1
+                continue
+            kept.append(idx)
+
+        # 원래 순서 유지
+        filtered = [yolo_results[idx] for idx in sorted(kept)]
+        counts["kept"] = len(filtered)
+
+        with self._lock:
+            for key, value in counts.items():
+                self.totals[key] += value
+        return filtered, counts
+
+    # 누적 카운터
+    def stats(self):
+        with self._lock:
+            return dict(self.totals)
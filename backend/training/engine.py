@@ -0,0 +1,214 @@
+# 추론 엔진 선택 및 모델 내보내기 (torch / onnxruntime)
+#
+# 모델 내보내기:  python -m training.engine export [--openvino]
+# 엔진 동등성 검사: python -m training.engine parity
+
+import os
+import platform
+import numpy as np
+import torch
+from training.optimize import RESNET_OPTIMIZE, RESNET_CHANNELS_LAST, optimize_classifier
+
+# 사용할 추론 엔진 ("torch" 또는 "onnxruntime")
+INFERENCE_ENGINE = os.getenv("INFERENCE_ENGINE", "torch")
+ENGINES = ("torch", "onnxruntime")
+# torch 엔진의 ResNet 양자화 모델 ("" = fp32, "dynamic", "static"; python -m training.quantize로 생성)
+RESNET_QUANTIZATION = os.getenv("RESNET_QUANTIZATION", "")
+QUANTIZATIONS = ("", "dynamic", "static")
+
+# 모델 파일 경로
+models_dir = os.path.join(os.path.dirname(__file__), "../models")
+resnet_onnx_path = os.path.join(models_dir, "model_v4.onnx")
+yolo_pt_path = os.path.join(models_dir, "yolo11s.pt")
+yolo_onnx_path = os.path.join(models_dir, "yolo11s.onnx")
+
+# ONNX Runtime 기반 ResNet 분류기 (torch 모델과 같은 방식으로 호출)
+class OnnxClassifier:
+    device = torch.device("cpu")
+
+    def __init__(self, onnx_path=resnet_onnx_path, intra_op_threads=0):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(onnx_path, sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    # (N, 3, 224, 224) 텐서 -> (N, 7) logits 텐서
+    def __call__(self, input_batch):
+        inputs = input_batch.detach().cpu().numpy().astype(np.float32, copy=False)
+        logits = self.session.run(None, {self.input_name: inputs})[0]
+        return torch.from_numpy(logits)
+
+    def eval(self):
+        return self
+
+# 양자화 모델 경로 (TorchScript)
+def quantized_model_path(quantization):
+    return os.path.join(models_dir, f"model_v4_int8_{quantization}.pt")
+
+# 양자화 백엔드 (x86: fbgemm, ARM: qnnpack)
+def quantized_backend():
+    return "qnnpack" if platform.machine().lower() in ("arm64", "aarch64") else "fbgemm"
+
+# 분류기가 실행되는 디바이스 (파라미터가 없는 모델은 CPU)
+def model_device(model):
+    device = getattr(model, "device", None)
+    if isinstance(device, torch.device):
+        return device
+    parameter = next(iter(model.parameters()), None) if hasattr(model, "parameters") else None
+    return parameter.device if parameter is not None else torch.device("cpu")
+
+# 엔진 이름 확인
+def check_engine(engine):
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 INFERENCE_ENGINE: {engine} (가능: {', '.join(ENGINES)})")
+    return engine
+
+# 엔진별 ResNet 분류기 로드 (torch 엔진은 load_trained_model 결과 그대로 사용)
+def load_classifier(engine, load_torch_model, quantization=RESNET_QUANTIZATION):
+    if check_engine(engine) == "onnxruntime":
+        if not os.path.exists(resnet_onnx_path):
+            raise FileNotFoundError(f"{resnet_onnx_path} 없음: python -m training.engine export 먼저 실행")
+        return OnnxClassifier(resnet_onnx_path)
+
+    if quantization:
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"지원하지 않는 RESNET_QUANTIZATION: {quantization} (가능: dynamic, static)")
+        path = quantized_model_path(quantization)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{path} 없음: python -m training.quantize 먼저 실행")
+        # 양자화 모델은 CPU 전용
+        torch.backends.quantized.engine = quantized_backend()
+        return torch.jit.load(path, map_location="cpu").eval()
+    # fp32 모델은 RESNET_OPTIMIZE 설정에 따라 TorchScript freeze / torch.compile 적용
+    return optimize_classifier(load_torch_model())
+
+# 분류기 입력을 channels-last로 넘길지 여부 (최적화된 torch fp32 모델만 해당)
+def classifier_channels_last(engine, quantization=RESNET_QUANTIZATION):
+    return engine == "torch" and not quantization and RESNET_OPTIMIZE != "none" and RESNET_CHANNELS_LAST
+
+# 엔진별 YOLO 모델 경로 (ultralytics는 .onnx 파일을 onnxruntime으로 실행)
+def yolo_model_path(engine):
+    if check_engine(engine) == "onnxruntime":
+        if not os.path.exists(yolo_onnx_path):
+            raise FileNotFoundError(f"{yolo_onnx_path} 없음: python -m training.engine export 먼저 실행")
+        return yolo_onnx_path
+    return yolo_pt_path
+
+# ResNet18 / YOLO11s를 ONNX (선택: OpenVINO IR)로 내보내기
+def export_models(openvino=False, opset=17):
+    from training.pipeline import load_trained_model
+    from ultralytics import YOLO
+
+    # ResNet18 -> ONNX (배치 크기 / 입력 해상도 가변, cascade 저해상도 단계 포함)
+    model = load_trained_model().to("cpu").eval()
+    dummy = torch.randn(1, 3, 224, 224)
+    torch.onnx.export(
+        model,
+        dummy,
+        resnet_onnx_path,
+        input_names=["input"],
+        output_names=["logits"],
+        dynamic_axes={"input": {0: "batch", 2: "height", 3: "width"}, "logits": {0: "batch"}},
+        opset_version=opset
+    )
+    print(f"ResNet18 ONNX 저장: {resnet_onnx_path}")
+
+    # YOLO11s -> ONNX (실시간 640 / 업로드 1280 모두 쓰도록 입력 크기 가변)
+    yolo = YOLO(yolo_pt_path)
+    exported = yolo.export(format="onnx", dynamic=True, opset=opset)
+    print(f"YOLO11s ONNX 저장: {exported}")
+
+    if openvino:
+        try:
+            import openvino as ov
+        except ImportError:
+            print("openvino 패키지가 없어 OpenVINO IR 내보내기를 건너뜁니다 (pip install openvino)")
+            return
+        ov.save_model(ov.convert_model(resnet_onnx_path), os.path.join(models_dir, "model_v4_openvino.xml"))
+        print(f"ResNet18 OpenVINO IR 저장: {os.path.join(models_dir, 'model_v4_openvino.xml')}")
+        exported = YOLO(yolo_pt_path).export(format="openvino", dynamic=True)
+        print(f"YOLO11s OpenVINO IR 저장: {exported}")
+
+# 두 엔진의 YOLO 검출 결과 비교 -> 불일치 설명 리스트 (비어 있으면 일치)
+def compare_detections(expected, actual, bbox_atol=2, conf_atol=0.01):
+    """박스마다 같은 클래스 중 좌표가 가장 가까운 박스와 짝지어 좌표(px) / 신뢰도 차이 확인"""
+    mismatches = []
+    if len(expected) != len(actual):
+        mismatches.append(f"검출 수 다름: {len(expected)} != {len(actual)}")
+    unmatched = list(actual)
+    for box in expected:
+        candidates = [other for other in unmatched if other["class_id"] == box["class_id"]]
+        if not candidates:
+            mismatches.append(f"짝 없음: 클래스 {box['class_id']} {box['bbox']}")
+            continue
+        match = min(candidates, key=lambda other: max(abs(p - q) for p, q in zip(box["bbox"], other["bbox"])))
+        unmatched.remove(match)
+        bbox_diff = max(abs(p - q) for p, q in zip(box["bbox"], match["bbox"]))
+        conf_diff = abs(box["confidence"] - match["confidence"])
+        if bbox_diff > bbox_atol or conf_diff > conf_atol:
+            mismatches.append(f"클래스 {box['class_id']} {box['bbox']}: 좌표 차이 {bbox_diff}px, 신뢰도 차이 {conf_diff:.4f}")
+    return mismatches
+
+# 동등성 검사용 실제 사진 (ultralytics 샘플)
+def parity_images():
+    import cv2 as cv
+    from ultralytics.utils import ASSETS
+    return [cv.imread(str(ASSETS / name)) for name in ("bus.jpg", "zidane.jpg")]
+
+# torch와 onnxruntime 결과 비교 (실제 사진 기준)
+def check_parity(atol=1e-3):
+    import cv2 as cv
+    from training.pipeline import load_trained_model
+    from training.transforms import test_transform
+    from training.yolo_detector import YOLODetector
+    from PIL import Image
+
+    images = parity_images()
+
+    # ResNet logits / 예측 클래스 비교 (사진 전체 + 사진 일부 crop)
+    crops = images + [image[:image.shape[0] // 2, :image.shape[1] // 2] for image in images]
+    inputs = torch.stack([test_transform(Image.fromarray(cv.cvtColor(crop, cv.COLOR_BGR2RGB))) for crop in crops])
+    torch_model = load_trained_model().to("cpu").eval()
+    with torch.no_grad():
+        torch_logits = torch_model(inputs)
+    onnx_logits = OnnxClassifier(resnet_onnx_path)(inputs)
+    max_diff = (torch_logits - onnx_logits).abs().max().item()
+    same_class = torch.equal(torch_logits.argmax(dim=1), onnx_logits.argmax(dim=1))
+    resnet_ok = same_class and max_diff <= atol
+    print(f"ResNet18: 최대 logit 차이 {max_diff:.6f}, 예측 클래스 일치: {same_class}")
+
+    # YOLO 검출 결과 비교 (박스 / 클래스 / 신뢰도, 실시간 640 + 업로드 1280)
+    torch_yolo = YOLODetector(model_path=yolo_pt_path)
+    onnx_yolo = YOLODetector(model_path=yolo_onnx_path)
+    yolo_ok = True
+    for image in images:
+        for imgsz, conf in ((640, 0.3), (1280, 0.15)):
+            expected = torch_yolo.detect_objects(image, filter_recyclables=False, imgsz=imgsz, conf=conf)
+            actual = onnx_yolo.detect_objects(image, filter_recyclables=False, imgsz=imgsz, conf=conf)
+            mismatches = compare_detections(expected, actual)
+            if not expected:
+                mismatches.append("검출된 객체 없음 (비교 불가)")
+            for mismatch in mismatches:
+                print(f"YOLO11s imgsz={imgsz}: {mismatch}")
+            yolo_ok = yolo_ok and not mismatches
+    print(f"YOLO11s: 검출 결과 일치: {yolo_ok}")
+
+    return resnet_ok and yolo_ok
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="추론 엔진 모델 내보내기 / 동등성 검사")
+    parser.add_argument("command", choices=["export", "parity"])
+    parser.add_argument("--openvino", action="store_true", help="OpenVINO IR도 함께 저장")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export_models(openvino=args.openvino)
+    else:
+        sys.exit(0 if check_parity() else 1)
@@ -0,0 +1,24 @@
+# 이미지 디코딩 (torch / 모델을 import하지 않는 가벼운 모듈)
+
+import io
+import cv2 as cv
+import numpy as np
+from PIL import Image
+
+# 업로드 바이트를 한 번만 디코딩 (BGR numpy 배열, 실패 시 None)
+def decode_image(image_bytes):
+    buffer = np.frombuffer(image_bytes, dtype=np.uint8)
+    if buffer.size == 0:
+        return None
+    return cv.imdecode(buffer, cv.IMREAD_COLOR)
+
+# 디코딩 없이 헤더에서 이미지 크기만 읽기 ((width, height), 읽을 수 없으면 None)
+# (Pillow 한도의 2배를 넘는 이미지는 Image.DecompressionBombError 그대로 발생)
+def image_size(image_bytes):
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            return image.size
+    except Image.DecompressionBombError:
+        raise
+    except Exception:
+        return None
@@ -4,37 +4,16 @@ import torch
 import torchvision.models as models
 import torch.nn as nn
 import torch.optim as optim
-from torchvision import transforms, datasets
+from torchvision import datasets
 from torch.utils.data import DataLoader, WeightedRandomSampler
+# 전처리는 서버(추론)와 공유하는 가벼운 모듈에서 가져오기
+from training.transforms import num_classes, train_transform, test_transform
 
-# 분류할 클래스 수
-num_classes = 7  # can, glass, paper, plastic_opaque, plastic_pet, styrofoam, vinyl
-
-# 이미 학습되어 있는 resnet18 모델 불러오기
-model = models.resnet18(pretrained=True)
-model.fc = nn.Linear(512, num_classes)  # 7개 클래스 출력
-
-# 데이터 전처리 - 학습용
-train_transform = transforms.Compose([
-    transforms.Resize((224,224)),
-    # 최소한의 증강만
-    transforms.RandomHorizontalFlip(p=0.3), # 좌우반전 30%
-    transforms.ColorJitter( # 색상만 약하게
-        brightness=0.2, # 밝기 20%
-        contrast=0.2, # 대비 20%
-        saturation=0.2, # 채도 20%
-        hue=0.05 # 색조 5%
-    ),
-    transforms.ToTensor(),
-    transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
-])
-
-# 데이터 전처리 - 검증/테스트용 (augmentation 없음)
-test_transform = transforms.Compose([
-    transforms.Resize((224,224)),
-    transforms.ToTensor(),
-    transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
-])
+# 이미 학습되어 있는 resnet18 모델 불러오기 (학습 시에만 호출, import 시 다운로드 방지)
+def build_model():
+    model = models.resnet18(pretrained=True)
+    model.fc = nn.Linear(512, num_classes)  # 7개 클래스 출력
+    return model
 
 # 데이터 로더 생성 함수 (학습 시에만 호출)
 def create_data_loaders():
@@ -92,24 +71,20 @@ def create_data_loaders():
     return train_loader, test_loader, valid_loader, class_counts
 
 # 사용가능한 디바이스 확인
-if torch.cuda.is_available():
-    device = torch.device("cuda")
-    print("CUDA GPU 사용")
-    print(f"GPU 이름: {torch.cuda.get_device_name(0)}")
-elif torch.backends.mps.is_available():
-    device = torch.device("mps")
-    print("Apple MPS (Metal Performance Shaders) 사용")
-else:
-    device = torch.device("cpu")
-    print("CPU 사용")
-
-print(f"선택된 디바이스: {device}")
-
-# 모델을 디바이스로 이동
-model = model.to(device)
-
-# 옵티마이저 설정
-optimizer = optim.Adam(model.parameters(), lr=0.0001)
+def get_device():
+    if torch.cuda.is_available():
+        device = torch.device("cuda")
+        print("CUDA GPU 사용")
+        print(f"GPU 이름: {torch.cuda.get_device_name(0)}")
+    elif torch.backends.mps.is_available():
+        device = torch.device("mps")
+        print("Apple MPS (Metal Performance Shaders) 사용")
+    else:
+        device = torch.device("cpu")
+        print("CPU 사용")
+
+    print(f"선택된 디바이스: {device}")
+    return device
 
 # 학습 루프 함수 정의
 def train_loop(data_loader, model, criterion, optimizer):
@@ -168,6 +143,14 @@ epochs = 20
 
 # 학습 실행
 if __name__ == "__main__":
+    # 디바이스 설정 및 모델 생성
+    device = get_device()
+    # 모델을 디바이스로 이동
+    model = build_model().to(device)
+
+    # 옵티마이저 설정
+    optimizer = optim.Adam(model.parameters(), lr=0.0001)
+
     # 데이터 로더 생성
     train_loader, test_loader, valid_loader, class_counts = create_data_loaders()
 
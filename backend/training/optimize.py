@@ -0,0 +1,85 @@
+# CPU 추론 최적화 (TorchScript freeze / torch.compile + channels-last) 및 마이크로벤치마크
+#
+# 벤치마크: python -m training.optimize [--batch-size 16] [--iterations 30]
+
+import os
+import time
+import logging
+import torch
+
+logger = logging.getLogger(__name__)
+
+# ResNet 최적화 방식 ("none": eager, "script": trace + freeze, "compile": torch.compile)
+RESNET_OPTIMIZE = os.getenv("RESNET_OPTIMIZE", "none")
+OPTIMIZE_MODES = ("none", "script", "compile")
+# 모델 / 입력을 channels-last 메모리 형식으로 (CPU conv 커널에 유리)
+RESNET_CHANNELS_LAST = os.getenv("RESNET_CHANNELS_LAST", "1") == "1"
+
+# eager 모델 -> 최적화된 추론 모델 (CPU 전용, 다른 디바이스는 그대로 반환)
+def optimize_classifier(model, mode=RESNET_OPTIMIZE, channels_last=RESNET_CHANNELS_LAST):
+    if mode not in OPTIMIZE_MODES:
+        raise ValueError(f"지원하지 않는 RESNET_OPTIMIZE: {mode} (가능: {', '.join(OPTIMIZE_MODES)})")
+    if mode == "none":
+        return model
+    device = next(model.parameters()).device
+    if device.type != "cpu":
+        logger.info("[최적화 생략] %s 디바이스는 eager 모델 사용", device)
+        return model
+
+    model = model.eval()
+    memory_format = torch.channels_last if channels_last else torch.contiguous_format
+    if channels_last:
+        model = model.to(memory_format=memory_format)
+
+    if mode == "compile":
+        return torch.compile(model)
+
+    # trace 후 freeze (가중치를 상수로 접고 conv+bn 등 연산 융합)
+    example = torch.randn(1, 3, 224, 224).contiguous(memory_format=memory_format)
+    with torch.no_grad():
+        scripted = torch.jit.trace(model, example)
+        frozen = torch.jit.optimize_for_inference(torch.jit.freeze(scripted.eval()))
+    return frozen
+
+# 배치 처리량 측정 (crops/sec)
+def benchmark(model, batch_size=16, iterations=30, warmup=5, channels_last=False, use_inference_mode=True):
+    inputs = torch.randn(batch_size, 3, 224, 224)
+    if channels_last:
+        inputs = inputs.contiguous(memory_format=torch.channels_last)
+    context = torch.inference_mode if use_inference_mode else torch.no_grad
+    with context():
+        for _ in range(warmup):
+            model(inputs)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            model(inputs)
+        elapsed = time.perf_counter() - start
+    return round(batch_size * iterations / elapsed, 1)
+
+if __name__ == "__main__":
+    import argparse
+    from training.pipeline import load_trained_model
+
+    parser = argparse.ArgumentParser(description="ResNet18 CPU 추론 최적화 마이크로벤치마크")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op 스레드 수 (0: 기본값)")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    print(f"torch 스레드: {torch.get_num_threads()}, 배치 크기: {args.batch_size}")
+
+    # 기존 경로: eager + no_grad + contiguous 입력
+    baseline = benchmark(load_trained_model().to("cpu"), args.batch_size, args.iterations, use_inference_mode=False)
+    print(f"eager (기존): {baseline} crops/sec")
+
+    for mode in ("none", "script", "compile"):
+        for channels_last in (False, True):
+            try:
+                model = optimize_classifier(load_trained_model().to("cpu"), mode=mode, channels_last=channels_last)
+                throughput = benchmark(model, args.batch_size, args.iterations, channels_last=channels_last)
+            except Exception as e:
+                print(f"{mode} (channels_last={channels_last}): 실패 - {e}")
+                continue
+            print(f"{mode} + inference_mode (channels_last={channels_last}): {throughput} crops/sec ({throughput / baseline:.2f}x)")
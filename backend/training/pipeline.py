@@ -1,13 +1,28 @@
 # YOLO + ResNet Model 파이프라인
 
-from training.model import test_transform
+from training.transforms import test_transform, resized_test_transform
 from training.yolo_detector import YOLODetector
+from training.engine import INFERENCE_ENGINE, classifier_channels_last, load_classifier, model_device, yolo_model_path
+from training.preprocess import PREPROCESS_MODE, BatchPreprocessor
+from training.tracker import TRACKER_ENABLED, TrackerRegistry
+from training.crop_filter import CROP_FILTER_ENABLED, CropFilter
+from training.cascade import CASCADE_ENABLED, CASCADE_SIZE, CASCADE_THRESHOLD
+from training.recycling import RECYCLING_CLASSES, FEEDBACK_OPTIONS
+from training.timing import stage_timer
 import cv2 as cv
+import numpy as np
 import torch
 import torchvision.models as models
 import torch.nn as nn
 from PIL import Image
 import os
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# ResNet 배치 분류 시 한 번에 추론할 최대 crop 수 (메모리 사용량 제한)
+RESNET_BATCH_SIZE = int(os.getenv("RESNET_BATCH_SIZE", "32"))
 
 # 학습이 완료된 모델 가져오기
 model_path = os.path.join(os.path.dirname(__file__), "../models/model_v4.pth")
@@ -30,191 +45,236 @@ def load_trained_model(model_path=model_path):
     return model
 
 class YOLOResNetPipeline:
-    # 재활용 분류 매핑 (7클래스)
-    recycling_classes = {
-        0: {"category": "캔", "item_type": "캔류", "method": """<b>✅ 배출 방법</b><br/><br/>
-
-1. 내용물을 완전히 비우고 물로 헹구기<br/>
-2. 겉면의 종이 라벨이나 비닐 스티커 제거<br/>
-3. 가능하면 납작하게 찌그러뜨려 부피 줄이기<br/>
-4. 플라스틱 뚜껑은 분리해서 플라스틱류로 배출<br/>
-5. 캔 전용 수거함 또는 재활용품 수거함에 배출<br/><br/>
-
-<b>⚠️ 주의사항</b><br/><br/>
-• 부탄가스·스프레이는 반드시 내용물을 완전히 방출한 후 배출 (폭발 위험)<br/>
-• 페인트통·오일통은 재활용 불가 (유해물질 포함)"""}, # Can
-
-        1: {"category": "유리", "item_type": "유리병", "method": """<b>✅ 배출 방법</b><br/><br/>
-
-1. 내용물을 완전히 비우고 물로 깨끗이 헹구기<br/>
-2. 금속 또는 플라스틱 뚜껑 분리 (재질별로 따로 배출)<br/>
-3. 라벨은 가능하면 제거<br/>
-4. 유리병 전용 수거함에 배출<br/><br/>
-
-<b>🔄 보증금 병 (소주병·맥주병)</b><br/><br/>
-• 편의점·마트·슈퍼에 반납하면 보증금 환급!<br/>
-• 재사용이 가장 친환경적인 방법입니다<br/><br/>
-
-<b>⚠️ 주의사항</b><br/><br/>
-• 깨진 유리는 신문지 등에 잘 싸서 종량제 봉투에 넣어서 배출<br/>
-• 거울·판유리·식기·도자기는 재활용 불가<br/>
-• 전구·형광등은 별도 수거함에 배출 (주민센터 문의)"""}, # Glass
-
-        2: {"category": "종이", "item_type": "종이류", "method": """<b>✅ 배출 방법</b><br/><br/>
-
-1. 테이프·철심·스프링 등 이물질 완전히 제거<br/>
-2. 비닐 코팅 부분이 있으면 떼어내기<br/>
-3. 끈으로 묶거나 박스에 담아서 배출<br/>
-4. 비 오는 날은 피해서 배출 (젖으면 재활용 불가)<br/><br/>
-
-<b>🥛 종이팩 (우유팩·주스팩)</b><br/><br/>
-• 물로 헹구고 가위로 펼치기<br/>
-• 바짝 말린 후 종이팩 전용 수거함에 배출<br/>
-• ⚠️ 일반 종이와 절대 혼합 금지!<br/><br/>
-
-<b>❌ 재활용 불가 (일반쓰레기)</b><br/><br/>
-• 비닐 코팅된 종이 (광고지·잡지 표지)<br/>
-• 물이나 음식물에 젖은 종이<br/>
-• 기름때가 묻은 종이 (피자박스 기름 부분)<br/>
-• 영수증·택배 송장 (감열지)<br/>
-• 벽지·부직포"""}, # Paper
-
-        3: {"category": "플라스틱", "item_type": "플라스틱", "method": """<b>✅ 배출 방법</b><br/><br/>
-
-1. 내용물을 완전히 비우고 물로 깨끗이 헹구기<br/>
-2. 라벨·스티커 완전히 제거<br/>
-3. 뚜껑, 펌프, 손잡이 등 다른 재질 분리<br/>
-4. 플라스틱 전용 수거함에 배출<br/><br/>
-
-<b>⚠️ 투명 페트병 주의</b><br/><br/>
-• 무색 투명한 페트병(생수병·음료수병)은 투명 페트병 전용 수거함에 따로 배출<br/>
-• 전용 수거함이 없으면 일반 플라스틱 수거함에 배출<br/><br/>
-
-<b>❌ 재활용 불가 (일반쓰레기)</b><br/><br/>
-• PVC, 실리콘, 고무, 합성가죽<br/>
-• 칫솔, 볼펜, 장난감 (작고 복합 재질)<br/>
-• 전화기, 키보드 (전자부품 포함)<br/>
-• 옷걸이 (철심 포함)<br/>
-• 심하게 오염되어 세척 불가능한 용기"""}, # Plastic_opaque
-
-        4: {"category": "플라스틱", "item_type": "플라스틱", "method": """<b>✅ 배출 방법</b><br/><br/>
-
-1. 내용물을 완전히 비우고 물로 깨끗이 헹구기<br/>
-2. 라벨·스티커 완전히 제거<br/>
-3. 뚜껑, 펌프, 손잡이 등 다른 재질 분리<br/>
-4. 플라스틱 전용 수거함에 배출<br/><br/>
-
-<b>⚠️ 투명 페트병 주의</b><br/><br/>
-• 무색 투명한 페트병(생수병·음료수병)은 투명 페트병 전용 수거함에 따로 배출<br/>
-• 전용 수거함이 없으면 일반 플라스틱 수거함에 배출<br/><br/>
-
-<b>❌ 재활용 불가 (일반쓰레기)</b><br/><br/>
-• PVC, 실리콘, 고무, 합성가죽<br/>
-• 칫솔, 볼펜, 장난감 (작고 복합 재질)<br/>
-• 전화기, 키보드 (전자부품 포함)<br/>
-• 옷걸이 (철심 포함)<br/>
-• 심하게 오염되어 세척 불가능한 용기"""}, # Plastic_pet
-
-        5: {"category": "스티로폼", "item_type": "스티로폼", "method": """<b>✅ 배출 방법</b><br/><br/>
-
-1. 테이프·스티커·라벨 완전히 제거<br/>
-2. 이물질을 완전히 제거하고 깨끗하게 세척<br/>
-3. 스티로폼 전용 수거함 또는 재활용품 수거함에 배출<br/><br/>
-
-<b>⚠️ 주의사항</b><br/><br/>
-• 깨끗한 흰색 스티로폼만 재활용 가능<br/><br/>
-
-<b>❌ 재활용 불가 (일반쓰레기)</b><br/><br/>
-• 음식물이 묻은 스티로폼 (치킨·생선 받침)<br/>
-• 색깔 스티로폼 (파란색·분홍색 등)<br/>
-• 완충재 및 과일 포장재<br/>
-• 코팅·접착제가 많은 것"""}, # Styrofoam
-
-        6: {"category": "비닐", "item_type": "비닐류", "method": """<b>✅ 배출 방법</b><br/><br/>
-
-1. 음식물, 기름기 등 이물질을 간단히 제거<br/>
-2. 비닐 종류나 색상에 상관없이 모두 분리 배출 가능<br/>
-3. 투명 비닐 봉투에 담아 배출<br/>
-4. 접거나 딱지를 만들지 않고 펼쳐서 배출<br/><br/>
-
-<b>❌ 재활용 불가 (일반쓰레기/종량제 봉투)</b><br/><br/>
-• 랩<br/>
-• 노끈<br/>
-• 비닐 코팅된 종이<br/>
-• 기타 재활용이 어려운 품목"""} # Vinyl
-    }
+    # 재활용 분류 매핑 (7클래스, training/recycling.py)
+    recycling_classes = RECYCLING_CLASSES
 
     # 파이프라인 초기화
-    def __init__(self):
+    def __init__(self, resnet_batch_size=RESNET_BATCH_SIZE, engine=INFERENCE_ENGINE, preprocess_mode=PREPROCESS_MODE):
+        # 추론 엔진 ("torch" 또는 "onnxruntime")
+        self.engine = engine
         # YOLO 초기화
-        yolo_model_path = os.path.join(os.path.dirname(__file__), "../models/yolo11s.pt")
-        self.yolo = YOLODetector(model_path=yolo_model_path)
+        self.yolo = YOLODetector(model_path=yolo_model_path(engine))
         # ResNet 모델 초기화
-        self.resnet = load_trained_model()
+        self.resnet = load_classifier(engine, load_trained_model)
+        self.resnet_device = model_device(self.resnet)
+        self.channels_last = classifier_channels_last(engine)
         self.transform = test_transform
+        # crop 전처리 방식 ("pil" 또는 "vectorized")
+        self.preprocess_mode = preprocess_mode
+        self.batch_preprocessor = BatchPreprocessor()
+        # 해상도별 전처리 (cascade 저해상도 단계용, 필요할 때 생성)
+        self._resized_preprocessors = {}
+        # 조기 종료 cascade (저해상도로 먼저 분류, 불확실한 crop만 224px)
+        self.cascade_enabled = CASCADE_ENABLED
+        self.cascade_size = CASCADE_SIZE
+        self.cascade_threshold = CASCADE_THRESHOLD
+        self.cascade_counts = {"early_exit": 0, "full": 0}
+        self._cascade_lock = threading.Lock()
+        # 분류 전 crop 필터 (작은 박스 / 중복 박스 제거, 이미지당 상위 K개)
+        self.crop_filter = CropFilter() if CROP_FILTER_ENABLED else None
+        # 실시간 세션별 객체 추적기 (추적 중인 객체는 재분류 생략)
+        self.trackers = TrackerRegistry() if TRACKER_ENABLED else None
+        # 배치 분류 최대 크기 (1이면 crop별 개별 추론과 동일)
+        self.resnet_batch_size = max(1, int(resnet_batch_size))
+
+    # crop 이미지(BGR) -> ResNet 입력 텐서 (3, 224, 224)
+    def preprocess_crop(self, cropped_img):
+        # BGR -> RGB 변환
+        cropped_rgb = cv.cvtColor(cropped_img, cv.COLOR_BGR2RGB)
+        # PIL 포맷으로 변환
+        pil_img = Image.fromarray(cropped_rgb)
+        # transform 적용 (tensor로 변환)
+        return self.transform(pil_img)
+
+    # crop 리스트 -> ResNet 입력 (텐서 리스트 또는 (N, 3, size, size) 배치 텐서)
+    def preprocess_crops(self, crops, size=224):
+        if size != 224:
+            # 다른 해상도: 전처리 방식별로 해상도에 맞는 변환 사용
+            if size not in self._resized_preprocessors:
+                self._resized_preprocessors[size] = (
+                    BatchPreprocessor(size=size) if self.preprocess_mode == "vectorized" else resized_test_transform(size)
+                )
+            preprocessor = self._resized_preprocessors[size]
+            if self.preprocess_mode == "vectorized":
+                return preprocessor(crops)
+            return [preprocessor(Image.fromarray(cv.cvtColor(crop, cv.COLOR_BGR2RGB))) for crop in crops]
+
+        if self.preprocess_mode == "vectorized":
+            return self.batch_preprocessor(crops)
+        return [self.preprocess_crop(crop) for crop in crops]
+
+    # cascade 누적 카운터 (조기 종료 비율)
+    def cascade_stats(self):
+        with self._cascade_lock:
+            counts = dict(self.cascade_counts)
+        total = counts["early_exit"] + counts["full"]
+        counts["early_exit_fraction"] = round(counts["early_exit"] / total, 4) if total else 0.0
+        return counts
+
+    # crop 리스트 분류 (cascade 사용 시 저해상도 -> 불확실한 crop만 전체 해상도)
+    def classify_crops(self, crops, timings=None):
+        if not self.cascade_enabled or not crops:
+            with stage_timer(timings, "preprocess"):
+                input_tensors = self.preprocess_crops(crops)
+            with stage_timer(timings, "resnet"):
+                return self.classify_tensors(input_tensors)
+
+        # 1단계: 저해상도 분류
+        with stage_timer(timings, "preprocess"):
+            input_tensors = self.preprocess_crops(crops, size=self.cascade_size)
+        with stage_timer(timings, "resnet"):
+            predictions = self.classify_tensors(input_tensors)
+        uncertain = [idx for idx, (_, confidence) in enumerate(predictions) if confidence < self.cascade_threshold]
+
+        # 2단계: 불확실한 crop만 전체 해상도로 재분류
+        if uncertain:
+            with stage_timer(timings, "preprocess"):
+                input_tensors = self.preprocess_crops([crops[idx] for idx in uncertain])
+            with stage_timer(timings, "resnet"):
+                full_predictions = self.classify_tensors(input_tensors)
+            for idx, prediction in zip(uncertain, full_predictions):
+                predictions[idx] = prediction
+
+        with self._cascade_lock:
+            self.cascade_counts["early_exit"] += len(crops) - len(uncertain)
+            self.cascade_counts["full"] += len(uncertain)
+        logger.debug("cascade: 조기 종료 %d개, 전체 해상도 %d개", len(crops) - len(uncertain), len(uncertain))
+        return predictions
+
+    # 여러 입력 텐서를 (N, 3, 224, 224) 배치로 묶어 한 번에 분류
+    def classify_tensors(self, input_tensors):
+        """[(predicted_class, confidence), ...] 를 입력 순서대로 반환"""
+        predictions = []
+        if len(input_tensors) == 0:
+            return predictions
+
+        device = self.resnet_device
+
+        # inference_mode: no_grad보다 autograd 추적 비용이 더 적음
+        with torch.inference_mode():
+            # 최대 배치 크기 단위로 나누어 추론
+            for start in range(0, len(input_tensors), self.resnet_batch_size):
+                chunk = input_tensors[start:start + self.resnet_batch_size]
+                # 이미 배치 텐서면 그대로 사용 (vectorized 전처리)
+                input_batch = chunk if isinstance(chunk, torch.Tensor) else torch.stack(chunk)
+                input_batch = input_batch.to(device)
+                if self.channels_last:
+                    input_batch = input_batch.contiguous(memory_format=torch.channels_last)
+                outputs = self.resnet(input_batch)
+                # 확률로 변환 후 가장 높은 확률의 클래스와 신뢰도
+                prob = torch.nn.functional.softmax(outputs, dim=1)
+                confidences, predicted_classes = torch.max(prob, dim=1)
+                predictions.extend(zip(predicted_classes.tolist(), confidences.tolist()))
+
+        return predictions
+
+    # YOLO 결과의 모든 박스를 잘라서 한 번에 분류 (결과는 box에 추가)
+    def classify_boxes(self, original_image, yolo_results, timings=None):
+        return self.classify_images([(original_image, yolo_results)], timings=timings)[0]
+
+    # 여러 이미지의 박스를 모두 모아 ResNet 배치 1회로 분류
+    def classify_images(self, image_boxes, timings=None):
+        """image_boxes: [(BGR 이미지, yolo_results), ...] -> yolo_results 리스트 (timings: 단계별 시간 기록용 dict)"""
+        # 객체 부분만 자르기 (모든 이미지의 crop을 한 리스트로)
+        crops = []
+        for original_image, yolo_results in image_boxes:
+            for box in yolo_results:
+                # 좌표 추출
+                x1, y1, x2, y2 = box["bbox"]
+                # 이미지 자르기
+                crops.append(original_image[y1:y2, x1:x2])
+
+        # 배치 추론
+        predictions = iter(self.classify_crops(crops, timings=timings))
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for _, yolo_results in image_boxes:
+            for idx, box in enumerate(yolo_results):
+                predicted_class, confidence = next(predictions)
+                # 결과 출력
+                if debug:
+                    class_name = self.recycling_classes[predicted_class]["category"]
+                    logger.debug("객체 %d / %d ResNet18 분류: %s (클래스 %d), 신뢰도 %.3f", idx + 1, len(yolo_results), class_name, predicted_class, confidence)
 
-    # 객체 처리 함수
-    def process_object(self, img_path, fast_mode=False):
-        print(f"이미지 처리 시작: {img_path} (고속모드: {fast_mode})")
+                # YOLO결과 + ResNet18 결과
+                box["resnet_class"] = predicted_class
+                box["resnet_confidence"] = confidence
 
-        # 원본 이미지 로드 및 확인
-        original_image = cv.imread(img_path)
-        if original_image is None:
-            print("이미지를 로드할 수 없습니다!")
-            return []
+        return [yolo_results for _, yolo_results in image_boxes]
 
-        # YOLO 객체 검출 (필터링 비활성화하여 모든 객체 탐지)
+    # 모드별 YOLO 파라미터
+    @staticmethod
+    def yolo_params(fast_mode):
         # 실시간 모드: imgsz=640, conf=0.3 (빠르고 확실한 객체만)
         # 일반 업로드: imgsz=1280, conf=0.15 (고품질, 더 많은 객체)
         imgsz = 640 if fast_mode else 1280
         conf = 0.3 if fast_mode else 0.15
-        yolo_results = self.yolo.detect_objects(img_path, filter_recyclables=False, imgsz=imgsz, conf=conf)
-        print(f"YOLO 검출 완료: {len(yolo_results)}개 객체")
-
-        # 객체 부분만 자르기
-        for idx, box in enumerate(yolo_results):
-            print(f"\n객체 {idx+1} / {len(yolo_results)} 처리 중...")
-            # 좌표 추출
-            x1, y1, x2, y2 = box["bbox"]
-            # 이미지 자르기
-            cropped_img = original_image[y1:y2, x1:x2]
-            # 저장해서 확인
-            # cv.imwrite("crop_test_image.jpg", cropped_img)
-
-            # BGR -> RGB 변환
-            cropped_rgb = cv.cvtColor(cropped_img, cv.COLOR_BGR2RGB)
-            # PIL 포맷으로 변환
-            pil_img = Image.fromarray(cropped_rgb)
-            # transform 적용 (tensor로 변환)
-            input_tensor = self.transform(pil_img)
-            # 배치 차원 추가
-            input_batch = input_tensor.unsqueeze(0)
-            # 디바이스로 이동
-            device = next(self.resnet.parameters()).device
-            input_batch = input_batch.to(device)
-
-            # 모델 추론
-            self.resnet.eval() # 평가 모드
-
-            with torch.no_grad():
-                outputs = self.resnet(input_batch)
-                # 확률로 변환
-                prob = torch.nn.functional.softmax(outputs[0], dim=0)
-                # 가장 높은 확률의 클래스
-                predicted_class = torch.argmax(outputs[0]).item()
-                # 그 클래스의 신뢰도
-                confidence = prob[predicted_class].item()
+        return imgsz, conf
 
-                # 결과 출력
-                class_name = self.recycling_classes[predicted_class]["category"]
-                print(f"ResNet18 분류: {class_name} (클래스 {predicted_class}), 신뢰도 {confidence:.3f}")
+    # 객체 처리 함수 (img_path 또는 이미 디코딩된 BGR numpy 배열)
+    def process_object(self, img_path, fast_mode=False, track_key=None):
+        if isinstance(img_path, np.ndarray):
+            logger.debug("이미지 처리 시작: 메모리 이미지 %s (고속모드: %s)", img_path.shape, fast_mode)
+            original_image = img_path
+        else:
+            logger.debug("이미지 처리 시작: %s (고속모드: %s)", img_path, fast_mode)
+            # 원본 이미지 로드
+            original_image = cv.imread(img_path)
 
-                # YOLO결과 + ResNet18 결과
-                box["resnet_class"] = predicted_class
-                box["resnet_confidence"] = confidence
+        # 이미지 확인
+        if original_image is None:
+            logger.warning("이미지를 로드할 수 없습니다: %s", img_path if isinstance(img_path, str) else "메모리 이미지")
+            return []
+
+        return self.process_objects_batch([original_image], fast_mode=fast_mode, track_keys=[track_key])[0]
+
+    # 여러 이미지(BGR numpy 배열)를 YOLO 배치 1회 + ResNet 배치 1회로 처리
+    def process_objects_batch(self, images, fast_mode=False, track_keys=None, timings=None):
+        """이미지별 yolo_results 리스트를 입력 순서대로 반환
+        (track_keys: 이미지별 추적 세션, 없으면 None / timings: 단계별 소요 시간(초)을 누적할 dict)"""
+        if not images:
+            return []
+        logger.debug("배치 처리 시작: 이미지 %d장 (고속모드: %s)", len(images), fast_mode)
+
+        # YOLO 객체 검출 (필터링 비활성화하여 모든 객체 탐지)
+        imgsz, conf = self.yolo_params(fast_mode)
+        # 디코딩된 배열을 그대로 전달 (YOLO가 파일을 다시 읽지 않도록)
+        with stage_timer(timings, "yolo"):
+            if len(images) == 1:
+                batch_results = [self.yolo.detect_objects(images[0], filter_recyclables=False, imgsz=imgsz, conf=conf)]
+            else:
+                batch_results = self.yolo.detect_objects_batch(images, filter_recyclables=False, imgsz=imgsz, conf=conf)
+        logger.debug("YOLO 검출 완료: %d개 객체", sum(len(r) for r in batch_results))
+
+        # 분류할 crop 수 제한 (p99 지연 상한)
+        if self.crop_filter is not None:
+            with stage_timer(timings, "crop_filter"):
+                filtered_results = []
+                for image, yolo_results in zip(images, batch_results):
+                    filtered, counts = self.crop_filter(yolo_results, image.shape)
+                    filtered_results.append(filtered)
+                    if counts["kept"] != counts["input"]:
+                        logger.debug("crop 필터: %s", counts)
+            batch_results = filtered_results
+
+        # 추적 중인 객체는 이전 분류 결과 재사용, 새 객체만 분류 대상
+        track_keys = track_keys or [None] * len(images)
+        trackers = [self.trackers.get(key) if self.trackers is not None and key is not None else None for key in track_keys]
+        to_classify = [
+            tracker.match(yolo_results) if tracker is not None else yolo_results
+            for tracker, yolo_results in zip(trackers, batch_results)
+        ]
+        if any(tracker is not None for tracker in trackers):
+            logger.debug("추적 재사용: %d개, 새로 분류: %d개", sum(len(r) for r in batch_results) - sum(len(r) for r in to_classify), sum(len(r) for r in to_classify))
+
+        # 모든 이미지의 crop을 한 번에 분류 (forward 1회)
+        self.classify_images(list(zip(images, to_classify)), timings=timings)
+        for tracker, boxes in zip(trackers, to_classify):
+            if tracker is not None:
+                tracker.record(boxes)
+
+        return batch_results
 
-        return yolo_results
-    
     # API용 정보 응답 함수
     def format_recycling_response(self, yolo_results, img_path=""):
         # ResNet 분류 결과를 담을 리스트 생성
@@ -238,6 +298,9 @@ class YOLOResNetPipeline:
                         "confidence": object["resnet_confidence"]
                     }
                 }
+                # 실시간 추적 ID (프론트엔드 오버레이 깜빡임 방지)
+                if "track_id" in object:
+                    item["track_id"] = object["track_id"]
                 recycling_items.append(item)
             # 분류 실패시 피드백 요청
             else:
@@ -250,7 +313,7 @@ class YOLOResNetPipeline:
                     "status": "classification_failed",
                     "feedback_request": {
                         "message": "이 객체의 재활용 분류를 도와주세요!",
-                        "options": ["캔", "유리", "종이", "플라스틱", "스티로폼", "비닐"]
+                        "options": FEEDBACK_OPTIONS
                     }
                 }
                 unclassified_items.append(unclassified_item)
@@ -270,7 +333,31 @@ class YOLOResNetPipeline:
             response["summary"] = f"총 {len(recycling_items)}개의 재활용품이 모두 분류되었습니다!"
         return response
 
+    # 실시간용 간결한 응답 (배출 방법 등 정적 정보 제외, 클래스 ID만 전달)
+    def format_compact_response(self, yolo_results):
+        items = []
+        for idx, object in enumerate(yolo_results):
+            if "resnet_class" in object:
+                item = {
+                    "item_id": idx + 1,
+                    "bbox": object["bbox"],
+                    "detection_confidence": round(object["confidence"], 4),
+                    "class_id": object["resnet_class"],
+                    "confidence": round(object["resnet_confidence"], 4)
+                }
+                if "track_id" in object:
+                    item["track_id"] = object["track_id"]
+                items.append(item)
+        return {
+            "status": "success",
+            "total_items": len(yolo_results),
+            "classified_items": len(items),
+            "unclassified_items": len(yolo_results) - len(items),
+            "items": items
+        }
+
 # =============테스트 실행=============
+# (단계별 성능 측정은 합성 이미지 벤치마크 사용: python -m training.benchmark, python -m app.benchmark)
 # if __name__ == "__main__":
 #     pipeline = YOLOResNetPipeline()
 #     # 테스트할 이미지 파일들 (외장하드)
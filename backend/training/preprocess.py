@@ -0,0 +1,58 @@
+# crop 배치 전처리 (crop별 Tensor 변환 / 정규화 없이 uint8 버퍼 + 배치 텐서 연산)
+# test_transform (Resize(224) -> ToTensor -> Normalize) 과 같은 결과를 배치 단위로 생성
+# (resize는 test_transform과 같은 PIL bilinear 사용 -> 학습 때와 같은 입력, tests/test_preprocess.py)
+
+import os
+import threading
+import cv2 as cv
+import numpy as np
+import torch
+from PIL import Image
+
+# crop 전처리 방식 ("pil": test_transform 그대로, "vectorized": crop별 PIL bilinear resize를 재사용 버퍼에 모은 뒤 정규화만 배치 텐서 연산)
+PREPROCESS_MODE = os.getenv("PREPROCESS_MODE", "pil")
+# 배치 버퍼를 channels-last 메모리 형식으로 생성
+PREPROCESS_CHANNELS_LAST = os.getenv("PREPROCESS_CHANNELS_LAST", "0") == "1"
+
+# test_transform의 Normalize 값
+IMAGENET_MEAN = [0.485, 0.456, 0.406]
+IMAGENET_STD = [0.229, 0.224, 0.225]
+
+class BatchPreprocessor:
+    """BGR crop 리스트 -> 정규화된 (N, 3, size, size) float 텐서"""
+
+    def __init__(self, size=224, channels_last=PREPROCESS_CHANNELS_LAST):
+        self.size = size
+        self.channels_last = channels_last
+        # ToTensor(/255) + Normalize를 한 번의 (x - mean*255) / (std*255)로 계산
+        self.mean = torch.tensor(IMAGENET_MEAN).view(1, 3, 1, 1) * 255
+        self.std = torch.tensor(IMAGENET_STD).view(1, 3, 1, 1) * 255
+        # 워커 스레드별 버퍼 (배치 크기가 커질 때만 다시 할당)
+        self._local = threading.local()
+
+    # 스레드별 재사용 버퍼 (uint8 HWC, float NCHW)
+    def _buffers(self, count):
+        local = self._local
+        if getattr(local, "capacity", 0) < count:
+            local.capacity = count
+            local.uint8 = np.empty((count, self.size, self.size, 3), dtype=np.uint8)
+            memory_format = torch.channels_last if self.channels_last else torch.contiguous_format
+            local.float = torch.empty((count, 3, self.size, self.size), dtype=torch.float32).contiguous(memory_format=memory_format)
+        return local.uint8, local.float
+
+    # crop 하나를 RGB size x size uint8로 (transforms.Resize와 같은 PIL bilinear)
+    def _resize(self, crop, out):
+        rgb = cv.cvtColor(crop, cv.COLOR_BGR2RGB)
+        out[...] = np.asarray(Image.fromarray(rgb).resize((self.size, self.size), Image.BILINEAR))
+
+    def __call__(self, crops):
+        count = len(crops)
+        uint8_buffer, float_buffer = self._buffers(max(1, count))
+        for idx, crop in enumerate(crops):
+            self._resize(crop, uint8_buffer[idx])
+
+        # HWC uint8 -> NCHW float, 정규화는 배치 전체에 한 번
+        batch = float_buffer[:count]
+        batch.copy_(torch.from_numpy(uint8_buffer[:count]).permute(0, 3, 1, 2))
+        batch.sub_(self.mean).div_(self.std)
+        return batch
@@ -0,0 +1,132 @@
+# ResNet18 INT8 양자화 (dynamic / static PTQ) 및 정확도·속도 비교 리포트
+#
+# 실행: python -m training.quantize --data D:/ml_data/resnet
+#   - {data}/valid : static 양자화 calibration 데이터
+#   - {data}/test  : fp32 / INT8 모델 클래스별 정확도 비교 데이터
+# 결과: models/model_v4_int8_dynamic.pt, models/model_v4_int8_static.pt (TorchScript)
+#       models/quantization_report.json
+# 서버 적용: RESNET_QUANTIZATION=dynamic 또는 static
+
+import argparse
+import copy
+import json
+import os
+import time
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader
+from torchvision import datasets
+from torch.ao.quantization import quantize_dynamic, get_default_qconfig_mapping
+from torch.ao.quantization.quantize_fx import prepare_fx, convert_fx
+from training.engine import models_dir, quantized_model_path, quantized_backend
+from training.transforms import test_transform
+from training.pipeline import load_trained_model
+
+# Linear 레이어만 INT8 dynamic 양자화 (calibration 불필요)
+def dynamic_quantize(model):
+    return quantize_dynamic(copy.deepcopy(model), {nn.Linear}, dtype=torch.qint8)
+
+# Conv/Linear 전체 static 양자화 (test_transform 적용 데이터로 calibration)
+def static_quantize(model, calib_loader, num_batches=10):
+    backend = quantized_backend()
+    torch.backends.quantized.engine = backend
+    example_inputs = (torch.randn(1, 3, 224, 224),)
+    prepared = prepare_fx(copy.deepcopy(model), get_default_qconfig_mapping(backend), example_inputs)
+
+    # calibration: activation 범위 수집
+    with torch.no_grad():
+        for batch_idx, (data, _) in enumerate(calib_loader):
+            if batch_idx >= num_batches:
+                break
+            prepared(data)
+
+    return convert_fx(prepared)
+
+# TorchScript로 저장 (양자화 모델은 state_dict만으로 복원이 번거로움)
+def save_scripted(model, path):
+    example = torch.randn(1, 3, 224, 224)
+    with torch.no_grad():
+        scripted = torch.jit.freeze(torch.jit.trace(model, example).eval())
+    torch.jit.save(scripted, path)
+    print(f"저장 완료: {path}")
+
+# 클래스별 정확도
+def evaluate(model, data_loader, num_classes=7):
+    correct = [0] * num_classes
+    total = [0] * num_classes
+    with torch.no_grad():
+        for data, target in data_loader:
+            predictions = torch.argmax(model(data), dim=1)
+            for label, prediction in zip(target.tolist(), predictions.tolist()):
+                total[label] += 1
+                correct[label] += int(label == prediction)
+
+    per_class = {
+        class_name: round(correct[idx] / total[idx], 4) if total[idx] else None
+        for idx, class_name in enumerate(data_loader.dataset.classes)
+    }
+    overall = sum(correct) / max(1, sum(total))
+    return round(overall, 4), per_class
+
+# 처리량 측정 (crops/sec)
+def measure_throughput(model, batch_size, iterations=20, warmup=3):
+    inputs = torch.randn(batch_size, 3, 224, 224)
+    with torch.no_grad():
+        for _ in range(warmup):
+            model(inputs)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            model(inputs)
+        elapsed = time.perf_counter() - start
+    return round(batch_size * iterations / elapsed, 1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ResNet18 INT8 양자화 및 리포트")
+    parser.add_argument("--data", default="D:/ml_data/resnet", help="valid/test 폴더가 있는 데이터 경로")
+    parser.add_argument("--calib-batches", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    # 데이터 로더 (검증/테스트용 transform)
+    calib_dataset = datasets.ImageFolder(f"{args.data}/valid", transform=test_transform)
+    test_dataset = datasets.ImageFolder(f"{args.data}/test", transform=test_transform)
+    calib_loader = DataLoader(calib_dataset, batch_size=args.batch_size, shuffle=True, num_workers=0)
+    test_loader = DataLoader(test_dataset, batch_size=args.batch_size, shuffle=False, num_workers=0)
+
+    # fp32 기준 모델 (양자화 모델은 CPU 전용이므로 CPU에서 비교)
+    fp32_model = load_trained_model().to("cpu").eval()
+
+    print("dynamic 양자화 중...")
+    dynamic_model = dynamic_quantize(fp32_model)
+    save_scripted(dynamic_model, quantized_model_path("dynamic"))
+
+    print(f"static 양자화 calibration 중... ({args.calib_batches} 배치)")
+    static_model = static_quantize(fp32_model, calib_loader, num_batches=args.calib_batches)
+    save_scripted(static_model, quantized_model_path("static"))
+
+    # 리포트 생성
+    report = {}
+    for name, model in [("fp32", fp32_model), ("int8_dynamic", dynamic_model), ("int8_static", static_model)]:
+        print(f"\n[{name}] 평가 중...")
+        accuracy, per_class = evaluate(model, test_loader)
+        report[name] = {
+            "accuracy": accuracy,
+            "per_class_accuracy": per_class,
+            "crops_per_sec_batch1": measure_throughput(model, 1),
+            f"crops_per_sec_batch{args.batch_size}": measure_throughput(model, args.batch_size)
+        }
+        print(f"정확도: {accuracy:.4f}, 처리량: {report[name]}")
+
+    # fp32 대비 정확도 차이
+    for name in ("int8_dynamic", "int8_static"):
+        report[name]["accuracy_delta"] = round(report[name]["accuracy"] - report["fp32"]["accuracy"], 4)
+        report[name]["per_class_delta"] = {
+            class_name: round(acc - report["fp32"]["per_class_accuracy"][class_name], 4)
+            if acc is not None else None
+            for class_name, acc in report[name]["per_class_accuracy"].items()
+        }
+
+    report_path = os.path.join(models_dir, "quantization_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n리포트 저장: {report_path}")
@@ -0,0 +1,137 @@
+# 재활용 분류 정적 정보 (카테고리 / 배출 방법)
+# torch 없이 import 가능 (카탈로그 API, 파이프라인 공용)
+
+import hashlib
+import json
+
+# 플라스틱 배출 방법 (불투명 플라스틱 / 투명 페트 공용)
+PLASTIC_METHOD = """<b>✅ 배출 방법</b><br/><br/>
+
+1. 내용물을 완전히 비우고 물로 깨끗이 헹구기<br/>
+2. 라벨·스티커 완전히 제거<br/>
+3. 뚜껑, 펌프, 손잡이 등 다른 재질 분리<br/>
+4. 플라스틱 전용 수거함에 배출<br/><br/>
+
+<b>⚠️ 투명 페트병 주의</b><br/><br/>
+• 무색 투명한 페트병(생수병·음료수병)은 투명 페트병 전용 수거함에 따로 배출<br/>
+• 전용 수거함이 없으면 일반 플라스틱 수거함에 배출<br/><br/>
+
+<b>❌ 재활용 불가 (일반쓰레기)</b><br/><br/>
+• PVC, 실리콘, 고무, 합성가죽<br/>
+• 칫솔, 볼펜, 장난감 (작고 복합 재질)<br/>
+• 전화기, 키보드 (전자부품 포함)<br/>
+• 옷걸이 (철심 포함)<br/>
+• 심하게 오염되어 세척 불가능한 용기"""
+
+# 재활용 분류 매핑 (7클래스)
+RECYCLING_CLASSES = {
+    0: {"category": "캔", "item_type": "캔류", "method": """<b>✅ 배출 방법</b><br/><br/>
+
+1. 내용물을 완전히 비우고 물로 헹구기<br/>
+2. 겉면의 종이 라벨이나 비닐 스티커 제거<br/>
+3. 가능하면 납작하게 찌그러뜨려 부피 줄이기<br/>
+4. 플라스틱 뚜껑은 분리해서 플라스틱류로 배출<br/>
+5. 캔 전용 수거함 또는 재활용품 수거함에 배출<br/><br/>
+
+<b>⚠️ 주의사항</b><br/><br/>
+• 부탄가스·스프레이는 반드시 내용물을 완전히 방출한 후 배출 (폭발 위험)<br/>
+• 페인트통·오일통은 재활용 불가 (유해물질 포함)"""}, # Can
+
+    1: {"category": "유리", "item_type": "유리병", "method": """<b>✅ 배출 방법</b><br/><br/>
+
+1. 내용물을 완전히 비우고 물로 깨끗이 헹구기<br/>
+2. 금속 또는 플라스틱 뚜껑 분리 (재질별로 따로 배출)<br/>
+3. 라벨은 가능하면 제거<br/>
+4. 유리병 전용 수거함에 배출<br/><br/>
+
+<b>🔄 보증금 병 (소주병·맥주병)</b><br/><br/>
+• 편의점·마트·슈퍼에 반납하면 보증금 환급!<br/>
+• 재사용이 가장 친환경적인 방법입니다<br/><br/>
+
+<b>⚠️ 주의사항</b><br/><br/>
+• 깨진 유리는 신문지 등에 잘 싸서 종량제 봉투에 넣어서 배출<br/>
+• 거울·판유리·식기·도자기는 재활용 불가<br/>
+• 전구·형광등은 별도 수거함에 배출 (주민센터 문의)"""}, # Glass
+
+    2: {"category": "종이", "item_type": "종이류", "method": """<b>✅ 배출 방법</b><br/><br/>
+
+1. 테이프·철심·스프링 등 이물질 완전히 제거<br/>
+2. 비닐 코팅 부분이 있으면 떼어내기<br/>
+3. 끈으로 묶거나 박스에 담아서 배출<br/>
+4. 비 오는 날은 피해서 배출 (젖으면 재활용 불가)<br/><br/>
+
+<b>🥛 종이팩 (우유팩·주스팩)</b><br/><br/>
+• 물로 헹구고 가위로 펼치기<br/>
+• 바짝 말린 후 종이팩 전용 수거함에 배출<br/>
+• ⚠️ 일반 종이와 절대 혼합 금지!<br/><br/>
+
+<b>❌ 재활용 불가 (일반쓰레기)</b><br/><br/>
+• 비닐 코팅된 종이 (광고지·잡지 표지)<br/>
+• 물이나 음식물에 젖은 종이<br/>
+• 기름때가 묻은 종이 (피자박스 기름 부분)<br/>
+• 영수증·택배 송장 (감열지)<br/>
+• 벽지·부직포"""}, # Paper
+
+    3: {"category": "플라스틱", "item_type": "플라스틱", "method": PLASTIC_METHOD}, # Plastic_opaque
+
+    4: {"category": "플라스틱", "item_type": "플라스틱", "method": PLASTIC_METHOD}, # Plastic_pet
+
+    5: {"category": "스티로폼", "item_type": "스티로폼", "method": """<b>✅ 배출 방법</b><br/><br/>
+
+1. 테이프·스티커·라벨 완전히 제거<br/>
+2. 이물질을 완전히 제거하고 깨끗하게 세척<br/>
+3. 스티로폼 전용 수거함 또는 재활용품 수거함에 배출<br/><br/>
+
+<b>⚠️ 주의사항</b><br/><br/>
+• 깨끗한 흰색 스티로폼만 재활용 가능<br/><br/>
+
+<b>❌ 재활용 불가 (일반쓰레기)</b><br/><br/>
+• 음식물이 묻은 스티로폼 (치킨·생선 받침)<br/>
+• 색깔 스티로폼 (파란색·분홍색 등)<br/>
+• 완충재 및 과일 포장재<br/>
+• 코팅·접착제가 많은 것"""}, # Styrofoam
+
+    6: {"category": "비닐", "item_type": "비닐류", "method": """<b>✅ 배출 방법</b><br/><br/>
+
+1. 음식물, 기름기 등 이물질을 간단히 제거<br/>
+2. 비닐 종류나 색상에 상관없이 모두 분리 배출 가능<br/>
+3. 투명 비닐 봉투에 담아 배출<br/>
+4. 접거나 딱지를 만들지 않고 펼쳐서 배출<br/><br/>
+
+<b>❌ 재활용 불가 (일반쓰레기/종량제 봉투)</b><br/><br/>
+• 랩<br/>
+• 노끈<br/>
+• 비닐 코팅된 종이<br/>
+• 기타 재활용이 어려운 품목"""} # Vinyl
+}
+
+# 분류 실패 시 피드백 선택지
+FEEDBACK_OPTIONS = ["캔", "유리", "종이", "플라스틱", "스티로폼", "비닐"]
+
+# 클래스 ID -> 카테고리 + 배출 방법 ID, 배출 방법 ID -> 본문 (같은 본문은 한 번만)
+def recycling_catalog():
+    classes = []
+    methods = {}
+    method_ids = {}
+    for class_id, info in sorted(RECYCLING_CLASSES.items()):
+        if info["method"] not in method_ids:
+            method_id = f"m{len(method_ids)}"
+            method_ids[info["method"]] = method_id
+            methods[method_id] = info["method"]
+        classes.append({
+            "class_id": class_id,
+            "category": info["category"],
+            "item_type": info["item_type"],
+            "method_id": method_ids[info["method"]]
+        })
+    return {
+        "classes": classes,
+        "methods": methods,
+        "feedback_options": FEEDBACK_OPTIONS
+    }
+
+# 카탈로그 JSON 바이트 + strong ETag (내용이 같으면 항상 같은 값)
+def catalog_payload():
+    body = json.dumps(recycling_catalog(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return body, etag
@@ -0,0 +1,16 @@
+# 단계별 소요 시간 측정 (파이프라인 -> 실행기 -> /metrics 로 전달)
+
+import time
+from contextlib import contextmanager
+
+# timings dict에 단계별 소요 시간(초) 누적 (timings가 None이면 측정 생략)
+@contextmanager
+def stage_timer(timings, stage):
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - started
@@ -0,0 +1,115 @@
+# 실시간 모드용 경량 다중 객체 추적기 (IoU 기반 매칭)
+# 이미 분류한 객체가 계속 보이면 ResNet 분류 결과를 재사용
+
+import os
+import threading
+from collections import OrderedDict
+from training.boxes import box_iou
+
+# 추적기 설정 (환경 변수로 조정)
+TRACKER_ENABLED = os.getenv("TRACKER_ENABLED", "1") == "1"
+TRACKER_IOU_THRESHOLD = float(os.getenv("TRACKER_IOU_THRESHOLD", "0.3"))  # 같은 객체로 볼 최소 IoU
+TRACKER_MAX_AGE = int(os.getenv("TRACKER_MAX_AGE", "5"))  # 안 보인 채로 유지할 최대 프레임 수
+TRACKER_RECLASSIFY_EVERY = int(os.getenv("TRACKER_RECLASSIFY_EVERY", "10"))  # 주기적 재분류 간격 (프레임)
+TRACKER_RECLASSIFY_IOU = float(os.getenv("TRACKER_RECLASSIFY_IOU", "0.6"))  # 분류 시점 박스와 IoU가 이보다 낮으면 재분류
+TRACKER_MAX_SESSIONS = int(os.getenv("TRACKER_MAX_SESSIONS", "256"))  # 추적기를 유지할 최대 세션 수
+
+class BoxTracker:
+    """세션 하나의 객체 트랙 관리"""
+
+    def __init__(self, iou_threshold=TRACKER_IOU_THRESHOLD, max_age=TRACKER_MAX_AGE,
+                 reclassify_every=TRACKER_RECLASSIFY_EVERY, reclassify_iou=TRACKER_RECLASSIFY_IOU):
+        self.iou_threshold = iou_threshold
+        self.max_age = max_age
+        self.reclassify_every = reclassify_every
+        self.reclassify_iou = reclassify_iou
+        # track_id -> 트랙 정보
+        self.tracks = {}
+        self.next_id = 1
+        self._lock = threading.Lock()
+
+    # 현재 프레임 박스를 트랙에 매칭하고 track_id 부여
+    def match(self, yolo_results):
+        """분류가 필요한 박스 리스트 반환 (나머지는 캐시된 resnet_class/resnet_confidence 적용)"""
+        with self._lock:
+            # IoU가 높은 쌍부터 탐욕적으로 매칭
+            pairs = []
+            for box_idx, box in enumerate(yolo_results):
+                for track_id, track in self.tracks.items():
+                    iou = box_iou(box["bbox"], track["bbox"])
+                    if iou >= self.iou_threshold:
+                        pairs.append((iou, box_idx, track_id))
+            pairs.sort(reverse=True)
+
+            matched_boxes, matched_tracks = {}, set()
+            for _, box_idx, track_id in pairs:
+                if box_idx in matched_boxes or track_id in matched_tracks:
+                    continue
+                matched_boxes[box_idx] = track_id
+                matched_tracks.add(track_id)
+
+            # 매칭되지 않은 트랙은 나이 증가, 오래된 트랙 제거
+            for track_id in list(self.tracks):
+                if track_id not in matched_tracks:
+                    self.tracks[track_id]["age"] += 1
+                    if self.tracks[track_id]["age"] > self.max_age:
+                        del self.tracks[track_id]
+
+            to_classify = []
+            for box_idx, box in enumerate(yolo_results):
+                track_id = matched_boxes.get(box_idx)
+                if track_id is None:
+                    # 새 객체: 새 트랙 생성
+                    track_id = self.next_id
+                    self.next_id += 1
+                    self.tracks[track_id] = {"bbox": box["bbox"], "age": 0, "since_classified": 0,
+                                             "classified_bbox": None, "resnet_class": None, "resnet_confidence": None}
+                track = self.tracks[track_id]
+                track["bbox"] = box["bbox"]
+                track["age"] = 0
+                track["since_classified"] += 1
+                box["track_id"] = track_id
+
+                # 안정적인 트랙은 분류 결과 재사용
+                stable = (
+                    track["resnet_class"] is not None
+                    and track["since_classified"] < self.reclassify_every
+                    and box_iou(box["bbox"], track["classified_bbox"]) >= self.reclassify_iou
+                )
+                if stable:
+                    box["resnet_class"] = track["resnet_class"]
+                    box["resnet_confidence"] = track["resnet_confidence"]
+                else:
+                    to_classify.append(box)
+
+            return to_classify
+
+    # 새로 분류한 박스의 결과를 트랙에 저장
+    def record(self, classified_boxes):
+        with self._lock:
+            for box in classified_boxes:
+                track = self.tracks.get(box.get("track_id"))
+                if track is None or "resnet_class" not in box:
+                    continue
+                track["resnet_class"] = box["resnet_class"]
+                track["resnet_confidence"] = box["resnet_confidence"]
+                track["classified_bbox"] = box["bbox"]
+                track["since_classified"] = 0
+
+class TrackerRegistry:
+    """세션별 추적기 (LRU로 개수 제한)"""
+
+    def __init__(self, max_sessions=TRACKER_MAX_SESSIONS):
+        self.max_sessions = max(1, max_sessions)
+        self._trackers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_key):
+        with self._lock:
+            tracker = self._trackers.get(session_key)
+            if tracker is None:
+                tracker = self._trackers[session_key] = BoxTracker()
+            self._trackers.move_to_end(session_key)
+            while len(self._trackers) > self.max_sessions:
+                self._trackers.popitem(last=False)
+            return tracker
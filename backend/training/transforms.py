@@ -0,0 +1,37 @@
+# 데이터 전처리 정의 (학습 코드와 추론 서버가 공유)
+# 서버는 이 모듈만 import하므로 학습용 모델/옵티마이저가 생성되지 않음
+
+from torchvision import transforms
+
+# 분류할 클래스 수
+num_classes = 7  # can, glass, paper, plastic_opaque, plastic_pet, styrofoam, vinyl
+
+# 데이터 전처리 - 학습용
+train_transform = transforms.Compose([
+    transforms.Resize((224,224)),
+    # 최소한의 증강만
+    transforms.RandomHorizontalFlip(p=0.3), # 좌우반전 30%
+    transforms.ColorJitter( # 색상만 약하게
+        brightness=0.2, # 밝기 20%
+        contrast=0.2, # 대비 20%
+        saturation=0.2, # 채도 20%
+        hue=0.05 # 색조 5%
+    ),
+    transforms.ToTensor(),
+    transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
+])
+
+# 데이터 전처리 - 검증/테스트용 (augmentation 없음)
+test_transform = transforms.Compose([
+    transforms.Resize((224,224)),
+    transforms.ToTensor(),
+    transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
+])
+
+# 검증/테스트용 전처리를 다른 해상도로 (cascade 저해상도 1단계 등)
+def resized_test_transform(size):
+    return transforms.Compose([
+        transforms.Resize((size,size)),
+        transforms.ToTensor(),
+        transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225])
+    ])
@@ -1,7 +1,11 @@
 # YOLO 구현
 
 from ultralytics import YOLO
+import numpy as np
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 # 모델 로딩을 한번만 하기 위해 클래스로 구현
 class YOLODetector:
@@ -33,60 +37,70 @@ class YOLODetector:
         79,  # toothbrush
         # 필요시 추가 가능
     }
+    # 벡터 마스크용 배열
+    RECYCLABLE_CLASS_IDS = np.array(sorted(RECYCLABLE_CLASSES), dtype=np.int64)
 
-    # 객체 탐지 함수
+    # 객체 탐지 함수 (img_path: 파일 경로 또는 BGR numpy 배열)
     def detect_objects(self, img_path, filter_recyclables=True, imgsz=1280, conf=0.15):
-        # 이미지 로드 (모델 적용 시 리스트 자동 생성)
+        # 이미지 로드 (모델 적용 시 리스트 자동 생성, numpy 배열은 디코딩 없이 사용)
         yolo_results = self.model(
             img_path,
             conf=conf, # 신뢰도 임계값 (기본 0.15, 실시간은 0.3)
             iou=0.5, # 겹치는 박스중 하나만 선택
-            imgsz=imgsz # 입력 이미지 해상도 (기본 1280, 실시간은 640)
+            imgsz=imgsz, # 입력 이미지 해상도 (기본 1280, 실시간은 640)
+            verbose=logger.isEnabledFor(logging.DEBUG) # ultralytics 이미지별 출력은 디버그 로그에서만
         )
-        # 이미지 리스트에서 0번 이미지 로드
-        detection = yolo_results[0]
-        # 객체 정보를 저장할 리스트 생성
-        detected_objects = []
 
         # 구조 확인
-        print(f"타입 확인 : {type(yolo_results)}")
-        print(f"결과 개수 : {len(yolo_results)}")
+        logger.debug("타입 확인 : %s, 결과 개수 : %d", type(yolo_results), len(yolo_results))
+
+        # 이미지 리스트에서 0번 이미지 로드
+        return self.extract_objects(yolo_results[0], filter_recyclables)
 
+    # 여러 이미지를 한 번의 모델 호출로 탐지 (이미지별 결과 리스트 반환)
+    def detect_objects_batch(self, images, filter_recyclables=True, imgsz=1280, conf=0.15):
+        if not images:
+            return []
+        yolo_results = self.model(
+            list(images),
+            conf=conf,
+            iou=0.5,
+            imgsz=imgsz,
+            verbose=logger.isEnabledFor(logging.DEBUG)
+        )
+        logger.debug("배치 결과 개수 : %d", len(yolo_results))
+        return [self.extract_objects(detection, filter_recyclables) for detection in yolo_results]
+
+    # 단일 이미지의 YOLO 결과에서 객체 정보 추출
+    # (좌표/신뢰도/클래스를 박스별이 아닌 배열 단위로 한 번에 CPU로 옮기고 벡터 마스크로 필터링)
+    def extract_objects(self, detection, filter_recyclables=True):
         # 검출된 객체 확인
-        if detection.boxes is None:
-            print("검출된 객체가 없습니다")
-            return detected_objects
-        print(f"검출된 객체 수: {len(detection.boxes)}")
-
-        # 각 검출된 객체에 대해 정보 추출
-        for box in detection.boxes:
-            # 좌표 추출
-            coords = box.xyxy[0].cpu().numpy()
-            x1, y1, x2, y2 = coords
-            # 정확도/신뢰도
-            confidence = box.conf[0].cpu().numpy()
-            # 객체의 클래스 정보
-            class_id = int(box.cls[0].cpu().numpy())
-
-            # 재활용품 필터링
-            if filter_recyclables and class_id not in self.RECYCLABLE_CLASSES:
-                print(f"무시: {detection.names[class_id]} (재활용품 아님)")
-                continue
-
-            # 객체 정보를 딕셔너리로 저장
-            object_info = {
-                "bbox" : [int(x1), int(y1), int(x2), int(y2)],
-                "confidence" : float(confidence),
-                "class_id" : class_id
-            }
-            # 객체 정보를 리스트에 저장
-            detected_objects.append(object_info)
+        boxes = detection.boxes
+        if boxes is None or len(boxes) == 0:
+            logger.debug("검출된 객체가 없습니다")
+            return []
+
+        # 배열 단위로 한 번만 변환
+        xyxy = boxes.xyxy.cpu().numpy()
+        confidence = boxes.conf.cpu().numpy()
+        class_ids = boxes.cls.cpu().numpy().astype(np.int64)
 
-            # 결과 확인용 출력
-            class_name = detection.names[class_id]
-            print(f"검출 : {class_name}, 신뢰도 : {confidence:.2f}")
+        # 재활용품 필터링
+        if filter_recyclables:
+            mask = np.isin(class_ids, self.RECYCLABLE_CLASS_IDS)
+            xyxy, confidence, class_ids = xyxy[mask], confidence[mask], class_ids[mask]
 
-        return detected_objects
+        logger.debug("검출된 객체 수: %d, 사용: %d", len(boxes), len(class_ids))
+
+        # 박스별 dict (tolist로 파이썬 값 변환도 배열 단위로 한 번)
+        return [
+            {
+                "bbox": bbox,
+                "confidence": box_confidence,
+                "class_id": class_id
+            }
+            for bbox, box_confidence, class_id in zip(xyxy.astype(np.int32).tolist(), confidence.tolist(), class_ids.tolist())
+        ]
 
 # YOLO 실행
 # import시 실행 방지
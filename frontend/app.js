@@ -125,6 +125,17 @@ let realtimeStream = null;
 let analysisInterval = null;
 let lastAnalysisTime = 0;
 let analysisSpeed = 1000; // 기본 1초
+let realtimeSessionId = null; // 서버 결과 캐시 범위 (실시간 세션별)
+let realtimeSocket = null; // 실시간 WebSocket 연결 (실패 시 HTTP POST 사용)
+
+// 서버 추적 ID(track_id)별 오버레이 상태 (프레임 사이 박스 깜빡임 방지)
+const realtimeOverlayTracks = new Map(); // track_id -> { item, missed }
+const recordedTrackIds = new Set(); // 히스토리에 이미 추가한 track_id
+const OVERLAY_MAX_MISSED = 2; // 검출이 잠깐 빠져도 박스를 유지할 프레임 수
+const OVERLAY_SMOOTHING = 0.5; // 박스 위치 보간 비율 (1이면 새 위치 그대로)
+
+// 클래스 ID -> 카테고리 / 배출 방법 (GET /catalog, 브라우저가 ETag로 캐시)
+let recyclingCatalog = null;
 
 // 히스토리 변수
 let detectionHistoryList = [];
@@ -310,6 +321,9 @@ inputArea.addEventListener("drop", (event) => {
 // 실시간 모드 시작
 async function startRealtimeMode() {
     try {
+        // 실시간 결과(클래스 ID) 해석용 카탈로그 준비
+        await loadRecyclingCatalog();
+
         // 웹캠 접근 요청
         realtimeStream = await navigator.mediaDevices.getUserMedia({
             video: { facingMode: "environment" }, // 후면 카메라 우선
@@ -350,6 +364,9 @@ async function startRealtimeMode() {
 
         // 상태 변경 및 히스토리 초기화
         isRealtimeActive = true;
+        realtimeSessionId = window.crypto && crypto.randomUUID
+            ? crypto.randomUUID()
+            : `${Date.now()}-${Math.random().toString(36).slice(2)}`;
         detectionHistoryList = [];
         renderHistory();
 
@@ -363,6 +380,9 @@ async function startRealtimeMode() {
             ctx.clearRect(0, 0, overlayCanvas.width, overlayCanvas.height);
         });
 
+        // WebSocket 연결 (프레임 스트리밍)
+        openRealtimeSocket();
+
         // 자동 분석 시작
         startAnalysisLoop();
     } catch (error) {
@@ -385,6 +405,16 @@ function stopRealtimeMode() {
         analysisInterval = null;
     }
 
+    // WebSocket 종료
+    if (realtimeSocket) {
+        realtimeSocket.close();
+        realtimeSocket = null;
+    }
+
+    // 추적 상태 초기화
+    realtimeOverlayTracks.clear();
+    recordedTrackIds.clear();
+
     // UI 복원
     cameraFeedContainer.classList.add("hidden");
     uploadPrompt.classList.remove("hidden");
@@ -439,10 +469,17 @@ async function analyzeCurrentFrame() {
             tempCanvas.toBlob(resolve, "image/jpeg", 0.8)
         );
 
+        // WebSocket이 열려 있으면 프레임만 전송 (결과는 onmessage에서 처리)
+        if (realtimeSocket && realtimeSocket.readyState === WebSocket.OPEN) {
+            realtimeSocket.send(blob);
+            return;
+        }
+
         // FormData 생성
         const formData = new FormData();
         formData.append("file", blob, "frame.jpg");
         formData.append("mode", "realtime"); // 실시간 모드 표시
+        formData.append("session_id", realtimeSessionId); // 결과 캐시 범위
 
         // API 호출
         const response = await fetch(`${API_BASE_URL}/predict`, {
@@ -454,19 +491,8 @@ async function analyzeCurrentFrame() {
             throw new Error(`Server error: ${response.status}`);
         }
 
-        const result = await response.json();
-
-        // 결과 처리
-        if (result.classified_items > 0) {
-            drawDetections(result);
-            addToHistory(result);
-
-            // 실시간 인식은 통계에 저장하지 않음 (정확한 통계를 위해)
-        } else {
-            // 탐지 실패 시 Canvas 초기화
-            const ctx = overlayCanvas.getContext("2d");
-            ctx.clearRect(0, 0, overlayCanvas.width, overlayCanvas.height);
-        }
+        // 실시간 모드는 간결한 응답 (클래스 ID) 수신
+        handleRealtimeResult(expandCompactResult(await response.json()));
     } catch (error) {
         // 타임아웃 에러는 무시 (서버는 정상 작동 중)
         if (!error.message.includes("Failed to fetch")) {
@@ -475,6 +501,139 @@ async function analyzeCurrentFrame() {
     }
 }
 
+// 실시간 결과 처리 (HTTP / WebSocket 공용)
+function handleRealtimeResult(result) {
+    // 히스토리에는 처음 보는 객체만 추가 (같은 객체가 프레임마다 쌓이지 않도록)
+    const newItems = result.recycling_items.filter((item) => {
+        if (item.track_id === undefined) return true;
+        if (recordedTrackIds.has(item.track_id)) return false;
+        recordedTrackIds.add(item.track_id);
+        return true;
+    });
+
+    const stable = stabilizeDetections(result);
+    if (stable.recycling_items.length > 0) {
+        drawDetections(stable);
+    } else {
+        // 탐지 실패 시 Canvas 초기화
+        const ctx = overlayCanvas.getContext("2d");
+        ctx.clearRect(0, 0, overlayCanvas.width, overlayCanvas.height);
+    }
+    if (newItems.length > 0) {
+        addToHistory({ ...result, recycling_items: newItems });
+    }
+    // 실시간 인식은 통계에 저장하지 않음 (정확한 통계를 위해)
+}
+
+// track_id 기준으로 박스 위치를 보간하고, 한두 프레임 놓친 객체는 마지막 박스 유지
+function stabilizeDetections(apiResponse) {
+    const seen = new Set();
+    const items = [];
+    apiResponse.recycling_items.forEach((item) => {
+        if (item.track_id === undefined) {
+            items.push(item);
+            return;
+        }
+        seen.add(item.track_id);
+        const previous = realtimeOverlayTracks.get(item.track_id);
+        const bbox = previous
+            ? item.location.bbox.map((value, i) => {
+                  const last = previous.item.location.bbox[i];
+                  return last + (value - last) * OVERLAY_SMOOTHING;
+              })
+            : item.location.bbox;
+        const stableItem = { ...item, location: { ...item.location, bbox } };
+        realtimeOverlayTracks.set(item.track_id, { item: stableItem, missed: 0 });
+        items.push(stableItem);
+    });
+
+    realtimeOverlayTracks.forEach((track, trackId) => {
+        if (seen.has(trackId)) return;
+        track.missed += 1;
+        if (track.missed > OVERLAY_MAX_MISSED) {
+            realtimeOverlayTracks.delete(trackId);
+        } else {
+            items.push(track.item);
+        }
+    });
+    return { ...apiResponse, recycling_items: items };
+}
+
+// 카테고리 카탈로그 로드 (한 번만, 실패 시 다음 호출에서 재시도)
+async function loadRecyclingCatalog() {
+    if (recyclingCatalog) return recyclingCatalog;
+    try {
+        const response = await fetch(`${API_BASE_URL}/catalog`);
+        if (!response.ok) {
+            throw new Error(`Server error: ${response.status}`);
+        }
+        recyclingCatalog = await response.json();
+    } catch (error) {
+        console.error("카탈로그 로드 실패:", error);
+    }
+    return recyclingCatalog;
+}
+
+// 클래스 ID -> 카탈로그 항목 (카테고리 + 배출 방법)
+function catalogEntry(classId) {
+    const entry = recyclingCatalog && recyclingCatalog.classes[classId];
+    if (!entry) {
+        return { category: "알 수 없음", item_type: "", method: "" };
+    }
+    return { ...entry, method: recyclingCatalog.methods[entry.method_id] };
+}
+
+// 간결한 실시간 결과(클래스 ID)를 일반 응답 형식으로 변환
+function expandCompactResult(compact) {
+    return {
+        ...compact,
+        recycling_items: (compact.items || []).map((item) => {
+            const entry = catalogEntry(item.class_id);
+            return {
+                item_id: item.item_id,
+                track_id: item.track_id, // 서버 추적 ID (프레임 사이 같은 객체)
+                location: {
+                    bbox: item.bbox,
+                    confidence: item.detection_confidence,
+                },
+                recycling_info: {
+                    category: entry.category,
+                    item_type: entry.item_type,
+                    recycling_method: entry.method,
+                    confidence: item.confidence,
+                },
+            };
+        }),
+    };
+}
+
+// 실시간 WebSocket 연결 (서버는 처리 중 들어온 프레임 중 최신 1장만 처리)
+function openRealtimeSocket() {
+    const wsUrl = `${API_BASE_URL.replace(/^http/, "ws")}/predict/ws?session_id=${encodeURIComponent(realtimeSessionId)}`;
+    let socket;
+    try {
+        socket = new WebSocket(wsUrl);
+    } catch (error) {
+        console.error("WebSocket 연결 실패, HTTP로 전환:", error);
+        return;
+    }
+    realtimeSocket = socket;
+
+    socket.onmessage = (event) => {
+        if (!isRealtimeActive) return;
+        const result = JSON.parse(event.data);
+        if (result.status !== "success") return; // 서버가 바쁘면 건너뜀
+        handleRealtimeResult(expandCompactResult(result));
+    };
+
+    // 연결이 끊기면 HTTP POST 방식으로 계속 분석
+    socket.onclose = () => {
+        if (realtimeSocket === socket) {
+            realtimeSocket = null;
+        }
+    };
+}
+
 // 탐지 결과를 Canvas에 그리기
 function drawDetections(apiResponse) {
     const ctx = overlayCanvas.getContext("2d");